@@ -0,0 +1,6 @@
+"""Performance benchmarks for the API backend.
+
+Run from apps/api with the src layout on the path, e.g.:
+
+    PYTHONPATH=src python -m benchmarks.collection_pipeline
+"""
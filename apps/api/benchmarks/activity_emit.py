@@ -0,0 +1,139 @@
+"""Micro-benchmark: activity event emission from collection workers.
+
+Compares the two ways a worker's activity event reaches the run's stream:
+
+    task      the former path: emit_activity() schedules
+              asyncio.create_task(manager.push(...)) per event with the
+              event's to_dict(), and push() takes the manager's
+              asyncio.Lock (get_or_create) every time
+    publish   the current path: the run's stream is resolved once and
+              emit_activity() calls stream.publish() synchronously
+
+Workers emit events the way the eBay phase does (an ActivityEvent built per
+event, yielding to the loop between events).
+Reported per mode: events/sec until every event is in the stream, tasks
+created (via a counting task factory) and tasks per event.
+
+Usage (from apps/api):
+    PYTHONPATH=src python -m benchmarks.activity_emit
+    PYTHONPATH=src python -m benchmarks.activity_emit --workers 50 --events 2000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Any
+
+from app.services.activity_stream import RunActivityStream
+from app.services.parallel_runner import ActivityEvent, create_activity_event
+
+RUN_ID = "bench-run"
+
+
+class LegacyActivityStreamManager:
+    """ActivityStreamManager as it was: one Queue per run, lock on every push."""
+
+    def __init__(self, buffer_size: int = 100):
+        self.buffer_size = buffer_size
+        self._streams: dict[str, asyncio.Queue] = {}
+        self._lock = asyncio.Lock()
+
+    async def get_or_create(self, run_id: str) -> asyncio.Queue:
+        async with self._lock:
+            if run_id not in self._streams:
+                self._streams[run_id] = asyncio.Queue(maxsize=self.buffer_size)
+            return self._streams[run_id]
+
+    async def push(self, run_id: str, event: dict[str, Any]) -> None:
+        queue = await self.get_or_create(run_id)
+        if queue.full():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(event)
+
+
+class TaskCounter:
+    """Task factory that counts every task created on the loop."""
+
+    def __init__(self):
+        self.created = 0
+
+    def __call__(self, loop, coro, **kwargs):
+        self.created += 1
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+
+async def run_mode(mode: str, workers: int, events_per_worker: int) -> dict:
+    loop = asyncio.get_running_loop()
+    counter = TaskCounter()
+
+    if mode == "task":
+        manager = LegacyActivityStreamManager()
+
+        def emit(event: ActivityEvent) -> None:
+            asyncio.create_task(manager.push(RUN_ID, event.to_dict()))
+    else:
+        stream = RunActivityStream(RUN_ID)
+
+        def emit(event: ActivityEvent) -> None:
+            stream.publish(event)
+
+    async def worker(worker_id: int) -> None:
+        for i in range(events_per_worker):
+            emit(create_activity_event(
+                worker_id=worker_id,
+                phase="ebay",
+                action="fetching",
+                product_name=f"Product {i}",
+                api_params={"query": f"Product {i}", "page": 1},
+                attempt=1,
+            ))
+            await asyncio.sleep(0)
+
+    worker_tasks = [asyncio.create_task(worker(w)) for w in range(1, workers + 1)]
+    loop.set_task_factory(counter)
+    started = time.perf_counter()
+    await asyncio.gather(*worker_tasks)
+    # Wait until every scheduled push has run
+    current = asyncio.current_task()
+    pending = [t for t in asyncio.all_tasks() if t is not current]
+    if pending:
+        await asyncio.gather(*pending)
+    seconds = time.perf_counter() - started
+    loop.set_task_factory(None)
+
+    total = workers * events_per_worker
+    return {
+        "mode": mode,
+        "events": total,
+        "events_per_sec": total / seconds,
+        "tasks_created": counter.created,
+        "tasks_per_event": counter.created / total,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark activity event emission")
+    parser.add_argument("--workers", type=int, default=6)
+    parser.add_argument("--events", type=int, default=20_000, help="Events per worker")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs per mode")
+    args = parser.parse_args(argv)
+
+    print(f"{'mode':<8} {'events':>8} {'events/s':>11} {'tasks':>8} {'tasks/event':>12}")
+    for mode in ("task", "publish"):
+        runs = [
+            asyncio.run(run_mode(mode, args.workers, args.events)) for _ in range(args.repeat)
+        ]
+        best = max(runs, key=lambda r: r["events_per_sec"])
+        print(
+            f"{mode:<8} {best['events']:>8} {best['events_per_sec']:>11,.0f} "
+            f"{best['tasks_created']:>8} {best['tasks_per_event']:>12.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
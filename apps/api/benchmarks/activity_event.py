@@ -0,0 +1,152 @@
+"""Micro-benchmark: activity event allocation and serialization cost.
+
+Compares the former ActivityEvent (plain dataclass; to_dict() filters
+__dict__ per event and every SSE connection json.dumps the dict again)
+with the current one (slotted, JSON encoded once at creation and
+the bytes reused by every subscriber and replay):
+
+    legacy    LegacyActivityEvent + to_dict() into the ring, json.dumps per
+              subscriber per event
+    encoded   ActivityEvent (orjson when installed), frames joined from
+              event.encoded
+    stdlib    as encoded, with the stdlib json fallback forced
+
+Reported per mode: creation cost (event built and stored, as the workers
+do), retained memory per buffered event (tracemalloc over a full ring),
+and SSE serialization cost per event for each subscriber count.
+
+Usage (from apps/api):
+    PYTHONPATH=src python -m benchmarks.activity_event
+    PYTHONPATH=src python -m benchmarks.activity_event --events 50000 --subscribers 1 5 20
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from app.services import parallel_runner
+from app.services.parallel_runner import ActivityEvent
+
+
+@dataclass
+class LegacyActivityEvent:
+    """ActivityEvent as it was: a plain dataclass with __dict__."""
+    id: str
+    timestamp: str
+    worker_id: int
+    phase: str
+    action: str
+    category: str | None = None
+    product_name: str | None = None
+    seller_found: str | None = None
+    new_sellers_count: int | None = None
+    error_message: str | None = None
+    url: str | None = None
+    api_params: dict | None = None
+    duration_ms: int | None = None
+    started_at: str | None = None
+    attempt: int | None = None
+    error_type: str | None = None
+    error_stage: str | None = None
+    items_count: int | None = None
+    source_worker_id: int | None = None
+    operation_type: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {k: v for k, v in self.__dict__.items() if v is not None}
+
+
+def event_kwargs(i: int) -> dict[str, Any]:
+    """Fields of a typical eBay fetching event."""
+    return {
+        "id": str(uuid.uuid4()),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "worker_id": i % 6 + 1,
+        "phase": "ebay",
+        "action": "fetching",
+        "category": "Kitchen & Dining",
+        "product_name": f"Stainless Steel Mixing Bowls Set {i}",
+        "api_params": {"query": f"Mixing Bowls Set {i}", "price_min": 18.0, "price_max": 22.0, "page": 1},
+        "attempt": 1,
+    }
+
+
+def create(mode: str, kwargs: list[dict[str, Any]]) -> list:
+    if mode == "legacy":
+        return [LegacyActivityEvent(**k).to_dict() for k in kwargs]
+    return [ActivityEvent(**k) for k in kwargs]
+
+
+def serialize(mode: str, ring: list, subscribers: int) -> int:
+    """SSE payload bytes produced for every subscriber reading the whole ring."""
+    total = 0
+    for _ in range(subscribers):
+        if mode == "legacy":
+            for event in ring:
+                total += len(f"id: x\ndata: {json.dumps(event)}\n\n")
+        else:
+            for event in ring:
+                total += len(b"".join((b"id: x\ndata: ", event.encoded, b"\n\n")))
+    return total
+
+
+def run_mode(mode: str, events: int, subscriber_counts: list[int]) -> dict:
+    parallel_runner.ORJSON_AVAILABLE = mode != "stdlib" and ORJSON_INSTALLED
+    kwargs = [event_kwargs(i) for i in range(events)]
+
+    started = time.perf_counter_ns()
+    ring = create(mode, kwargs)
+    create_ns = (time.perf_counter_ns() - started) / events
+
+    del ring
+    tracemalloc.start()
+    ring = create(mode, kwargs)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    serialize_ns = {}
+    for count in subscriber_counts:
+        started = time.perf_counter_ns()
+        serialize(mode, ring, count)
+        serialize_ns[count] = (time.perf_counter_ns() - started) / events
+    return {
+        "mode": mode,
+        "create_ns": create_ns,
+        "bytes_per_event": retained / events,
+        "serialize_ns": serialize_ns,
+    }
+
+
+ORJSON_INSTALLED = parallel_runner.ORJSON_AVAILABLE
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark activity event encoding")
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1, 5, 20])
+    args = parser.parse_args(argv)
+
+    print(f"orjson installed: {ORJSON_INSTALLED}")
+    header = f"{'mode':<8} {'create ns':>10} {'B/event':>8}"
+    header += "".join(f" {f'{n} sub ns':>10}" for n in args.subscribers)
+    print(header)
+    modes = ["legacy", "encoded"] + (["stdlib"] if ORJSON_INSTALLED else [])
+    try:
+        for mode in modes:
+            r = run_mode(mode, args.events, args.subscribers)
+            line = f"{mode:<8} {r['create_ns']:>10,.0f} {r['bytes_per_event']:>8,.0f}"
+            line += "".join(f" {r['serialize_ns'][n]:>10,.0f}" for n in args.subscribers)
+            print(line)
+    finally:
+        parallel_runner.ORJSON_AVAILABLE = ORJSON_INSTALLED
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
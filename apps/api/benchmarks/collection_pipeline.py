@@ -0,0 +1,254 @@
+"""End-to-end benchmark for the collection pipeline.
+
+Drives CollectionService.run_amazon_collection and run_ebay_seller_search
+with the mock scrapers (SCRAPER_BACKEND=mock) against an in-memory Supabase stand-in, so the
+numbers reflect the runner, db_utils and service code rather than the
+network or the database.
+
+Reported per run size:
+    products/sec     Amazon phase throughput (products fetched and stored)
+    sellers/sec      eBay phase throughput (sellers found and upserted)
+    db_round_trips   total execute() calls, and per product
+    loop_lag_ms      event-loop lag (max / p99), sampled every 10ms
+    peak_mem_mb      peak Python allocation during the run (tracemalloc)
+
+Usage (from apps/api):
+    PYTHONPATH=src python -m benchmarks.collection_pipeline
+    PYTHONPATH=src python -m benchmarks.collection_pipeline --sizes 1000 \\
+        --ebay-latency-ms 50 --error-rate 0.01 --json out.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+from app.logging_config import configure_logging, shutdown_logging
+from app.services.collection import CollectionService
+from app.services.retry import RetryPolicy, reset_circuit_breakers
+from app.services.scrapers.mock import MockAmazonScraper, MockEbayScraper, MockProfile
+
+from .fakes import InMemorySupabase
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+# Retry backoff / circuit open times are multiplied by this in the benchmark
+RETRY_DELAY_SCALE = 0.001
+
+CATEGORIES_PATH = (
+    Path(__file__).resolve().parent.parent / "src" / "app" / "data" / "amazon_categories.json"
+)
+
+
+def load_category_ids() -> list[str]:
+    with open(CATEGORIES_PATH) as f:
+        data = json.load(f)
+    return [cat["id"] for dept in data["departments"] for cat in dept.get("categories", [])]
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes a sleeping coroutine."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected) * 1000)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._sample())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    def summary(self) -> dict:
+        if not self.samples:
+            return {"max": 0.0, "p99": 0.0, "mean": 0.0}
+        ordered = sorted(self.samples)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return {
+            "max": round(ordered[-1], 2),
+            "p99": round(p99, 2),
+            "mean": round(sum(ordered) / len(ordered), 2),
+        }
+
+
+async def run_pipeline(
+    products: int,
+    amazon_profile: MockProfile,
+    ebay_profile: MockProfile,
+    sellers_per_search: int,
+    seller_pool_size: int,
+    track_memory: bool = True,
+) -> dict:
+    """Run both collection phases for roughly `products` products."""
+    category_ids = load_category_ids()
+    category_ids = category_ids[: min(len(category_ids), products)]
+    per_category = math.ceil(products / len(category_ids))
+
+    db = InMemorySupabase()
+    org_id = str(uuid.uuid4())
+    run_id = str(uuid.uuid4())
+    db.seed("collection_runs", [{
+        "id": run_id,
+        "org_id": org_id,
+        "status": "running",
+        "checkpoint": None,
+        "metrics": None,
+    }])
+
+    # Injected errors should exercise the retry path, not turn into real
+    # multi-second backoff sleeps: scale retry delays and circuit open time
+    reset_circuit_breakers(open_seconds=RETRY_DELAY_SCALE * 30)
+    service = CollectionService(
+        db,
+        amazon_scraper=MockAmazonScraper(
+            amazon_profile, products_per_page=per_category, total_pages=1
+        ),
+        ebay_scraper=MockEbayScraper(
+            ebay_profile,
+            sellers_per_page=sellers_per_search,
+            seller_pool_size=seller_pool_size,
+            pages=1,
+        ),
+        retry_policy=RetryPolicy().scaled(RETRY_DELAY_SCALE),
+    )
+
+    monitor = LoopLagMonitor()
+    if track_memory:
+        tracemalloc.start()
+    monitor.start()
+
+    # The pipeline logs per-request progress; keep the cost, drop the output
+    with open(os.devnull, "w") as devnull:
+        configure_logging(stream=devnull)
+        started = time.perf_counter()
+        amazon = await service.run_amazon_collection(run_id, org_id, category_ids)
+        amazon_seconds = time.perf_counter() - started
+        amazon_round_trips = db.round_trips
+
+        started = time.perf_counter()
+        ebay = await service.run_ebay_seller_search(run_id, org_id)
+        ebay_seconds = time.perf_counter() - started
+        shutdown_logging()
+
+    await monitor.stop()
+    peak_bytes = 0
+    if track_memory:
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    products_fetched = amazon.get("products_fetched", 0)
+    sellers_found = ebay.get("sellers_found", 0)
+    return {
+        "products_requested": products,
+        "products_fetched": products_fetched,
+        "amazon_status": amazon.get("status"),
+        "ebay_status": ebay.get("status"),
+        "sellers_found": sellers_found,
+        "sellers_new": ebay.get("sellers_new", 0),
+        "amazon_seconds": round(amazon_seconds, 3),
+        "ebay_seconds": round(ebay_seconds, 3),
+        "products_per_sec": round(products_fetched / amazon_seconds, 1) if amazon_seconds else None,
+        "sellers_per_sec": round(sellers_found / ebay_seconds, 1) if ebay_seconds else None,
+        "db_round_trips": db.round_trips,
+        "db_round_trips_amazon": amazon_round_trips,
+        "db_round_trips_per_product": (
+            round(db.round_trips / products_fetched, 2) if products_fetched else None
+        ),
+        "db_round_trips_by_table": dict(db.round_trips_by_table),
+        "loop_lag_ms": monitor.summary(),
+        "peak_mem_mb": round(peak_bytes / (1024 * 1024), 1) if track_memory else None,
+    }
+
+
+def format_report(results: list[dict]) -> str:
+    header = (
+        f"{'products':>9} {'prod/s':>9} {'sellers/s':>10} {'db rt':>8} "
+        f"{'rt/prod':>8} {'lag max':>8} {'lag p99':>8} {'peak MB':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lag = r["loop_lag_ms"]
+        lines.append(
+            f"{r['products_fetched']:>9} {r['products_per_sec'] or 0:>9.1f} "
+            f"{r['sellers_per_sec'] or 0:>10.1f} {r['db_round_trips']:>8} "
+            f"{r['db_round_trips_per_product'] or 0:>8.2f} {lag['max']:>8.1f} "
+            f"{lag['p99']:>8.1f} {r['peak_mem_mb'] if r['peak_mem_mb'] is not None else '-':>8}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="Run sizes in products (default: 1000 10000 100000)")
+    parser.add_argument("--amazon-latency-ms", type=float, default=0.0)
+    parser.add_argument("--ebay-latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Probability a scraper request times out")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Probability a scraper request is rate limited (5s wait each)")
+    parser.add_argument("--sellers-per-search", type=int, default=20)
+    parser.add_argument("--seller-pool", type=int, default=50_000,
+                        help="Distinct sellers the mock eBay scraper draws from")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-tracemalloc", action="store_true",
+                        help="Skip peak memory tracking (tracemalloc slows the run)")
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    def profile(latency_ms: float, seed: int) -> MockProfile:
+        return MockProfile(
+            latency_ms=latency_ms,
+            latency_dist="uniform",
+            timeout_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            seed=seed,
+        )
+
+    results = []
+    for size in args.sizes:
+        result = asyncio.run(run_pipeline(
+            size,
+            amazon_profile=profile(args.amazon_latency_ms, args.seed),
+            ebay_profile=profile(args.ebay_latency_ms, args.seed + 1),
+            sellers_per_search=args.sellers_per_search,
+            seller_pool_size=args.seller_pool,
+            track_memory=not args.no_tracemalloc,
+        ))
+        results.append(result)
+        print(
+            f"[bench] {size} products: amazon={result['amazon_status']} "
+            f"ebay={result['ebay_status']} in "
+            f"{result['amazon_seconds'] + result['ebay_seconds']:.1f}s",
+            file=sys.stderr,
+        )
+
+    print(format_report(results))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
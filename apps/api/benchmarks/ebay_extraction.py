@@ -0,0 +1,225 @@
+"""Benchmark eBay seller extraction backends on the saved page corpus.
+
+Compares, per page and overall:
+    legacy   the original whole-document, uncompiled-regex extraction
+    regex    ebay_extract regex backend (sliced region, precompiled)
+    html     ebay_extract html.parser backend
+
+Accuracy is measured against each page's .json ground truth: precision and
+recall of usernames, exact feedback percent matches and has_more.
+
+--loop-stall instead measures what extraction costs the event loop, which is
+why the "parse" offload pool uses threads: the longest gap a 1ms ticker sees
+while the largest corpus page (repeated --scale times, as a stand-in for
+bigger rendered pages) is extracted inline, in a thread pool and in a
+process pool. The regex scan itself is short, so the GIL it holds stalls
+the loop less than pickling the page to a worker process does.
+
+Usage (from apps/api):
+    PYTHONPATH=src python -m benchmarks.ebay_extraction
+    PYTHONPATH=src python -m benchmarks.ebay_extraction --corpus DIR --repeat 50
+    PYTHONPATH=src python -m benchmarks.ebay_extraction --loop-stall --scale 1 8
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from app.services.offload import OffloadPool
+from app.services.scrapers.ebay_extract import extract_sellers
+
+from .make_ebay_corpus import CORPUS_DIR
+
+
+def extract_legacy(content: str):
+    """Extraction as it was inlined in OxylabsEbayScraper.search_sellers."""
+    card_matches = re.findall(
+        r's-card__attribute-row"[^>]*>\s*<span[^>]*>([^<]+)</span>\s*<span[^>]*>([^<]*positive[^<]*)</span>',
+        content
+    )
+    if not card_matches:
+        card_matches = re.findall(
+            r'>([a-zA-Z][a-zA-Z0-9_\-\.]{2,24})\s*</span>[^>]{0,200}>(\d{1,3}(?:\.\d)?\s*%\s*positive[^<]*)</span>',
+            content
+        )
+    sellers = []
+    seen: set[str] = set()
+    skip_names = {'myebay', 'savedsellers', 'watchlist', 'purchase-history', 'signin'}
+    for seller_name, feedback_str in card_matches:
+        seller_name = seller_name.strip()
+        if not seller_name or len(seller_name) < 2 or seller_name.lower() in skip_names:
+            continue
+        if seller_name in seen or ' ' in seller_name or seller_name.startswith('$'):
+            continue
+        seen.add(seller_name)
+        percent = None
+        percent_match = re.search(r'(\d+\.?\d*)%', feedback_str)
+        if percent_match:
+            percent = float(percent_match.group(1))
+        sellers.append((seller_name, percent))
+    return sellers, "pagination__next" in content
+
+
+def extract_backend(backend: str):
+    def run(content: str):
+        page = extract_sellers(content, backend=backend)
+        return [(s.username, s.positive_percent) for s in page.sellers], page.has_more
+    return run
+
+
+EXTRACTORS = {
+    "legacy": extract_legacy,
+    "regex": extract_backend("regex"),
+    "html": extract_backend("html"),
+}
+
+
+def load_corpus(directory: Path) -> list[tuple[str, str, dict]]:
+    pages = []
+    for path in sorted(directory.iterdir()):
+        if path.name.endswith(".html.gz"):
+            name = path.name[: -len(".html.gz")]
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                content = f.read()
+        elif path.suffix == ".html":
+            name = path.stem
+            content = path.read_text(encoding="utf-8")
+        else:
+            continue
+        expected_path = directory / f"{name}.json"
+        if not expected_path.exists():
+            continue
+        pages.append((name, content, json.loads(expected_path.read_text())))
+    return pages
+
+
+def score(found: list[tuple[str, float | None]], has_more: bool, expected: dict) -> dict:
+    expected_map = {s["username"]: s["positive_percent"] for s in expected["sellers"]}
+    found_map = dict(found)
+    hits = set(found_map) & set(expected_map)
+    return {
+        "expected": len(expected_map),
+        "found": len(found_map),
+        "correct": len(hits),
+        "percent_correct": sum(1 for u in hits if found_map[u] == expected_map[u]),
+        "has_more_ok": has_more == expected["has_more"],
+    }
+
+
+def time_extractor(func, content: str, repeat: int) -> float:
+    """Best-of-`repeat` time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(content)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+STALL_MODES = ("inline", "thread", "process")
+
+
+async def measure_stall(content: str, mode: str, calls: int) -> tuple[float, float]:
+    """(ms per extraction, longest event loop stall in ms) for one mode."""
+    pool = None if mode == "inline" else OffloadPool(name=f"bench-{mode}", kind=mode, workers=1)
+
+    async def extract(page: str):
+        if pool is None:
+            return extract_sellers(page)
+        return await pool.run(extract_sellers, page)
+
+    await extract("")  # start the worker outside the measurement
+    gaps: list[float] = []
+    stopped = asyncio.Event()
+
+    async def ticker():
+        last = time.perf_counter()
+        while not stopped.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    for _ in range(calls):
+        await extract(content)
+        await asyncio.sleep(0)  # let the ticker run between inline calls
+    elapsed = time.perf_counter() - started
+    stopped.set()
+    await task
+    if pool is not None:
+        pool.shutdown()
+    return elapsed / calls * 1000, max(gaps) * 1000
+
+
+def loop_stall(pages: list[tuple[str, str, dict]], scales: list[int], calls: int) -> None:
+    largest = max((content for _, content, _ in pages), key=len)
+    print(f"{'page KB':>8} " + " ".join(f"{m + ' ms':>11} {m + ' stall':>13}" for m in STALL_MODES))
+    for scale in scales:
+        content = largest * scale
+        row = f"{len(content) / 1024:>8.0f} "
+        for mode in STALL_MODES:
+            per_call, stall = asyncio.run(measure_stall(content, mode, calls))
+            row += f"{per_call:>11.2f} {stall:>13.2f}"
+        print(row)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark eBay seller extraction")
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--backends", nargs="+", default=list(EXTRACTORS), choices=list(EXTRACTORS))
+    parser.add_argument("--loop-stall", action="store_true", help="Measure event loop stalls per offload mode")
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 8])
+    args = parser.parse_args(argv)
+
+    pages = load_corpus(args.corpus)
+    if not pages:
+        print(f"No pages with ground truth in {args.corpus}", file=sys.stderr)
+        return 1
+
+    if args.loop_stall:
+        loop_stall(pages, args.scale, args.repeat)
+        return 0
+
+    totals = {b: {"ms": 0.0, "expected": 0, "found": 0, "correct": 0,
+                  "percent_correct": 0, "has_more_ok": 0} for b in args.backends}
+
+    print(f"{'page':<20} {'KB':>6} " + " ".join(f"{b + ' ms':>10} {b + ' acc':>9}" for b in args.backends))
+    for name, content, expected in pages:
+        row = f"{name:<20} {len(content) / 1024:>6.0f} "
+        for backend in args.backends:
+            func = EXTRACTORS[backend]
+            found, has_more = func(content)
+            result = score(found, has_more, expected)
+            ms = time_extractor(func, content, args.repeat)
+            total = totals[backend]
+            total["ms"] += ms
+            for key in ("expected", "found", "correct", "percent_correct"):
+                total[key] += result[key]
+            total["has_more_ok"] += int(result["has_more_ok"])
+            row += f"{ms:>10.2f} {result['correct']:>4}/{result['expected']:<4}"
+        print(row)
+
+    print()
+    print(f"{'backend':<8} {'total ms':>9} {'precision':>10} {'recall':>7} {'percent':>8} {'has_more':>9}")
+    for backend, t in totals.items():
+        precision = t["correct"] / t["found"] if t["found"] else 1.0
+        recall = t["correct"] / t["expected"] if t["expected"] else 1.0
+        percent = t["percent_correct"] / t["correct"] if t["correct"] else 1.0
+        print(
+            f"{backend:<8} {t['ms']:>9.2f} {precision:>10.3f} {recall:>7.3f} "
+            f"{percent:>8.3f} {t['has_more_ok']:>5}/{len(pages)}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
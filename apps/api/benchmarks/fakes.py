@@ -0,0 +1,197 @@
+"""In-memory stand-ins used by the benchmarks.
+
+InMemorySupabase implements the subset of the supabase-py query builder the
+collection pipeline uses (select/insert/update/delete with eq, neq, in_,
+order, range, limit) against plain Python lists, and counts every
+execute() as one database round trip. Equality lookups on declared index
+columns are served from hash indexes so large runs measure the pipeline,
+not a full-table scan the real database would never do.
+
+Scrapers come from app.services.scrapers.mock (MockAmazonScraper /
+MockEbayScraper), the same backends SCRAPER_BACKEND=mock selects.
+"""
+
+import threading
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+# Columns the pipeline filters on with eq()/in_(); mirrors the real indexes
+DEFAULT_INDEXES = {
+    "collection_runs": ("id",),
+    "collection_items": ("run_id",),
+    "sellers": ("normalized_name", "id", "org_id"),
+}
+
+
+# ============================================================
+# Supabase stand-in
+# ============================================================
+
+
+@dataclass
+class FakeResult:
+    data: list[dict]
+    count: int | None = None
+
+
+class InMemorySupabase:
+    """Thread-safe in-memory replacement for the supabase Client."""
+
+    def __init__(self, indexes: dict[str, tuple[str, ...]] | None = None):
+        self.rows: dict[str, list[dict]] = defaultdict(list)
+        self.index_columns = indexes if indexes is not None else DEFAULT_INDEXES
+        # table -> column -> value -> list of rows
+        self.indexes: dict[str, dict[str, dict[Any, list[dict]]]] = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(list))
+        )
+        self.round_trips = 0
+        self.round_trips_by_table: Counter = Counter()
+        self.lock = threading.RLock()
+
+    def table(self, name: str) -> "FakeQuery":
+        return FakeQuery(self, name)
+
+    def seed(self, table: str, rows: list[dict]) -> list[dict]:
+        """Insert rows without counting a round trip."""
+        with self.lock:
+            return [self._insert_row(table, dict(r)) for r in rows]
+
+    def _insert_row(self, table: str, row: dict) -> dict:
+        row.setdefault("id", str(uuid.uuid4()))
+        row.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+        self.rows[table].append(row)
+        for col in self.index_columns.get(table, ()):
+            self.indexes[table][col][row.get(col)].append(row)
+        return row
+
+    def _reindex(self, table: str, row: dict, old: dict) -> None:
+        for col in self.index_columns.get(table, ()):
+            if old.get(col) != row.get(col):
+                self.indexes[table][col][old.get(col)].remove(row)
+                self.indexes[table][col][row.get(col)].append(row)
+
+    def _delete_row(self, table: str, row: dict) -> None:
+        self.rows[table].remove(row)
+        for col in self.index_columns.get(table, ()):
+            self.indexes[table][col][row.get(col)].remove(row)
+
+
+class FakeQuery:
+    """Chainable query builder mirroring postgrest's SyncRequestBuilder."""
+
+    def __init__(self, db: InMemorySupabase, table: str):
+        self.db = db
+        self.table_name = table
+        self.op = "select"
+        self.columns = "*"
+        self.count_mode: str | None = None
+        self.payload: Any = None
+        self.filters: list[tuple[str, str, Any]] = []
+        self.orders: list[tuple[str, bool]] = []
+        self.offset = 0
+        self.max_rows: int | None = None
+
+    # Operations
+    def select(self, columns: str = "*", count: str | None = None) -> "FakeQuery":
+        self.op, self.columns, self.count_mode = "select", columns, count
+        return self
+
+    def insert(self, rows: dict | list[dict]) -> "FakeQuery":
+        self.op, self.payload = "insert", rows
+        return self
+
+    def update(self, data: dict) -> "FakeQuery":
+        self.op, self.payload = "update", data
+        return self
+
+    def delete(self) -> "FakeQuery":
+        self.op = "delete"
+        return self
+
+    # Filters and modifiers
+    def eq(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append(("eq", column, value))
+        return self
+
+    def neq(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append(("neq", column, value))
+        return self
+
+    def in_(self, column: str, values: list) -> "FakeQuery":
+        self.filters.append(("in", column, set(values)))
+        return self
+
+    def order(self, column: str, desc: bool = False) -> "FakeQuery":
+        self.orders.append((column, desc))
+        return self
+
+    def range(self, start: int, end: int) -> "FakeQuery":
+        self.offset, self.max_rows = start, end - start + 1
+        return self
+
+    def limit(self, count: int) -> "FakeQuery":
+        self.max_rows = count
+        return self
+
+    # Execution
+    def _candidates(self) -> list[dict]:
+        indexed = self.db.index_columns.get(self.table_name, ())
+        for kind, column, value in self.filters:
+            if column in indexed and kind in ("eq", "in"):
+                index = self.db.indexes[self.table_name][column]
+                if kind == "eq":
+                    return list(index.get(value, ()))
+                return [row for v in value for row in index.get(v, ())]
+        return list(self.db.rows[self.table_name])
+
+    def _matches(self, row: dict) -> bool:
+        for kind, column, value in self.filters:
+            current = row.get(column)
+            if kind == "eq" and current != value:
+                return False
+            if kind == "neq" and current == value:
+                return False
+            if kind == "in" and current not in value:
+                return False
+        return True
+
+    def _project(self, row: dict) -> dict:
+        if self.columns.strip() == "*":
+            return dict(row)
+        return {c.strip(): row.get(c.strip()) for c in self.columns.split(",")}
+
+    def execute(self) -> FakeResult:
+        db = self.db
+        with db.lock:
+            db.round_trips += 1
+            db.round_trips_by_table[self.table_name] += 1
+
+            if self.op == "insert":
+                rows = self.payload if isinstance(self.payload, list) else [self.payload]
+                inserted = [db._insert_row(self.table_name, dict(r)) for r in rows]
+                return FakeResult(data=[dict(r) for r in inserted])
+
+            matched = [r for r in self._candidates() if self._matches(r)]
+
+            if self.op == "update":
+                for row in matched:
+                    old = dict(row)
+                    row.update(self.payload)
+                    db._reindex(self.table_name, row, old)
+                return FakeResult(data=[dict(r) for r in matched])
+
+            if self.op == "delete":
+                for row in matched:
+                    db._delete_row(self.table_name, row)
+                return FakeResult(data=[dict(r) for r in matched])
+
+            for column, desc in reversed(self.orders):
+                matched.sort(key=lambda r: (r.get(column) is None, r.get(column) or ""), reverse=desc)
+            total = len(matched)
+            if self.max_rows is not None:
+                matched = matched[self.offset:self.offset + self.max_rows]
+            count = total if self.count_mode else None
+            return FakeResult(data=[self._project(r) for r in matched], count=count)
@@ -0,0 +1,167 @@
+"""Micro-benchmark: logging overhead per scraped item.
+
+Compares, per simulated eBay result page (one "scraped item"), the time the
+calling coroutine spends on log output:
+
+    print      the former print() lines of a search (13 lines), line-buffered,
+               i.e. one write syscall per line as with an unbuffered
+               container stdout
+    queue      the same search's logger calls through configure_logging()'s
+               queue pipeline (3 INFO + 2 DEBUG lines at LOG_LEVEL=INFO)
+    sampled    as queue, with LOG_SAMPLE_PER_SECOND low enough that most
+               per-request lines are dropped at the call site
+
+Output goes to one of two sinks:
+    file       a local file; writes never block (best case for print)
+    pipe       an OS pipe drained by a reader at --pipe-kbps, like a log
+               collector reading container stdout; print() blocks whenever
+               the pipe buffer is full
+
+Reported per mode: mean caller time per item, the worst single-item stall
+(what an event loop would see) and, for the queue modes, the drain time the
+listener thread needed after the last call returned.
+
+Usage (from apps/api):
+    PYTHONPATH=src python -m benchmarks.logging_overhead
+    PYTHONPATH=src python -m benchmarks.logging_overhead --sink pipe --pipe-kbps 512
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from app.logging_config import bind_log_context, configure_logging, shutdown_logging
+
+SELLERS = ["bestoutlet12", "dealdepot7", "shop_direct", "megasupply", "tech4less", "homegoods"]
+
+
+def print_item(i: int, out) -> None:
+    """The print() calls one eBay search page used to make."""
+    query = f"Synthetic product {i} with a reasonably long Amazon title"
+    print(f"\n{'-'*60}", file=out)
+    print(f"[EBAY] Searching: \"{query}\"", file=out)
+    print("[EBAY] Parameters:", file=out)
+    print("       Condition: Brand New", file=out)
+    print("       Free Shipping: True", file=out)
+    print("       US Only: True", file=out)
+    print("       Price Range: $18.00 - $22.00", file=out)
+    print("       Page: 1, Items/Page: 60", file=out)
+    print(f"[EBAY] URL: https://www.ebay.com/sch/i.html?_nkw={i}...", file=out)
+    print("[EBAY] ✓ Found 6 sellers", file=out)
+    print(f"[EBAY] Sellers: {', '.join(SELLERS[:5])} (+1 more)", file=out)
+    print(f"[W{i % 6 + 1}] Searching: {query[:30]} (page 1)", file=out)
+    print(f"[W{i % 6 + 1}] Found 6 sellers for {query[:30]}", file=out)
+
+
+def log_item(i: int, scraper_logger: logging.Logger, collection_logger: logging.Logger) -> None:
+    """The logger calls the same search makes now."""
+    query = f"Synthetic product {i} with a reasonably long Amazon title"
+    collection_logger.info(f"Searching: {query[:30]} (page 1)")
+    scraper_logger.debug(f"Searching \"{query}\": condition=Brand New, page=1")
+    scraper_logger.info(f"eBay search (plain) found 6 sellers for: {query[:50]}...")
+    if scraper_logger.isEnabledFor(logging.DEBUG):
+        scraper_logger.debug(f"Sellers: {', '.join(SELLERS[:5])} (+1 more)")
+    collection_logger.info(f"Found 6 sellers for {query[:30]}")
+
+
+@contextmanager
+def open_sink(kind: str, directory: str, pipe_kbps: int):
+    """Yield a line-buffered text stream for the chosen sink."""
+    if kind == "file":
+        with open(os.path.join(directory, "out.log"), "w", buffering=1, encoding="utf-8") as out:
+            yield out
+        return
+
+    read_fd, write_fd = os.pipe()
+    stop = threading.Event()
+
+    def drain() -> None:
+        chunk = 4096
+        interval = chunk / (pipe_kbps * 1024)
+        while True:
+            data = os.read(read_fd, chunk)
+            if not data:
+                break
+            if not stop.is_set():
+                time.sleep(interval)
+
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+    out = os.fdopen(write_fd, "w", buffering=1, encoding="utf-8")
+    try:
+        yield out
+    finally:
+        stop.set()  # drain the rest at full speed
+        out.close()
+        reader.join()
+        os.close(read_fd)
+
+
+def timed_items(items: int, emit) -> tuple[float, float]:
+    """(total seconds, worst single-item seconds) for emit(i) over all items."""
+    worst = 0.0
+    started = time.perf_counter()
+    for i in range(items):
+        item_started = time.perf_counter()
+        emit(i)
+        worst = max(worst, time.perf_counter() - item_started)
+    return time.perf_counter() - started, worst
+
+
+def bench_print(items: int, out) -> dict:
+    total, worst = timed_items(items, lambda i: print_item(i, out))
+    return {"caller_s": total, "worst_s": worst, "drain_s": 0.0}
+
+
+def bench_queue(items: int, out, sample_per_second: int) -> dict:
+    os.environ["LOG_SAMPLE_PER_SECOND"] = str(sample_per_second)
+    configure_logging(stream=out)
+    scraper_logger = logging.getLogger("app.services.scrapers.oxylabs_ebay")
+    collection_logger = logging.getLogger("app.services.collection")
+    bind_log_context(run_id="bench-run", worker_id=1, phase="ebay")
+
+    total, worst = timed_items(items, lambda i: log_item(i, scraper_logger, collection_logger))
+
+    drain_started = time.perf_counter()
+    shutdown_logging()
+    drained = time.perf_counter() - drain_started
+    return {"caller_s": total, "worst_s": worst, "drain_s": drained}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark logging overhead per scraped item")
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--sample-per-second", type=int, default=20,
+                        help="LOG_SAMPLE_PER_SECOND for the sampled mode")
+    parser.add_argument("--sink", choices=("file", "pipe"), default="pipe")
+    parser.add_argument("--pipe-kbps", type=int, default=1024,
+                        help="reader throughput for the pipe sink")
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        with open_sink(args.sink, directory, args.pipe_kbps) as out:
+            results["print"] = bench_print(args.items, out)
+        with open_sink(args.sink, directory, args.pipe_kbps) as out:
+            results["queue"] = bench_queue(args.items, out, 0)
+        with open_sink(args.sink, directory, args.pipe_kbps) as out:
+            results["sampled"] = bench_queue(args.items, out, args.sample_per_second)
+
+    print(f"{args.items} items, sink={args.sink}")
+    print(f"{'mode':<8} {'us/item':>9} {'worst ms':>9} {'drain s':>8}")
+    for mode, result in results.items():
+        per_item_us = result["caller_s"] / args.items * 1e6
+        print(
+            f"{mode:<8} {per_item_us:>9.2f} {result['worst_s'] * 1000:>9.2f} "
+            f"{result['drain_s']:>8.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
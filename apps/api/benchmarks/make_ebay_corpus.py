@@ -0,0 +1,166 @@
+"""Generate the synthetic eBay result page corpus in benchmarks/corpus/ebay.
+
+Each page is written as <name>.html.gz with a <name>.json ground truth
+({"sellers": [{"username", "positive_percent"}], "has_more"}) computed
+from the generator's own data, not from any extractor.
+
+The pages mimic the structure of rendered eBay search results: large
+inline script/style blocks and page chrome around an srp-results list of
+s-card items, pagination at the bottom. Real pages captured with
+OXYLABS_RECORD_DIR can be added next to these (an .html/.html.gz file
+plus a hand-checked .json) and are picked up by the benchmark.
+
+Usage (from apps/api):
+    PYTHONPATH=src python -m benchmarks.make_ebay_corpus
+"""
+
+import gzip
+import json
+import random
+from pathlib import Path
+
+CORPUS_DIR = Path(__file__).resolve().parent / "corpus" / "ebay"
+
+CHROME_SPANS = ["Sign in", "signin", "watchlist", "myebay", "Daily Deals", "Help & Contact"]
+
+
+def _script_block(rng: random.Random, kb: int) -> str:
+    """Inline script of roughly `kb` kilobytes, like eBay's bundled JS."""
+    lines = []
+    size = 0
+    while size < kb * 1024:
+        name = "".join(rng.choice("abcdefghijklmnop") for _ in range(6))
+        line = (
+            f'window.$mod_{name}=function(e,t){{var n=t("{name}/index"),'
+            f'r=n.render({{state:e,key:"{rng.randrange(10**6)}"}});return r.mount()}};'
+        )
+        lines.append(line)
+        size += len(line)
+    return "<script>" + "\n".join(lines) + "</script>"
+
+
+def _style_block(kb: int) -> str:
+    rule = ".s-card__attribute-row{display:flex;gap:4px}.su-styled-text{font-size:14px}"
+    return "<style>" + rule * (kb * 1024 // len(rule)) + "</style>"
+
+
+def _header() -> str:
+    spans = "".join(f'<li><a href="#"><span>{s}</span></a></li>' for s in CHROME_SPANS)
+    return f'<header id="gh"><ul class="gh-nav">{spans}</ul></header>'
+
+
+def _seller_name(rng: random.Random) -> str:
+    stem = rng.choice(["best", "deal", "shop", "mega", "prime", "usa", "home", "tech"])
+    tail = rng.choice(["store", "outlet", "depot", "-goods", "_direct", ".supply", "4less"])
+    return f"{stem}{tail}{rng.randrange(1000)}"
+
+
+def _card(rng: random.Random, seller: str, percent: float, count: int) -> str:
+    price = f"${rng.uniform(10, 90):.2f}"
+    return (
+        f'<li class="s-card s-card--horizontal" data-listingid="{rng.randrange(10**11)}">'
+        f'<div class="su-card-container"><div class="su-media"><img src="https://i.ebayimg.com/'
+        f'{rng.randrange(10**8)}.webp" alt="item"></div>'
+        f'<div class="s-card__title"><span class="su-styled-text primary default">'
+        f"Brand New Item {rng.randrange(10**5)} Free Shipping</span></div>"
+        f'<div class="s-card__attribute-row"><span class="su-styled-text primary bold large-1">'
+        f"{price}</span></div>"
+        f'<div class="s-card__attribute-row"><span class="su-styled-text secondary large">'
+        f"Free delivery</span></div>"
+        f'<div class="s-card__attribute-row"><span class="su-styled-text secondary large">'
+        f'{seller} </span><span class="su-styled-text secondary large">'
+        f"{percent}% positive ({count})</span></div>"
+        f"</div></li>"
+    )
+
+
+def _legacy_item(rng: random.Random, seller: str, percent: float, count: int) -> str:
+    """Older s-item markup; only the fallback extraction handles it."""
+    return (
+        f'<li class="s-item s-item__pl-on-bottom"><div class="s-item__wrapper">'
+        f'<div class="s-item__info"><span role="heading">Item {rng.randrange(10**5)}</span>'
+        f'<span class="s-item__price">${rng.uniform(10, 90):.2f}</span>'
+        f'<div class="s-item__details"><span class="s-item__seller-info">'
+        f'<span class="s-item__seller-info-text">{seller}</span>'
+        f'<span class="s-item__seller-feedback">{percent}% positive ({count})</span>'
+        f"</span></div></div></div></li>"
+    )
+
+
+def _pagination(has_next: bool) -> str:
+    nxt = '<a class="pagination__next icon-link" href="#">Next</a>' if has_next else ""
+    return f'<nav class="pagination" role="navigation"><ol><li>1</li></ol>{nxt}</nav>'
+
+
+def build_page(
+    rng: random.Random,
+    cards: int,
+    has_next: bool,
+    legacy_markup: bool = False,
+    answer_after: int | None = None,
+    script_kb: int = 900,
+) -> tuple[str, dict]:
+    """Return (html, expected) for one result page."""
+    pool = [_seller_name(rng) for _ in range(max(1, cards * 2 // 3))]
+    items = []
+    expected: list[dict] = []
+    seen: set[str] = set()
+
+    for idx in range(cards):
+        seller = rng.choice(pool)
+        percent = round(rng.uniform(90, 100), 1)
+        count = rng.randrange(5, 50000)
+        render = _legacy_item if legacy_markup else _card
+        if answer_after is not None and idx == answer_after:
+            items.append(
+                '<li class="srp-river-answer srp-river-answer--REWRITE_START">'
+                "<span>Results matching fewer words</span></li>"
+            )
+        items.append(render(rng, seller, percent, count))
+        if seller not in seen:
+            seen.add(seller)
+            expected.append({"username": seller, "positive_percent": percent})
+
+    if not cards:
+        items.append('<li class="srp-save-null-search"><span>No exact matches found</span></li>')
+
+    results_open = (
+        '<ul class="srp-results srp-list clearfix">'
+        if not legacy_markup
+        else '<div id="srp-river-results" class="srp-river-results clearfix"><ul>'
+    )
+    results_close = "</ul>" if not legacy_markup else "</ul></div>"
+
+    html = (
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\">"
+        f"{_style_block(120)}{_script_block(rng, script_kb // 2)}</head><body>"
+        f"{_header()}<main id=\"mainContent\"><div class=\"srp-controls\">"
+        "<span>Sort: Best Match</span></div>"
+        f"{results_open}{''.join(items)}{results_close}"
+        f"{_pagination(has_next)}</main>"
+        f"{_script_block(rng, script_kb // 2)}</body></html>"
+    )
+    return html, {"sellers": expected, "has_more": has_next}
+
+
+PAGES = {
+    "cards_page1": dict(cards=60, has_next=True),
+    "cards_last_page": dict(cards=23, has_next=False),
+    "cards_fewer_words": dict(cards=60, has_next=True, answer_after=12),
+    "legacy_markup": dict(cards=48, has_next=True, legacy_markup=True),
+    "no_results": dict(cards=0, has_next=False, script_kb=600),
+}
+
+
+def main() -> None:
+    CORPUS_DIR.mkdir(parents=True, exist_ok=True)
+    for idx, (name, options) in enumerate(PAGES.items()):
+        html, expected = build_page(random.Random(1000 + idx), **options)
+        with gzip.open(CORPUS_DIR / f"{name}.html.gz", "wt", encoding="utf-8") as f:
+            f.write(html)
+        (CORPUS_DIR / f"{name}.json").write_text(json.dumps(expected, indent=2) + "\n")
+        print(f"{name}: {len(html) / 1024:.0f} KB, {len(expected['sellers'])} sellers")
+
+
+if __name__ == "__main__":
+    main()
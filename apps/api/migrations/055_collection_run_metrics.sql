@@ -0,0 +1,20 @@
+-- Migration: 055_collection_run_metrics.sql
+-- Purpose: Per-run scraping cost and latency accounting
+
+-- Snapshot written by RunMetrics.to_dict() when a collection phase finishes
+-- (completed, paused or cancelled). Merged back in on resume.
+-- Structure: {
+--   "version": 1,
+--   "latency_buckets_ms": [250, 500, ...],
+--   "sources": {"amazon": {"requests", "outcomes", "attempts", "retries",
+--               "rendered", "billable", "response_bytes", "latency_histogram", ...},
+--               "ebay": {...}},
+--   "tasks": {"amazon": {"completed", "failed"}, "ebay": {...}},
+--   "phase_seconds": {"amazon": 12.3, "ebay": 456.7},
+--   "totals": {"requests", "retries", "rendered", "response_bytes", "seconds",
+--              "cost_cents", "sellers_new", "cost_per_new_seller_cents"}
+-- }
+ALTER TABLE collection_runs
+ADD COLUMN IF NOT EXISTS metrics JSONB;
+
+COMMENT ON COLUMN collection_runs.metrics IS 'Per-run Oxylabs request counts, latency histogram, bytes and estimated cost';
@@ -0,0 +1,45 @@
+-- Migration: 056_sync_remark_watermark.sql
+-- Purpose: Remark edits bump their record's updated_at
+--
+-- Sync items carry order_remark / service_remark, but remark writes only
+-- touched the remark tables. Incremental sync (updated_since) missed them,
+-- and so would the sync ETags, which change when their scope's change
+-- counter is bumped by a write to bookkeeping_records (migration 057,
+-- routers/sync.py). Touching the parent record makes both see remark
+-- changes.
+--
+-- SECURITY DEFINER: remark writers (order / service VAs) may not be
+-- allowed to UPDATE bookkeeping_records under RLS.
+
+CREATE OR REPLACE FUNCTION public.touch_record_for_remark()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+  target_record_id UUID;
+BEGIN
+  IF TG_OP = 'DELETE' THEN
+    target_record_id := OLD.record_id;
+  ELSE
+    target_record_id := NEW.record_id;
+  END IF;
+
+  UPDATE public.bookkeeping_records
+  SET updated_at = NOW()
+  WHERE id = target_record_id;
+
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS tr_order_remarks_touch_record ON public.order_remarks;
+CREATE TRIGGER tr_order_remarks_touch_record
+AFTER INSERT OR UPDATE OR DELETE ON public.order_remarks
+FOR EACH ROW EXECUTE FUNCTION public.touch_record_for_remark();
+
+DROP TRIGGER IF EXISTS tr_service_remarks_touch_record ON public.service_remarks;
+CREATE TRIGGER tr_service_remarks_touch_record
+AFTER INSERT OR UPDATE OR DELETE ON public.service_remarks
+FOR EACH ROW EXECUTE FUNCTION public.touch_record_for_remark();
@@ -0,0 +1,160 @@
+-- Migration: 057_sync_change_counters.sql
+-- Purpose: Change counters for the sync ETags
+--
+-- The sync ETag watermark (newest updated_at + row count over the rows the
+-- user can see) had two problems:
+--   - Replacing a visible row with one that has an older updated_at (e.g.
+--     one account assignment swapped for another) left both values
+--     unchanged, so clients got a stale 304.
+--   - count="exact" counted the whole scope on every poll.
+--
+-- Instead, statement-level triggers bump a version per sync scope on every
+-- insert, update and delete:
+--   bookkeeping_records:<account_id>   records of one account
+--   accounts                           all accounts
+--   sellers:<org_id>                   sellers of one org
+-- and a per-user access version whenever what the user may see changes:
+--   access:<user_id>                   memberships, account_assignments,
+--                                      accounts.client_user_id (the old and
+--                                      the new client on reassignment)
+-- get_sync_watermark() reads a scope's version and the caller's access
+-- version in one primary key lookup each; routers/sync.py hashes them into
+-- the ETag. Remark writes touch their record (migration 056), so they bump
+-- the record's account scope too.
+--
+-- Statement-level triggers with transition tables bump each scope once per
+-- statement, not once per row, so bulk imports update one counter row.
+-- The counters are only written by the SECURITY DEFINER trigger function
+-- and read through get_sync_watermark(); RLS without policies keeps direct
+-- access to the table closed.
+
+CREATE TABLE IF NOT EXISTS public.sync_scope_versions (
+  scope TEXT PRIMARY KEY,
+  version BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE public.sync_scope_versions ENABLE ROW LEVEL SECURITY;
+
+-- TG_ARGV[0]: scope prefix; TG_ARGV[1]: column whose value completes the
+-- scope ('' for a table-wide scope)
+CREATE OR REPLACE FUNCTION public.bump_sync_scope_versions()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+  scope_prefix TEXT := TG_ARGV[0];
+  scope_column TEXT := TG_ARGV[1];
+  changed TEXT;
+BEGIN
+  IF scope_column = '' THEN
+    INSERT INTO public.sync_scope_versions AS v (scope, version)
+    VALUES (scope_prefix, 1)
+    ON CONFLICT (scope) DO UPDATE SET version = v.version + 1, updated_at = NOW();
+    RETURN NULL;
+  END IF;
+
+  -- Rows of this statement; an UPDATE also bumps the scope a row left
+  IF TG_OP = 'INSERT' THEN
+    changed := format('SELECT %I FROM new_rows', scope_column);
+  ELSIF TG_OP = 'DELETE' THEN
+    changed := format('SELECT %I FROM old_rows', scope_column);
+  ELSE
+    changed := format(
+      'SELECT %I FROM new_rows UNION SELECT %I FROM old_rows',
+      scope_column, scope_column
+    );
+  END IF;
+
+  -- One upsert per distinct scope, in a stable order to avoid deadlocks
+  EXECUTE format(
+    'INSERT INTO public.sync_scope_versions AS v (scope, version)
+     SELECT DISTINCT %L || '':'' || c.scope_value, 1
+     FROM (%s) AS c(scope_value)
+     WHERE c.scope_value IS NOT NULL
+     ORDER BY 1
+     ON CONFLICT (scope) DO UPDATE SET version = v.version + 1, updated_at = NOW()',
+    scope_prefix, changed
+  );
+  RETURN NULL;
+END;
+$$;
+
+-- Transition tables require one trigger per event; triggers are named per
+-- table and scope prefix (accounts has two)
+DO $$
+DECLARE
+  target RECORD;
+BEGIN
+  FOR target IN
+    SELECT * FROM (VALUES
+      ('bookkeeping_records', 'bookkeeping_records', 'account_id'),
+      ('accounts', 'accounts', ''),
+      ('accounts', 'access', 'client_user_id'),
+      ('sellers', 'sellers', 'org_id'),
+      ('memberships', 'access', 'user_id'),
+      ('account_assignments', 'access', 'user_id')
+    ) AS t(table_name, scope_prefix, scope_column)
+  LOOP
+    EXECUTE format(
+      'DROP TRIGGER IF EXISTS tr_%s_sync_%s_ins ON public.%I',
+      target.table_name, target.scope_prefix, target.table_name
+    );
+    EXECUTE format(
+      'CREATE TRIGGER tr_%s_sync_%s_ins AFTER INSERT ON public.%I
+       REFERENCING NEW TABLE AS new_rows
+       FOR EACH STATEMENT EXECUTE FUNCTION public.bump_sync_scope_versions(%L, %L)',
+      target.table_name, target.scope_prefix, target.table_name,
+      target.scope_prefix, target.scope_column
+    );
+
+    EXECUTE format(
+      'DROP TRIGGER IF EXISTS tr_%s_sync_%s_upd ON public.%I',
+      target.table_name, target.scope_prefix, target.table_name
+    );
+    EXECUTE format(
+      'CREATE TRIGGER tr_%s_sync_%s_upd AFTER UPDATE ON public.%I
+       REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+       FOR EACH STATEMENT EXECUTE FUNCTION public.bump_sync_scope_versions(%L, %L)',
+      target.table_name, target.scope_prefix, target.table_name,
+      target.scope_prefix, target.scope_column
+    );
+
+    EXECUTE format(
+      'DROP TRIGGER IF EXISTS tr_%s_sync_%s_del ON public.%I',
+      target.table_name, target.scope_prefix, target.table_name
+    );
+    EXECUTE format(
+      'CREATE TRIGGER tr_%s_sync_%s_del AFTER DELETE ON public.%I
+       REFERENCING OLD TABLE AS old_rows
+       FOR EACH STATEMENT EXECUTE FUNCTION public.bump_sync_scope_versions(%L, %L)',
+      target.table_name, target.scope_prefix, target.table_name,
+      target.scope_prefix, target.scope_column
+    );
+  END LOOP;
+END $$;
+
+-- A scope's version and the calling user's access version (0 until first
+-- bumped). Exposes counters only, never row data.
+CREATE OR REPLACE FUNCTION public.get_sync_watermark(p_scope TEXT)
+RETURNS TABLE (scope_version BIGINT, access_version BIGINT)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+  SELECT
+    COALESCE((SELECT version FROM public.sync_scope_versions WHERE scope = p_scope), 0),
+    COALESCE(
+      (SELECT version FROM public.sync_scope_versions WHERE scope = 'access:' || auth.uid()::TEXT),
+      0
+    );
+$$;
+
+REVOKE ALL ON FUNCTION public.get_sync_watermark(TEXT) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.get_sync_watermark(TEXT) TO authenticated;
+
+-- Reload PostgREST schema cache
+NOTIFY pgrst, 'reload schema';
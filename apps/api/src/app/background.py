@@ -8,6 +8,8 @@ import logging
 from datetime import datetime, timedelta, timezone
 
 from app.database import get_supabase
+from app.services.activity_stream import get_activity_stream
+from app.services.run_signals import sweep_signals
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +42,30 @@ async def cleanup_stale_replacing_agents():
         logger.error(f"Cleanup job failed: {e}")
 
 
+def sweep_run_state():
+    """
+    Evict in-memory state left behind by collection runs.
+
+    Activity streams and pause/cancel signals are released when a run
+    completes, fails or is cancelled; runs that were paused and abandoned,
+    or whose pipeline died with an unexpected error, are only removed here
+    once their TTL passes (see activity_stream and run_signals).
+    """
+    try:
+        streams = get_activity_stream().sweep()
+        signals = sweep_signals()
+        if streams or signals:
+            logger.info(f"Swept {streams} activity stream(s) and {signals} run signal(s)")
+    except Exception as e:
+        logger.error(f"Run state sweep failed: {e}")
+
+
 async def cleanup_worker():
     """Background worker that runs cleanup periodically."""
     logger.info("Starting background cleanup worker")
     while True:
         await cleanup_stale_replacing_agents()
+        sweep_run_state()
         await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
 
 
@@ -67,6 +88,35 @@ async def collection_startup_recovery():
         logger.error(f"Collection startup recovery failed: {e}")
 
 
+async def bus_startup():
+    """
+    Start the cross-process activity/signal bus (BUS_BACKEND).
+
+    Called during application startup, before runs can be resumed. A
+    misconfigured backend is logged and the process stays in-process only.
+    """
+    try:
+        from app.services.bus import start_bus
+
+        await start_bus()
+    except Exception as e:
+        logger.error(f"Bus startup failed, using in-process bus: {e}")
+
+
+async def bus_shutdown():
+    """
+    Stop the cross-process bus.
+
+    Called during application shutdown.
+    """
+    try:
+        from app.services.bus import stop_bus
+
+        await stop_bus()
+    except Exception as e:
+        logger.error(f"Bus shutdown failed: {e}")
+
+
 async def scheduler_startup():
     """
     Start the APScheduler and load schedules from database.
@@ -99,3 +149,34 @@ def scheduler_shutdown():
         logger.info("APScheduler shutdown")
     except Exception as e:
         logger.error(f"Scheduler shutdown failed: {e}")
+
+
+async def http_clients_shutdown():
+    """
+    Close the pooled Oxylabs HTTP clients.
+
+    Called during application shutdown.
+    """
+    try:
+        from app.services.scrapers.http_pool import close_http_clients
+
+        await close_http_clients()
+    except Exception as e:
+        logger.error(f"HTTP client shutdown failed: {e}")
+
+
+def offload_shutdown():
+    """
+    Stop the CPU offload pools.
+
+    Called during application shutdown.
+    """
+    try:
+        from app.services.offload import offload_stats, shutdown_pools
+
+        stats = offload_stats()
+        if stats:
+            logger.info(f"Offload pool stats at shutdown: {stats}")
+        shutdown_pools()
+    except Exception as e:
+        logger.error(f"Offload pool shutdown failed: {e}")
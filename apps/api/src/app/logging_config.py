@@ -0,0 +1,245 @@
+"""Non-blocking, structured logging for the API process.
+
+Collection workers and scrapers log several lines per request. Writing
+those straight to stdout from the event loop blocks it on every line, so
+configure_logging() installs a queue pipeline instead:
+
+    logger.info(...) -> QueueHandler (context + sampling filters, enqueue)
+                     -> QueueListener thread -> stdout
+
+The calling coroutine only pays for building the record and a queue put;
+formatting and I/O happen on the listener thread.
+
+Structured fields: run_id, worker_id and phase are taken from context
+variables and attached to every record. ParallelCollectionRunner binds
+them for each worker task (bind_log_context), so scraper and collection
+log lines carry them without passing them around.
+
+Configuration (environment):
+    LOG_LEVEL             root level (default INFO)
+    LOG_LEVELS            per-logger levels, e.g.
+                          "app.services.scrapers=WARNING,app.services.run_signals=DEBUG"
+    LOG_FORMAT            "text" (default) or "json" (one object per line)
+    LOG_SAMPLE_PER_SECOND max INFO/DEBUG records per call site per second
+                          (default 20, 0 = no sampling); warnings and
+                          errors are never sampled
+"""
+
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import TextIO
+
+run_id_var: ContextVar[str | None] = ContextVar("log_run_id", default=None)
+worker_id_var: ContextVar[int | None] = ContextVar("log_worker_id", default=None)
+phase_var: ContextVar[str | None] = ContextVar("log_phase", default=None)
+
+# Libraries that log every request at INFO; quiet unless LOG_LEVELS says otherwise
+DEFAULT_LOGGER_LEVELS = {
+    "httpx": "WARNING",
+    "httpcore": "WARNING",
+}
+
+DEFAULT_SAMPLE_PER_SECOND = 20
+
+
+def bind_log_context(
+    run_id: str | None = None,
+    worker_id: int | None = None,
+    phase: str | None = None,
+) -> None:
+    """Attach structured fields to log records from the current task.
+
+    Context variables are copied into tasks when they are created, so call
+    this at the start of a task (e.g. a runner worker); values set here do
+    not leak into the task that spawned it.
+    """
+    if run_id is not None:
+        run_id_var.set(run_id)
+    if worker_id is not None:
+        worker_id_var.set(worker_id)
+    if phase is not None:
+        phase_var.set(phase)
+
+
+# ============================================================
+# Filters
+# ============================================================
+
+
+class ContextFilter(logging.Filter):
+    """Copies run_id / worker_id / phase from context variables onto records.
+
+    Runs on the QueueHandler, i.e. in the logging task's context, before the
+    record crosses to the listener thread.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.run_id = run_id_var.get()
+        record.worker_id = worker_id_var.get()
+        record.phase = phase_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Rate-limits INFO/DEBUG records per call site.
+
+    Each (logger, line) may emit `per_second` records per one-second window;
+    the rest are dropped and counted. The first record of the next window
+    reports how many were suppressed.
+    """
+
+    def __init__(self, per_second: int = DEFAULT_SAMPLE_PER_SECOND):
+        super().__init__()
+        self.per_second = per_second
+        self.suppressed_total = 0
+        # (logger name, line) -> [window start, emitted, suppressed]
+        self._windows: dict[tuple[str, int], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.per_second <= 0 or record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.name, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= 1.0:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.msg} (+{suppressed} similar suppressed)"
+                return True
+            if window[1] < self.per_second:
+                window[1] += 1
+                return True
+            window[2] += 1
+            self.suppressed_total += 1
+            return False
+
+
+# ============================================================
+# Formatters
+# ============================================================
+
+
+class TextFormatter(logging.Formatter):
+    """`time LEVEL logger [run=... w=... phase] message`"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s%(context)s %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = []
+        run_id = getattr(record, "run_id", None)
+        worker_id = getattr(record, "worker_id", None)
+        phase = getattr(record, "phase", None)
+        if run_id:
+            fields.append(f"run={run_id[:8]}")
+        if worker_id is not None:
+            fields.append(f"w={worker_id}")
+        if phase:
+            fields.append(phase)
+        record.context = f" [{' '.join(fields)}]" if fields else ""
+        return super().format(record)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for log shippers."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in ("run_id", "worker_id", "phase"):
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+# ============================================================
+# Setup / teardown
+# ============================================================
+
+
+class _ThreadQueueHandler(QueueHandler):
+    """QueueHandler that hands records to the listener thread unformatted.
+
+    The stock prepare() formats the message and copies the record in the
+    caller so it can be pickled to another process; the listener here is a
+    thread, so that work is left to it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+def parse_logger_levels(spec: str) -> dict[str, str]:
+    """Parse "name=LEVEL,name=LEVEL" (LOG_LEVELS) into a dict."""
+    levels = {}
+    for item in spec.split(","):
+        name, sep, level = item.strip().partition("=")
+        if sep and name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(stream: TextIO | None = None) -> QueueListener:
+    """Install the queue pipeline on the root logger (idempotent)."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        return _listener
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    if os.getenv("LOG_FORMAT", "text").lower() == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(TextFormatter())
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = _ThreadQueueHandler(log_queue)
+    _queue_handler.addFilter(ContextFilter())
+    _queue_handler.addFilter(
+        SamplingFilter(int(os.getenv("LOG_SAMPLE_PER_SECOND", str(DEFAULT_SAMPLE_PER_SECOND))))
+    )
+
+    root = logging.getLogger()
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    root.addHandler(_queue_handler)
+
+    levels = {**DEFAULT_LOGGER_LEVELS, **parse_logger_levels(os.getenv("LOG_LEVELS", ""))}
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()
+    _listener = None
+    _queue_handler = None
@@ -19,9 +19,14 @@ from app.routers import (
     sellers_router,
     sync_router,
 )
+from app.logging_config import configure_logging, shutdown_logging
 from app.background import (
+    bus_shutdown,
+    bus_startup,
     cleanup_worker,
     collection_startup_recovery,
+    http_clients_shutdown,
+    offload_shutdown,
     scheduler_shutdown,
     scheduler_startup,
 )
@@ -34,8 +39,12 @@ async def lifespan(app: FastAPI):
     """Manage application lifecycle - start/stop background tasks."""
     global _cleanup_task
     # Startup
+    configure_logging()
     _cleanup_task = asyncio.create_task(cleanup_worker())
 
+    # Share activity events and run signals with other worker processes
+    await bus_startup()
+
     # Check for interrupted collection runs
     await collection_startup_recovery()
 
@@ -54,6 +63,11 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    await bus_shutdown()
+    await http_clients_shutdown()
+    offload_shutdown()
+    shutdown_logging()
+
 
 app = FastAPI(title="DS-ProSolution API", version="0.1.0", lifespan=lifespan)
 
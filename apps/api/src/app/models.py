@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Generic, Literal, Optional, TypeVar
 from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 
 T = TypeVar("T")
@@ -866,6 +866,8 @@ class CollectionRunResponse(BaseModel):
     paused_at: Optional[str] = None
     created_by: str
     created_at: str
+    # Request/latency/cost accounting (see services/run_metrics.py)
+    metrics: Optional[dict] = None
 
 
 class CollectionRunListResponse(BaseModel):
@@ -1153,6 +1155,7 @@ class CollectionHistoryEntry(BaseModel):
     failed_items: int
     created_by: str
     seller_count_snapshot: Optional[int] = None
+    metrics: Optional[dict] = None
 
 
 class CollectionHistoryResponse(BaseModel):
@@ -1383,6 +1386,34 @@ class RecordSyncResponse(CursorPage[RecordSyncItem]):
     pass
 
 
+# Accounts accepted by one batched records sync request
+SYNC_BATCH_MAX_ACCOUNTS = 200
+
+
+class RecordSyncAccountCursor(BaseModel):
+    """Sync position of one account in a batched records sync."""
+    account_id: str
+    cursor: Optional[str] = None  # next_cursor last returned for this account
+    updated_since: Optional[datetime] = None  # overrides the request-wide value
+
+
+class RecordBatchSyncRequest(BaseModel):
+    """Request body for POST /sync/records/batch."""
+    # None = every account the user can read
+    accounts: Optional[list[RecordSyncAccountCursor]] = Field(
+        None, max_length=SYNC_BATCH_MAX_ACCOUNTS
+    )
+    limit: int = Field(50, ge=1, le=100)  # page size per account
+    status: Optional[BookkeepingStatus] = None
+    updated_since: Optional[datetime] = None
+    include_deleted: bool = False
+
+
+class RecordBatchSyncPage(RecordSyncResponse):
+    """One account's page in a batched records sync (one NDJSON line)."""
+    account_id: str
+
+
 class AccountSyncItem(BaseModel):
     """Account data for sync."""
     id: str
@@ -42,6 +42,7 @@ from app.services.access_code import (
     validate_custom_secret,
     verify_secret,
 )
+from app.services.offload import offload
 
 router = APIRouter(prefix="/access-codes", tags=["access-codes"])
 logger = logging.getLogger(__name__)
@@ -170,7 +171,7 @@ async def generate_access_code(
         )
 
     # Hash the secret
-    hashed_secret = hash_secret(secret)
+    hashed_secret = await offload("hash", hash_secret, secret)
     expires_at = calculate_expiry()
 
     # Delete existing code for this user (one code per user per org)
@@ -260,7 +261,7 @@ async def rotate_access_code(
         secret = generate_secret()
 
     # Hash new secret
-    hashed_secret = hash_secret(secret)
+    hashed_secret = await offload("hash", hash_secret, secret)
     now = datetime.now(timezone.utc)
     expires_at = calculate_expiry()
 
@@ -439,7 +440,7 @@ async def validate_access_code(
         )
 
     # Verify secret (timing-safe via Argon2)
-    if not verify_secret(code_record["hashed_secret"], provided_secret):
+    if not await offload("hash", verify_secret, code_record["hashed_secret"], provided_secret):
         record_failure()
         logger.warning(f"Invalid secret for prefix={prefix}, IP={client_ip}")
         raise HTTPException(
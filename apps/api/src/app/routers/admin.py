@@ -37,6 +37,12 @@ from app.models import (
     UserRole,
 )
 from app.permissions import DEPT_ROLE_PERMISSION_KEYS, FORBIDDEN_DEPT_ROLE_PERMISSIONS
+from app.services.activity_stream import get_activity_stream
+from app.services.bus import get_bus
+from app.services.offload import offload_stats
+from app.services.run_progress import progress_stats
+from app.services.run_signals import signal_stats
+from app.services.scrapers.http_pool import http_pool_stats
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 logger = logging.getLogger(__name__)
@@ -1762,3 +1768,53 @@ async def delete_account_assignment(
     )
 
     return {"status": "deleted"}
+
+
+# ============================================================
+# Runtime stats
+# ============================================================
+
+
+@router.get("/offload/stats")
+async def get_offload_stats(
+    user: dict = Depends(require_permission_key("admin.automation")),
+):
+    """
+    Queue depth, concurrency and timing for the CPU offload pools.
+
+    Pools appear once they have been used since startup.
+    """
+    return {"pools": offload_stats()}
+
+
+@router.get("/http/stats")
+async def get_http_stats(
+    user: dict = Depends(require_permission_key("admin.automation")),
+):
+    """
+    Connection reuse for the pooled Oxylabs HTTP client since startup.
+
+    Requests, how many opened a new connection versus reused one, whether
+    HTTP/2 is available, and the pool settings.
+    """
+    return {"oxylabs": http_pool_stats()}
+
+
+@router.get("/activity/stats")
+async def get_activity_stats(
+    user: dict = Depends(require_permission_key("admin.automation")),
+):
+    """
+    Live collection run state held in memory.
+
+    Activity streams (count, subscribers, buffered events and their
+    encoded bytes, evictions since startup), pause/cancel signals, runs whose
+    progress is served from memory, and the cross-process bus (messages,
+    drops, publish overhead, delivery latency).
+    """
+    return {
+        "activity": get_activity_stream().stats(),
+        "signals": signal_stats(),
+        "progress": progress_stats(),
+        "bus": get_bus().stats(),
+    }
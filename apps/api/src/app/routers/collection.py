@@ -12,11 +12,17 @@ import json
 import logging
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 from app.auth import require_permission_key, require_permission_key_flexible
-from app.services.activity_stream import get_activity_stream
+from app.services.activity_stream import (
+    StreamClosedError,
+    SubscriberLaggedError,
+    collapse_superseded,
+    get_activity_stream,
+)
+from app.services import run_progress
 from app.services.run_signals import signal_run, clear_signal, RunSignal
 from app.database import get_supabase
 from app.models import (
@@ -148,6 +154,7 @@ async def create_run(
         paused_at=run.get("paused_at"),
         created_by=run["created_by"],
         created_at=run["created_at"],
+        metrics=run.get("metrics"),
     )
 
 
@@ -181,6 +188,7 @@ async def list_runs(
                 paused_at=r.get("paused_at"),
                 created_by=r["created_by"],
                 created_at=r["created_at"],
+                metrics=r.get("metrics"),
             )
             for r in runs
         ],
@@ -223,6 +231,7 @@ async def get_collection_history(
                 failed_items=r["failed_items"],
                 created_by=r["created_by"],
                 seller_count_snapshot=r.get("seller_count_snapshot"),
+                metrics=r.get("metrics"),
             )
             for r in runs
         ],
@@ -260,6 +269,7 @@ async def get_run(
         paused_at=run.get("paused_at"),
         created_by=run["created_by"],
         created_at=run["created_at"],
+        metrics=run.get("metrics"),
     )
 
 
@@ -334,7 +344,7 @@ async def execute_run(
                 return
 
             # Brief pause to let UI show Amazon phase at 100% before transitioning
-            print(f"\n[COLLECTION] Transitioning to eBay phase in 3 seconds...")
+            logger.info(f"Collection {run_id}: transitioning to eBay phase in 3 seconds")
             await asyncio.sleep(3)
 
             # Phase 2: eBay seller search
@@ -343,6 +353,7 @@ async def execute_run(
 
         except Exception as e:
             logger.exception(f"Collection pipeline failed for {run_id}: {e}")
+            await service.release_run(run_id)
 
     background_tasks.add_task(run_collection)
 
@@ -400,34 +411,28 @@ async def pause_run(
     Requires admin.automation permission.
     """
     org_id = user["membership"]["org_id"]
-    print(f"\n[PAUSE] Pause requested for run {run_id}")
-
     # First check the current status
     run = await service.get_run(run_id, org_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
 
     current_status = run.get("status")
-    print(f"[PAUSE] Current DB status: {current_status}")
 
     # Already paused - idempotent success, keep signal set
     if current_status == "paused":
-        print(f"[PAUSE] Already paused, ensuring signal is set")
+        logger.info(f"Run {run_id} already paused, ensuring signal is set")
         await signal_run(run_id, RunSignal.PAUSE)  # Ensure signal stays set
         return {"ok": True, "status": "paused", "message": "Already paused"}
 
     # Not running - can't pause
     if current_status != "running":
-        print(f"[PAUSE] Cannot pause - status is {current_status}")
         raise HTTPException(status_code=400, detail=f"Cannot pause run in {current_status} status")
 
     # Signal workers IMMEDIATELY (in-memory, instant)
     await signal_run(run_id, RunSignal.PAUSE)
-    print(f"[PAUSE] Signal set for run {run_id}")
 
     # Then update database status
     result = await service.pause_run(run_id, org_id)
-    print(f"[PAUSE] DB update result: {result}")
 
     if "error" in result:
         # Only clear signal if run not found - otherwise keep it set
@@ -437,7 +442,6 @@ async def pause_run(
         # For other errors (like race condition), keep signal set and return error
         raise HTTPException(status_code=400, detail=result["message"])
 
-    print(f"[PAUSE] Pause complete for run {run_id}")
     return result
 
 
@@ -457,25 +461,21 @@ async def resume_run(
     Requires admin.automation permission.
     """
     org_id = user["membership"]["org_id"]
-    print(f"\n[RESUME] Resume requested for run {run_id}")
-
     # First check DB status
     run = await service.get_run(run_id, org_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
 
     current_status = run.get("status")
-    print(f"[RESUME] Current DB status: {current_status}")
 
     # Already running - idempotent success, just clear signal
     if current_status == "running":
-        print(f"[RESUME] Already running, clearing signal just in case")
+        logger.info(f"Run {run_id} already running, clearing signal just in case")
         await clear_signal(run_id)
         return {"ok": True, "status": "running", "message": "Already running"}
 
     # Not paused - can't resume
     if current_status != "paused":
-        print(f"[RESUME] Cannot resume - status is {current_status}")
         raise HTTPException(
             status_code=400,
             detail=f"Cannot resume run in {current_status} status"
@@ -483,11 +483,9 @@ async def resume_run(
 
     # Clear any pause/cancel signal IMMEDIATELY (in-memory, instant)
     await clear_signal(run_id)
-    print(f"[RESUME] Signal cleared for run {run_id}")
 
     # Update the database status
     result = await service.resume_run(run_id, org_id)
-    print(f"[RESUME] DB update result: {result}")
 
     if "error" in result:
         if result["error"] == "not_found":
@@ -519,7 +517,7 @@ async def resume_run(
                     return
 
                 # Brief pause before transitioning
-                print(f"\n[COLLECTION] Transitioning to eBay phase in 3 seconds...")
+                logger.info(f"Collection {run_id}: transitioning to eBay phase in 3 seconds")
                 await asyncio.sleep(3)
 
                 # Phase 2: eBay seller search
@@ -527,18 +525,17 @@ async def resume_run(
 
             elif phase == "amazon_complete":
                 # Amazon done, start eBay
-                print(f"\n[COLLECTION] Resuming from eBay phase...")
                 await service.run_ebay_seller_search(run_id=run_id, org_id=org_id)
 
             elif phase == "ebay_search":
                 # Resume eBay search
-                print(f"\n[COLLECTION] Resuming eBay search from checkpoint...")
                 await service.run_ebay_seller_search(run_id=run_id, org_id=org_id)
 
             logger.info(f"Collection {run_id} completed after resume")
 
         except Exception as e:
             logger.exception(f"Resumed collection pipeline failed for {run_id}: {e}")
+            await service.release_run(run_id)
 
     background_tasks.add_task(resume_collection)
 
@@ -590,7 +587,10 @@ async def get_run_progress(
     Get detailed progress for a collection run.
 
     Returns hierarchical progress (departments, categories, products, sellers)
-    and real-time worker status.
+    and real-time worker status. Answered from memory, without a database
+    read, while the run's workers execute in this process.
+
+    Prefer /progress/stream over polling this endpoint.
 
     Requires admin.automation permission.
     """
@@ -598,26 +598,125 @@ async def get_run_progress(
 
     try:
         progress = await service.get_enhanced_progress(org_id, run_id)
-        return EnhancedProgress(
-            phase=progress.get("phase", "amazon"),
-            products_found=progress.get("products_found", 0),
-            started_at=progress.get("started_at"),
-            checkpoint=progress.get("checkpoint"),
-            departments_total=progress["departments_total"] or 0,
-            departments_completed=progress["departments_completed"] or 0,
-            categories_total=progress["categories_total"] or 0,
-            categories_completed=progress["categories_completed"] or 0,
-            products_total=progress["products_total"] or 0,
-            products_searched=progress["products_searched"] or 0,
-            sellers_found=progress["sellers_found"] or 0,
-            sellers_new=progress["sellers_new"] or 0,
-            worker_status=[
-                WorkerStatus(**w) for w in (progress["worker_status"] or [])
-            ],
-        )
+        return to_enhanced_progress(progress)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+def to_enhanced_progress(progress: dict) -> EnhancedProgress:
+    return EnhancedProgress(
+        phase=progress.get("phase", "amazon"),
+        products_found=progress.get("products_found", 0),
+        started_at=progress.get("started_at"),
+        checkpoint=progress.get("checkpoint"),
+        departments_total=progress["departments_total"] or 0,
+        departments_completed=progress["departments_completed"] or 0,
+        categories_total=progress["categories_total"] or 0,
+        categories_completed=progress["categories_completed"] or 0,
+        products_total=progress["products_total"] or 0,
+        products_searched=progress["products_searched"] or 0,
+        sellers_found=progress["sellers_found"] or 0,
+        sellers_new=progress["sellers_new"] or 0,
+        worker_status=[
+            WorkerStatus(**w) for w in (progress["worker_status"] or [])
+        ],
+    )
+
+
+# Snapshot reads from collection_runs while the run is not executing here
+PROGRESS_DB_POLL_SECONDS = 2.0
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+@router.get("/runs/{run_id}/progress/stream")
+async def stream_run_progress(
+    run_id: str,
+    interval_ms: int = Query(
+        run_progress.PROGRESS_PUSH_INTERVAL_MS, ge=100, le=10000,
+        description="Minimum time between snapshots",
+    ),
+    user: dict = Depends(require_permission_key_flexible("admin.automation")),
+    service: CollectionService = Depends(get_collection_service),
+):
+    """
+    Stream progress snapshots for a collection run via SSE.
+
+    Each frame's data is the same JSON as GET /progress. While the run's
+    workers execute in this process, snapshots come straight from their
+    shared counters, pushed when they change but at most once per
+    interval_ms (changes in between are coalesced into the next snapshot).
+    Otherwise (run executing in another process, or between phases)
+    collection_runs is read every few seconds and changes are pushed. Once
+    the run has completed, failed or been cancelled the stream sends an
+    `end` event and closes.
+
+    Accepts token via query param or Authorization header.
+    Requires admin.automation permission.
+    """
+    org_id = user["membership"]["org_id"]
+
+    try:
+        initial = await service.get_enhanced_progress(org_id, run_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+    interval = interval_ms / 1000
+
+    async def event_generator():
+        loop = asyncio.get_running_loop()
+        last_frame = to_enhanced_progress(initial).model_dump_json()
+        yield f"data: {last_frame}\n\n"
+        last_sent = loop.time()
+        last_keepalive = last_sent
+        # Local progress and version of the last snapshot taken from it
+        seen: run_progress.RunProgress | None = None
+        seen_version = 0
+        snapshot = initial
+
+        while snapshot.get("status") not in TERMINAL_STATUSES:
+            local = run_progress.get_local_progress(run_id, org_id)
+            fresh = None
+            if local is not None:
+                changed = await local.wait_newer(seen_version if local is seen else 0, timeout=15.0)
+                # Throttle: coalesce changes until the interval has passed
+                await asyncio.sleep(max(0.0, last_sent + interval - loop.time()))
+                if changed and local.released:
+                    # Workers stopped; the final counters are in collection_runs
+                    fresh = await service.get_enhanced_progress(org_id, run_id)
+                elif changed:
+                    seen, seen_version = local, local.version
+                    fresh = local.snapshot()
+            else:
+                await asyncio.sleep(max(interval, PROGRESS_DB_POLL_SECONDS))
+                try:
+                    fresh = await service.get_enhanced_progress(org_id, run_id)
+                except ValueError:
+                    break  # run deleted
+
+            if fresh is not None:
+                snapshot = fresh
+                frame = to_enhanced_progress(snapshot).model_dump_json()
+                if frame != last_frame:
+                    yield f"data: {frame}\n\n"
+                    last_frame = frame
+                    last_sent = last_keepalive = loop.time()
+                    continue
+            if loop.time() - last_keepalive >= 15.0:
+                yield ": keepalive\n\n"
+                last_keepalive = loop.time()
+
+        yield "event: end\ndata: {}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
 
 async def verify_token_for_sse(token: str | None) -> dict:
     """
@@ -700,6 +799,16 @@ async def verify_token_for_sse(token: str | None) -> dict:
 @router.get("/runs/{run_id}/activity")
 async def stream_activity(
     run_id: str,
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+    last_event_id_param: str | None = Query(
+        None, alias="last_event_id", description="Resume point when the header can't be set"
+    ),
+    batch_ms: int = Query(
+        0, ge=0, le=5000, description="Send events as one JSON-array frame per N ms (0 = one frame per event)"
+    ),
+    collapse: bool = Query(
+        False, description="With batch_ms, drop fetching events superseded within a frame"
+    ),
     user: dict = Depends(require_permission_key_flexible("admin.automation")),
     service: CollectionService = Depends(get_collection_service),
 ):
@@ -713,6 +822,17 @@ async def stream_activity(
     - rate_limited: Waiting due to rate limit
     - complete: Phase or run complete
 
+    Each event carries an SSE `id:`; a reconnecting EventSource sends the
+    last one back as Last-Event-ID and the stream resumes right after it
+    (within the run's replay window). Once the run has completed, failed or
+    been cancelled the stream sends an `end` event and closes, so the client
+    stops reconnecting; a finished run gets no new activity stream.
+
+    With batch_ms > 0, events published within each window are sent as a
+    single frame whose data is a JSON array (id: is the last event's);
+    collapse=true also drops per-worker fetching events that a later event
+    in the same frame supersedes.
+
     Accepts token via query param or Authorization header.
     Uses flexible auth for EventSource compatibility.
     Requires admin.automation permission.
@@ -724,12 +844,32 @@ async def stream_activity(
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
 
+    sse_headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",  # Disable nginx buffering
+    }
+
+    if run.get("status") in TERMINAL_STATUSES:
+        # Nothing will be published again; subscribing would create an empty
+        # stream that the reconnecting client waits on until the TTL sweep
+        async def ended():
+            yield "event: end\ndata: {}\n\n"
+
+        return StreamingResponse(ended(), media_type="text/event-stream", headers=sse_headers)
+
+    # Each connection reads the run's broadcast stream with its own cursor,
+    # so several admins watching one run all see every event
     stream_manager = get_activity_stream()
-    queue = await stream_manager.get_or_create(run_id)
+    subscriber = stream_manager.subscribe(
+        run_id, last_event_id=last_event_id or last_event_id_param
+    )
+    stream = subscriber.stream
 
     async def event_generator():
-        """Generate SSE events from activity queue."""
-        # Send initial "connected" event so frontend knows stream is working
+        """Generate SSE events from the run's activity stream."""
+        # Send initial "connected" event so frontend knows stream is working.
+        # It has no id: line, so the client's Last-Event-ID is left as is.
         connected_event = {
             "id": f"connected-{run_id}",
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -739,30 +879,57 @@ async def stream_activity(
         }
         yield f"data: {json.dumps(connected_event)}\n\n"
 
-        while True:
-            try:
-                # Wait for event with timeout for keepalive
-                event = await asyncio.wait_for(queue.get(), timeout=15.0)
-                yield f"data: {json.dumps(event)}\n\n"
-            except asyncio.TimeoutError:
-                # Send keepalive comment
-                yield ": keepalive\n\n"
-            except asyncio.CancelledError:
-                # Client disconnected
-                break
-            except Exception as e:
-                logger.error(f"Activity stream error: {e}")
-                break
+        try:
+            while True:
+                try:
+                    # Wait for events with timeout for keepalive
+                    if batch_ms:
+                        events = await subscriber.get_batch(batch_ms / 1000, timeout=15.0)
+                    else:
+                        events = await subscriber.get(timeout=15.0)
+                except asyncio.CancelledError:
+                    # Client disconnected
+                    break
+                except StreamClosedError as e:
+                    logger.info(f"Closing activity stream: {e}")
+                    # Released because the run finished: tell the client to
+                    # stop. Evicted while still live: ending the response
+                    # makes EventSource reconnect to a fresh stream
+                    current = await service.get_run(run_id, org_id)
+                    if not current or current.get("status") in TERMINAL_STATUSES:
+                        yield "event: end\ndata: {}\n\n"
+                    break
+                except SubscriberLaggedError as e:
+                    # Ending the response makes EventSource reconnect
+                    logger.info(f"Closing activity stream: {e}")
+                    break
+                except Exception as e:
+                    logger.error(f"Activity stream error: {e}")
+                    break
+
+                if not events:
+                    # Send keepalive comment
+                    yield ": keepalive\n\n"
+                    continue
+                # Events carry their JSON already encoded: frames are
+                # assembled from those bytes, nothing is re-serialized
+                if batch_ms:
+                    last_seq = events[-1][0]
+                    if collapse:
+                        events = collapse_superseded(events)
+                    frame = b",".join(event.encoded for _, event in events)
+                    yield b"".join((
+                        f"id: {stream.event_id(last_seq)}\ndata: [".encode(), frame, b"]\n\n",
+                    ))
+                    continue
+                yield b"".join(
+                    b"".join((f"id: {stream.event_id(seq)}\ndata: ".encode(), event.encoded, b"\n\n"))
+                    for seq, event in events
+                )
+        finally:
+            subscriber.close()
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-        },
-    )
+    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=sse_headers)
 
 
 # ============================================================
@@ -25,6 +25,7 @@ from app.services.import_service import (
     validate_import_file,
     validate_rows,
 )
+from app.services.offload import offload
 
 logger = logging.getLogger(__name__)
 
@@ -68,14 +69,18 @@ async def validate_import(
             raise HTTPException(status_code=400, detail="File is empty")
 
         # Parse and get preview
-        preview_df, total_rows = validate_import_file(content, format)
+        preview_df, total_rows = await offload(
+            "import", validate_import_file, content, format
+        )
 
         # Get suggested column mapping
         headers = preview_df.columns.tolist()
         suggested_mapping = suggest_column_mapping(headers)
 
         # Validate rows with suggested mapping
-        validated_rows = validate_rows(preview_df, suggested_mapping)
+        validated_rows = await offload(
+            "import", validate_rows, preview_df, suggested_mapping
+        )
 
         # Collect all errors
         all_errors = []
@@ -146,7 +151,9 @@ async def commit_import_records(
             raise HTTPException(status_code=400, detail="File is empty")
 
         # Parse and validate full file
-        valid_records, errors = parse_full_file(content, format, mapping)
+        valid_records, errors = await offload(
+            "import", parse_full_file, content, format, mapping
+        )
 
         # Check for errors (all-or-nothing)
         if errors:
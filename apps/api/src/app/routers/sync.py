@@ -1,28 +1,61 @@
-"""Sync endpoints with cursor-based pagination for client sync."""
-
+"""Sync endpoints with cursor-based pagination for client sync.
+
+The GET endpoints answer conditional requests: each response carries a
+weak ETag built from its scope's change counters (one RPC doing two primary
+key lookups, see migration 057) and the request parameters. A client repeating
+a request with If-None-Match gets 304 Not Modified before the page query
+and remarks lookups run. Responses are `Cache-Control: private, no-cache`,
+so browsers revalidate with the stored ETag on their own.
+
+Initial syncs of large scopes use the /bulk variants, which stream every
+item as NDJSON from one request (see Bulk Sync below).
+"""
+
+import asyncio
+import hashlib
+import json
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from app.auth import require_permission_key
 from app.database import get_supabase_for_user
 from app.models import (
+    AccountSyncItem,
+    AccountSyncResponse,
     BookkeepingStatus,
+    RecordBatchSyncPage,
+    RecordBatchSyncRequest,
+    RecordSyncAccountCursor,
     RecordSyncItem,
     RecordSyncResponse,
-    AccountSyncItem,
-    AccountSyncResponse,
     SellerSyncItem,
     SellerSyncResponse,
 )
-from app.pagination import encode_cursor, decode_cursor
+from app.pagination import decode_cursor, encode_cursor
+from app.services.db_utils import batched_query, execute_concurrent
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sync", tags=["sync"])
 
+# Accounts fetched together by /sync/records/batch: their page queries run
+# concurrently and share one order/service remarks lookup
+SYNC_BATCH_GROUP_SIZE = 10
+
+
+def _decode_cursor_or_400(cursor: str) -> tuple[datetime, str]:
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "INVALID_CURSOR", "message": "The provided cursor is invalid or malformed"},
+        )
+
 
 def _apply_cursor_filter(query, cursor: Optional[str], table_has_account_scope: bool = False):
     """
@@ -37,13 +70,7 @@ def _apply_cursor_filter(query, cursor: Optional[str], table_has_account_scope:
     if not cursor:
         return query
 
-    try:
-        cursor_updated_at, cursor_id = decode_cursor(cursor)
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail={"code": "INVALID_CURSOR", "message": "The provided cursor is invalid or malformed"},
-        )
+    cursor_updated_at, cursor_id = _decode_cursor_or_400(cursor)
 
     # Compound cursor comparison for DESC ordering
     # Format: updated_at.lt.{value},and(updated_at.eq.{value},id.lt.{id})
@@ -54,15 +81,76 @@ def _apply_cursor_filter(query, cursor: Optional[str], table_has_account_scope:
     return query.or_(cursor_filter)
 
 
-def _build_response(items: list, limit: int, item_class, remarks: tuple[dict, dict] | None = None):
-    """Build paginated response with has_more detection.
+# =============================================================================
+# Conditional Requests (watermark ETags)
+# =============================================================================
 
-    Args:
-        items: List of database rows
-        limit: Page size limit
-        item_class: Model class with from_db method
-        remarks: Optional tuple of (order_remarks_map, service_remarks_map) for records
+
+def _scope_etag(
+    supabase,
+    user: dict,
+    scope: str,
+    params: dict[str, Any],
+) -> Optional[str]:
+    """
+    Weak ETag for a sync request, from its scope's change counters.
+
+    get_sync_watermark (migration 057) returns two versions: the scope's
+    (e.g. `bookkeeping_records:<account_id>`), bumped by triggers on every
+    insert, update and delete in it, and the caller's access version, bumped
+    when their memberships or account assignments change what RLS lets them
+    see. They are hashed with the user and the request parameters, so every
+    page and filter combination has its own tag. Status/updated_since
+    filters are not applied - any change in scope invalidates, which errs
+    towards refetching.
+
+    Returns None if the watermark query fails (the request is then served
+    without an ETag).
     """
+    try:
+        result = supabase.rpc("get_sync_watermark", {"p_scope": scope}).execute()
+    except Exception as e:
+        logger.warning(f"Failed to read {scope} sync watermark: {e}")
+        return None
+
+    versions = result.data[0] if result.data else {}
+    key = json.dumps(
+        [
+            scope,
+            user.get("user_id"),
+            versions.get("scope_version"),
+            versions.get("access_version"),
+            params,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return f'W/"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """If-None-Match check (weak comparison, as for GET)."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def _cache_headers(etag: Optional[str]) -> dict[str, str]:
+    headers = {"Cache-Control": "private, no-cache", "Vary": "Authorization"}
+    if etag:
+        headers["ETag"] = etag
+    return headers
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=_cache_headers(etag))
+
+
+def _split_page(items: list, limit: int) -> tuple[list, Optional[str], bool]:
+    """Trim a limit + 1 row fetch to the page: (items, next_cursor, has_more)."""
     has_more = len(items) > limit
     if has_more:
         items = items[:limit]
@@ -89,6 +177,20 @@ def _build_response(items: list, limit: int, item_class, remarks: tuple[dict, di
                 updated_at = datetime(1970, 1, 1, tzinfo=timezone.utc)
             next_cursor = encode_cursor(updated_at, last.id)
 
+    return items, next_cursor, has_more
+
+
+def _build_response(items: list, limit: int, item_class, remarks: tuple[dict, dict] | None = None):
+    """Build paginated response with has_more detection.
+
+    Args:
+        items: List of database rows
+        limit: Page size limit
+        item_class: Model class with from_db method
+        remarks: Optional tuple of (order_remarks_map, service_remarks_map) for records
+    """
+    items, next_cursor, has_more = _split_page(items, limit)
+
     # Build items with remarks if provided
     if remarks is not None:
         order_remarks, service_remarks = remarks
@@ -116,8 +218,88 @@ def _build_response(items: list, limit: int, item_class, remarks: tuple[dict, di
 # =============================================================================
 
 
+def _records_page_query(
+    supabase,
+    account_id: str,
+    cursor: Optional[str],
+    limit: int,
+    status: Optional[BookkeepingStatus],
+    updated_since: Optional[datetime],
+    include_deleted: bool,
+):
+    """Query for one page of an account's records (limit + 1 rows, for has_more)."""
+    # Build base query with sync columns
+    query = (
+        supabase.table("bookkeeping_records")
+        .select("*")
+        .eq("account_id", account_id)
+        .order("updated_at", desc=True)
+        .order("id", desc=True)
+        .limit(limit + 1)  # Extra for has_more detection
+    )
+
+    # Apply soft-delete filter (unless sync needs deletions)
+    if not include_deleted:
+        query = query.is_("deleted_at", "null")
+
+    # Apply cursor filter
+    query = _apply_cursor_filter(query, cursor)
+
+    # Apply filters
+    if status:
+        query = query.eq("status", status.value)
+    if updated_since:
+        query = query.gte("updated_at", updated_since.isoformat())
+    return query
+
+
+def _fetch_remarks(supabase, record_ids: list[str]) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Order and service remarks for records, as (order_remarks, service_remarks).
+
+    RLS filters both tables by the user's access; a table the user cannot
+    read is skipped and its remarks are left empty.
+    """
+    order_remarks: dict[str, str] = {}
+    service_remarks: dict[str, str] = {}
+    if not record_ids:
+        return order_remarks, service_remarks
+
+    # Fetch order remarks (silently skip if user lacks permission)
+    try:
+        rows = batched_query(
+            supabase,
+            table="order_remarks",
+            select="record_id, content",
+            filter_column="record_id",
+            filter_values=record_ids,
+        )
+        logger.info(f"Fetched {len(rows)} order remarks for {len(record_ids)} records")
+        for row in rows:
+            order_remarks[row["record_id"]] = row["content"]
+    except Exception as e:
+        logger.warning(f"Failed to fetch order remarks: {e}")
+
+    # Fetch service remarks (silently skip if user lacks permission)
+    try:
+        rows = batched_query(
+            supabase,
+            table="service_remarks",
+            select="record_id, content",
+            filter_column="record_id",
+            filter_values=record_ids,
+        )
+        for row in rows:
+            service_remarks[row["record_id"]] = row["content"]
+    except Exception as e:
+        logger.warning(f"Failed to fetch service remarks: {e}")
+
+    return order_remarks, service_remarks
+
+
 @router.get("/records", response_model=RecordSyncResponse)
 async def sync_records(
+    response: Response,
     account_id: str = Query(..., description="Account ID to fetch records for"),
     cursor: Optional[str] = Query(None, description="Pagination cursor from previous response"),
     limit: int = Query(50, ge=1, le=100, description="Page size (1-100)"),
@@ -125,6 +307,7 @@ async def sync_records(
     status: Optional[BookkeepingStatus] = Query(None, description="Filter by status"),
     updated_since: Optional[datetime] = Query(None, description="Only records updated after this time (ISO 8601)"),
     include_deleted: bool = Query(False, description="Include soft-deleted records (for full sync)"),
+    if_none_match: Optional[str] = Header(None),
     user: dict = Depends(require_permission_key("order_tracking.read")),
 ):
     """
@@ -141,70 +324,39 @@ async def sync_records(
     - include_deleted: Include soft-deleted records (needed for sync to detect deletions)
 
     **Sort order:** updated_at DESC, id DESC (newest updates first)
+
+    **Conditional requests:** send the ETag of a previous response as
+    If-None-Match; 304 Not Modified means the account has not changed.
     """
     try:
         supabase = get_supabase_for_user(user["token"])
 
-        # Build base query with sync columns
-        query = (
-            supabase.table("bookkeeping_records")
-            .select("*")
-            .eq("account_id", account_id)
-            .order("updated_at", desc=True)
-            .order("id", desc=True)
-            .limit(limit + 1)  # Extra for has_more detection
+        etag = _scope_etag(
+            supabase,
+            user,
+            f"bookkeeping_records:{account_id}",
+            params={
+                "cursor": cursor,
+                "limit": limit,
+                "status": status,
+                "updated_since": updated_since,
+                "include_deleted": include_deleted,
+            },
         )
+        if _etag_matches(if_none_match, etag):
+            return _not_modified(etag)
+        response.headers.update(_cache_headers(etag))
 
-        # Apply soft-delete filter (unless sync needs deletions)
-        if not include_deleted:
-            query = query.is_("deleted_at", "null")
-
-        # Apply cursor filter
-        query = _apply_cursor_filter(query, cursor)
-
-        # Apply filters
-        if status:
-            query = query.eq("status", status.value)
-        if updated_since:
-            query = query.gte("updated_at", updated_since.isoformat())
-
+        query = _records_page_query(
+            supabase, account_id, cursor, limit, status, updated_since, include_deleted
+        )
         result = query.execute()
         records = result.data or []
 
         # Fetch remarks for records (RLS will filter based on user's access)
-        record_ids = [r["id"] for r in records]
-        order_remarks: dict[str, str] = {}
-        service_remarks: dict[str, str] = {}
+        remarks = _fetch_remarks(supabase, [r["id"] for r in records[:limit]])
 
-        if record_ids:
-            # Fetch order remarks (silently skip if user lacks permission)
-            try:
-                order_result = (
-                    supabase.table("order_remarks")
-                    .select("record_id, content")
-                    .in_("record_id", record_ids)
-                    .execute()
-                )
-                logger.info(f"Fetched {len(order_result.data or [])} order remarks for {len(record_ids)} records")
-                for row in order_result.data or []:
-                    order_remarks[row["record_id"]] = row["content"]
-            except Exception as e:
-                logger.warning(f"Failed to fetch order remarks: {e}")
-
-            # Fetch service remarks (silently skip if user lacks permission)
-            try:
-                service_result = (
-                    supabase.table("service_remarks")
-                    .select("record_id, content")
-                    .in_("record_id", record_ids)
-                    .execute()
-                )
-                for row in service_result.data or []:
-                    service_remarks[row["record_id"]] = row["content"]
-            except Exception as e:
-                logger.warning(f"Failed to fetch service remarks: {e}")
-
-        return _build_response(records, limit, RecordSyncItem, remarks=(order_remarks, service_remarks))
+        return _build_response(records, limit, RecordSyncItem, remarks=remarks)
 
     except HTTPException:
         raise
@@ -213,43 +365,181 @@ async def sync_records(
         raise HTTPException(status_code=500, detail="Failed to fetch records")
 
 
+def _sync_account_group(
+    supabase,
+    accounts: list[RecordSyncAccountCursor],
+    request: RecordBatchSyncRequest,
+) -> list[RecordBatchSyncPage]:
+    """One page per account; page queries run concurrently, remarks are fetched once."""
+
+    def fetch_page(batch: list[RecordSyncAccountCursor]) -> list[dict]:
+        account = batch[0]
+        query = _records_page_query(
+            supabase,
+            account.account_id,
+            account.cursor,
+            request.limit,
+            request.status,
+            account.updated_since or request.updated_since,
+            request.include_deleted,
+        )
+        return query.execute().data or []
+
+    rows_per_account = execute_concurrent(fetch_page, [[account] for account in accounts])
+
+    # The extra row per account only detects has_more; it needs no remarks
+    record_ids = [r["id"] for rows in rows_per_account for r in rows[:request.limit]]
+    remarks = _fetch_remarks(supabase, record_ids)
+
+    return [
+        RecordBatchSyncPage(
+            account_id=account.account_id,
+            **_build_response(rows, request.limit, RecordSyncItem, remarks=remarks),
+        )
+        for account, rows in zip(accounts, rows_per_account)
+    ]
+
+
+@router.post("/records/batch")
+async def sync_records_batch(
+    body: RecordBatchSyncRequest,
+    user: dict = Depends(require_permission_key("order_tracking.read")),
+):
+    """
+    Fetch a page of records for many accounts in one streamed response.
+
+    **Request:** `accounts` lists each account with its own `cursor` (the
+    next_cursor last returned for it) and optionally its own
+    `updated_since`; omit `accounts` to sync every account the user can
+    read. `limit`, `status`, `updated_since` and `include_deleted` apply to
+    every account, as on GET /sync/records.
+
+    **Response:** NDJSON (application/x-ndjson), one line per account:
+    `{"account_id", "items", "next_cursor", "has_more"}` - the same page
+    GET /sync/records returns - then a final `{"done": true, "accounts",
+    "has_more"}` line. An account that failed gets
+    `{"account_id", "error"}` instead of a page. Clients send the accounts
+    with has_more again, with their new cursors, until none is left.
+
+    Accounts are fetched SYNC_BATCH_GROUP_SIZE at a time: a group's page
+    queries run concurrently and its remarks are looked up together, so
+    40 accounts cost 48 queries instead of 40 requests making 120. All use
+    the user's token, so RLS applies exactly as on GET /sync/records.
+    """
+    supabase = get_supabase_for_user(user["token"])
+
+    # Reject malformed cursors before the stream starts
+    for account in body.accounts or []:
+        if account.cursor:
+            _decode_cursor_or_400(account.cursor)
+
+    if body.accounts is None:
+        try:
+            result = (
+                supabase.table("accounts")
+                .select("id")
+                .is_("deleted_at", "null")
+                .order("id")
+                .execute()
+            )
+        except Exception:
+            logger.exception("Failed to list accounts for batch sync")
+            raise HTTPException(status_code=500, detail="Failed to fetch accounts")
+        accounts = [RecordSyncAccountCursor(account_id=row["id"]) for row in result.data or []]
+    else:
+        # An account listed twice is synced once (its last entry wins)
+        accounts = list({account.account_id: account for account in body.accounts}.values())
+
+    async def generate():
+        has_more = False
+        for start in range(0, len(accounts), SYNC_BATCH_GROUP_SIZE):
+            group = accounts[start:start + SYNC_BATCH_GROUP_SIZE]
+            try:
+                # Blocking supabase calls: keep them off the event loop
+                pages = await asyncio.to_thread(_sync_account_group, supabase, group, body)
+            except Exception:
+                logger.exception(f"Failed to sync records for {len(group)} account(s)")
+                for account in group:
+                    yield json.dumps({"account_id": account.account_id, "error": "Failed to fetch records"}) + "\n"
+                continue
+            for page in pages:
+                has_more = has_more or page.has_more
+                yield page.model_dump_json() + "\n"
+        yield json.dumps({"done": True, "accounts": len(accounts), "has_more": has_more}) + "\n"
+
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 # =============================================================================
 # Accounts Sync
 # =============================================================================
 
 
+def _accounts_page_query(
+    supabase,
+    cursor: Optional[str],
+    limit: int,
+    updated_since: Optional[datetime],
+    include_deleted: bool,
+):
+    """Query for one page of accounts (limit + 1 rows, for has_more)."""
+    query = (
+        supabase.table("accounts")
+        .select("id, account_code, name, updated_at, deleted_at")
+        .order("updated_at", desc=True)
+        .order("id", desc=True)
+        .limit(limit + 1)
+    )
+
+    if not include_deleted:
+        query = query.is_("deleted_at", "null")
+
+    query = _apply_cursor_filter(query, cursor)
+
+    if updated_since:
+        query = query.gte("updated_at", updated_since.isoformat())
+    return query
+
+
 @router.get("/accounts", response_model=AccountSyncResponse)
 async def sync_accounts(
+    response: Response,
     cursor: Optional[str] = Query(None, description="Pagination cursor from previous response"),
     limit: int = Query(50, ge=1, le=100, description="Page size (1-100)"),
     updated_since: Optional[datetime] = Query(None, description="Only accounts updated after this time"),
     include_deleted: bool = Query(False, description="Include soft-deleted accounts"),
+    if_none_match: Optional[str] = Header(None),
     user: dict = Depends(require_permission_key("order_tracking.read")),
 ):
     """
     Fetch accounts for sync with cursor-based pagination.
 
     Accounts are organization-scoped via RLS (user sees accounts for their org).
+    Answers If-None-Match with 304 like GET /sync/records.
     """
     try:
         supabase = get_supabase_for_user(user["token"])
 
-        query = (
-            supabase.table("accounts")
-            .select("id, account_code, name, updated_at, deleted_at")
-            .order("updated_at", desc=True)
-            .order("id", desc=True)
-            .limit(limit + 1)
+        etag = _scope_etag(
+            supabase,
+            user,
+            "accounts",
+            params={
+                "cursor": cursor,
+                "limit": limit,
+                "updated_since": updated_since,
+                "include_deleted": include_deleted,
+            },
         )
+        if _etag_matches(if_none_match, etag):
+            return _not_modified(etag)
+        response.headers.update(_cache_headers(etag))
 
-        if not include_deleted:
-            query = query.is_("deleted_at", "null")
-
-        query = _apply_cursor_filter(query, cursor)
-
-        if updated_since:
-            query = query.gte("updated_at", updated_since.isoformat())
-
+        query = _accounts_page_query(supabase, cursor, limit, updated_since, include_deleted)
         result = query.execute()
         accounts = result.data or []
 
@@ -267,42 +557,73 @@ async def sync_accounts(
 # =============================================================================
 
 
+def _sellers_page_query(
+    supabase,
+    cursor: Optional[str],
+    limit: int,
+    updated_since: Optional[datetime],
+    include_deleted: bool,
+    flagged: Optional[bool],
+):
+    """Query for one page of sellers (limit + 1 rows, for has_more)."""
+    query = (
+        supabase.table("sellers")
+        .select("id, display_name, normalized_name, platform, platform_id, times_seen, flagged, updated_at, deleted_at")
+        .order("updated_at", desc=True)
+        .order("id", desc=True)
+        .limit(limit + 1)
+    )
+
+    if not include_deleted:
+        query = query.is_("deleted_at", "null")
+
+    query = _apply_cursor_filter(query, cursor)
+
+    if updated_since:
+        query = query.gte("updated_at", updated_since.isoformat())
+
+    if flagged is not None:
+        query = query.eq("flagged", flagged)
+    return query
+
+
 @router.get("/sellers", response_model=SellerSyncResponse)
 async def sync_sellers(
+    response: Response,
     cursor: Optional[str] = Query(None, description="Pagination cursor from previous response"),
     limit: int = Query(50, ge=1, le=100, description="Page size (1-100)"),
     updated_since: Optional[datetime] = Query(None, description="Only sellers updated after this time"),
     include_deleted: bool = Query(False, description="Include soft-deleted sellers"),
     flagged: Optional[bool] = Query(None, description="Filter by flagged status"),
+    if_none_match: Optional[str] = Header(None),
     user: dict = Depends(require_permission_key("seller_collection.read")),
 ):
     """
     Fetch sellers for sync with cursor-based pagination.
 
     Sellers are organization-scoped via RLS.
+    Answers If-None-Match with 304 like GET /sync/records.
     """
     try:
         supabase = get_supabase_for_user(user["token"])
 
-        query = (
-            supabase.table("sellers")
-            .select("id, display_name, normalized_name, platform, platform_id, times_seen, flagged, updated_at, deleted_at")
-            .order("updated_at", desc=True)
-            .order("id", desc=True)
-            .limit(limit + 1)
+        etag = _scope_etag(
+            supabase,
+            user,
+            f"sellers:{user['membership']['org_id']}",
+            params={
+                "cursor": cursor,
+                "limit": limit,
+                "updated_since": updated_since,
+                "include_deleted": include_deleted,
+                "flagged": flagged,
+            },
         )
+        if _etag_matches(if_none_match, etag):
+            return _not_modified(etag)
+        response.headers.update(_cache_headers(etag))
 
-        if not include_deleted:
-            query = query.is_("deleted_at", "null")
-
-        query = _apply_cursor_filter(query, cursor)
-
-        if updated_since:
-            query = query.gte("updated_at", updated_since.isoformat())
-
-        if flagged is not None:
-            query = query.eq("flagged", flagged)
-
+        query = _sellers_page_query(supabase, cursor, limit, updated_since, include_deleted, flagged)
         result = query.execute()
         sellers = result.data or []
 
@@ -313,3 +634,166 @@ async def sync_sellers(
     except Exception as e:
         logger.exception("Failed to sync sellers")
         raise HTTPException(status_code=500, detail="Failed to fetch sellers")
+
+
+# =============================================================================
+# Bulk Sync (NDJSON)
+# =============================================================================
+
+# Supabase returns at most this many rows per request, whatever the limit
+SUPABASE_MAX_ROWS = 1000
+
+# Rows per internal page of a bulk sync: the page query fetches one extra
+# row to detect has_more, and that row must fit under the cap too
+SYNC_BULK_PAGE_SIZE = SUPABASE_MAX_ROWS - 1
+
+# Item fields written per line, as in the paged responses
+RECORD_SYNC_FIELDS = tuple(RecordSyncItem.model_fields)
+ACCOUNT_SYNC_FIELDS = tuple(AccountSyncItem.model_fields)
+SELLER_SYNC_FIELDS = tuple(SellerSyncItem.model_fields)
+
+BulkPage = tuple[list[dict], Optional[str], bool]
+
+
+def _ndjson(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), default=str) + "\n"
+
+
+async def _bulk_lines(
+    fetch_page: Callable[[Optional[str]], BulkPage],
+    cursor: Optional[str],
+) -> AsyncIterator[str]:
+    """
+    NDJSON body of a bulk sync.
+
+    One line per item, then a `{"checkpoint", "synced"}` line after every
+    page that has more after it, and `{"done": true, "synced"}` at the end.
+    A checkpoint is a regular cursor: passing it as `cursor` (to the bulk or
+    the paged endpoint) continues after the last item already received. A
+    page that fails ends the stream with `{"error", "checkpoint"}`.
+
+    fetch_page(cursor) -> (items, next_cursor, has_more) runs in a worker
+    thread; the next page is fetched while the current one is written out.
+    """
+    synced = 0
+    pending = asyncio.ensure_future(asyncio.to_thread(fetch_page, cursor))
+    try:
+        while True:
+            try:
+                items, next_cursor, has_more = await pending
+            except Exception:
+                logger.exception("Bulk sync page failed")
+                yield _ndjson({"error": "Failed to fetch page", "checkpoint": cursor})
+                return
+            pending = None
+            if has_more:
+                # Prefetch: the next page's queries overlap this page's write
+                pending = asyncio.ensure_future(asyncio.to_thread(fetch_page, next_cursor))
+
+            yield "".join(_ndjson(item) for item in items)
+            synced += len(items)
+            if not has_more:
+                break
+            cursor = next_cursor
+            yield _ndjson({"checkpoint": cursor, "synced": synced})
+
+        yield _ndjson({"done": True, "synced": synced})
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _bulk_response(fetch_page: Callable[[Optional[str]], BulkPage], cursor: Optional[str]):
+    # Reject a malformed cursor before the stream starts
+    if cursor:
+        _decode_cursor_or_400(cursor)
+    return StreamingResponse(
+        _bulk_lines(fetch_page, cursor),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.get("/records/bulk")
+async def sync_records_bulk(
+    account_id: str = Query(..., description="Account ID to fetch records for"),
+    cursor: Optional[str] = Query(None, description="Checkpoint to resume from"),
+    status: Optional[BookkeepingStatus] = Query(None, description="Filter by status"),
+    updated_since: Optional[datetime] = Query(None, description="Only records updated after this time (ISO 8601)"),
+    include_deleted: bool = Query(False, description="Include soft-deleted records (for full sync)"),
+    user: dict = Depends(require_permission_key("order_tracking.read")),
+):
+    """
+    Stream all of an account's records as NDJSON, for initial sync.
+
+    Same filters, order and items as GET /sync/records, without the page
+    size cap: the server pages internally (SYNC_BULK_PAGE_SIZE rows, keyset
+    on updated_at DESC, id DESC, one page prefetched) and writes one record
+    per line, with a resumable checkpoint line after each page. A 200k
+    record account is one request instead of 2,000+.
+    """
+    supabase = get_supabase_for_user(user["token"])
+
+    def fetch_page(page_cursor: Optional[str]) -> BulkPage:
+        query = _records_page_query(
+            supabase, account_id, page_cursor, SYNC_BULK_PAGE_SIZE,
+            status, updated_since, include_deleted,
+        )
+        rows, next_cursor, has_more = _split_page(query.execute().data or [], SYNC_BULK_PAGE_SIZE)
+        order_remarks, service_remarks = _fetch_remarks(supabase, [r["id"] for r in rows])
+        items = []
+        for row in rows:
+            item = {name: row.get(name) for name in RECORD_SYNC_FIELDS}
+            item["order_remark"] = order_remarks.get(row["id"])
+            item["service_remark"] = service_remarks.get(row["id"])
+            items.append(item)
+        return items, next_cursor, has_more
+
+    return _bulk_response(fetch_page, cursor)
+
+
+@router.get("/accounts/bulk")
+async def sync_accounts_bulk(
+    cursor: Optional[str] = Query(None, description="Checkpoint to resume from"),
+    updated_since: Optional[datetime] = Query(None, description="Only accounts updated after this time"),
+    include_deleted: bool = Query(False, description="Include soft-deleted accounts"),
+    user: dict = Depends(require_permission_key("order_tracking.read")),
+):
+    """Stream all accounts as NDJSON (see GET /sync/records/bulk)."""
+    supabase = get_supabase_for_user(user["token"])
+
+    def fetch_page(page_cursor: Optional[str]) -> BulkPage:
+        query = _accounts_page_query(
+            supabase, page_cursor, SYNC_BULK_PAGE_SIZE, updated_since, include_deleted
+        )
+        rows, next_cursor, has_more = _split_page(query.execute().data or [], SYNC_BULK_PAGE_SIZE)
+        items = [{name: row.get(name) for name in ACCOUNT_SYNC_FIELDS} for row in rows]
+        return items, next_cursor, has_more
+
+    return _bulk_response(fetch_page, cursor)
+
+
+@router.get("/sellers/bulk")
+async def sync_sellers_bulk(
+    cursor: Optional[str] = Query(None, description="Checkpoint to resume from"),
+    updated_since: Optional[datetime] = Query(None, description="Only sellers updated after this time"),
+    include_deleted: bool = Query(False, description="Include soft-deleted sellers"),
+    flagged: Optional[bool] = Query(None, description="Filter by flagged status"),
+    user: dict = Depends(require_permission_key("seller_collection.read")),
+):
+    """Stream all sellers as NDJSON (see GET /sync/records/bulk)."""
+    supabase = get_supabase_for_user(user["token"])
+
+    def fetch_page(page_cursor: Optional[str]) -> BulkPage:
+        query = _sellers_page_query(
+            supabase, page_cursor, SYNC_BULK_PAGE_SIZE, updated_since, include_deleted, flagged
+        )
+        rows, next_cursor, has_more = _split_page(query.execute().data or [], SYNC_BULK_PAGE_SIZE)
+        items = []
+        for row in rows:
+            item = {name: row.get(name) for name in SELLER_SYNC_FIELDS}
+            item["flagged"] = bool(item["flagged"])
+            items.append(item)
+        return items, next_cursor, has_more
+
+    return _bulk_response(fetch_page, cursor)
@@ -1,26 +1,333 @@
 """Activity stream manager for real-time SSE streaming.
 
-Manages in-memory activity queues keyed by run_id.
-Each run has its own asyncio.Queue that workers push to
-and SSE endpoints consume from.
+Each collection run has one RunActivityStream: a fixed-size ring buffer of
+events that workers publish to and any number of SSE connections read
+from. Subscribers do not consume from a shared queue (which would split
+events between them); each one keeps its own cursor into the ring, so
+every subscriber sees every event.
+
+Publishing writes one ring slot and, if any subscriber is waiting, resolves
+one shared future - its cost does not depend on the number of subscribers.
+The ring holds ActivityEvent objects, whose JSON is encoded once when the
+event is created; SSE connections, replays and the bus all send those
+bytes as they are.
+
+A subscriber that falls more than `max_lag` events behind (the ring size
+at most) is handled by its drop policy:
+    drop_oldest  skip ahead to the oldest event it may still read, counting
+                 the skipped events in `dropped` (default)
+    disconnect   raise SubscriberLaggedError so the connection is closed
+
+Replay: every event gets a sequence number, sent to SSE clients as
+`id: <epoch>-<seq>`. On reconnect EventSource sends it back as
+Last-Event-ID and the new subscriber resumes right after it, as long as
+the event is still in the ring (the replay window). The epoch identifies
+the stream instance, so an id from a stream that has since been removed
+and recreated is not mistaken for a position in the new one.
+
+Batching: get_batch() collects everything published within a short window
+so an SSE connection can send one frame (a JSON array) per window instead
+of one per event; collapse_superseded() additionally drops `fetching`
+events already followed by a newer event from the same worker.
+
+Eviction: streams are removed by cleanup() when a run ends, and by sweep()
+(run periodically from the app lifespan) once nothing has been published
+for ACTIVITY_STREAM_TTL_SECONDS - runs that failed, were paused or died
+with the process would otherwise keep their ring forever. Creating a
+stream beyond ACTIVITY_MAX_STREAMS or ACTIVITY_MAX_BUFFERED_EVENTS evicts
+the least recently active streams first, but never one that published in
+the last ACTIVE_GRACE_SECONDS. Neither evicts the stream of a run whose
+workers are running in this process (tracked in run_progress), however
+quiet: its phase keeps publishing through the handle it resolved at
+start, and a replacement stream would never see those events.
+
+An evicted stream is closed: its subscribers drain what is left and then
+get StreamClosedError. The SSE endpoint then sends `end` if the run has
+finished, and otherwise ends the response so EventSource reconnects to a
+fresh stream. It never creates a stream for a finished run.
+
+Multiple processes: publish() and cleanup() are also forwarded on the bus
+(app.services.bus), and other processes apply them to their own copy of
+the stream, so an SSE client sees a run's events whichever uvicorn worker
+it is connected to. Sequence numbers and epochs are per process; a
+reconnect that lands on another worker replays that worker's window.
 """
 
 import asyncio
 import logging
+import os
+import time
 from typing import Any
 
+from app.services import bus, run_progress
+from app.services.parallel_runner import ActivityEvent
+
 logger = logging.getLogger(__name__)
 
-# Buffer size per run - older events dropped when full
-ACTIVITY_BUFFER_SIZE = 100
+ACTIVITY_CHANNEL = "activity"
+
+# Ring buffer size per run (also the replay window for reconnects) - the
+# oldest events are overwritten when full
+ACTIVITY_BUFFER_SIZE = int(os.getenv("ACTIVITY_BUFFER_SIZE", "500"))
+
+# Max events handed to a subscriber per read
+READ_BATCH_SIZE = 100
+
+# Max events in one batched frame (get_batch)
+MAX_FRAME_EVENTS = 1000
+
+# Eviction (see module docstring)
+ACTIVITY_STREAM_TTL_SECONDS = float(os.getenv("ACTIVITY_STREAM_TTL_SECONDS", "900"))
+ACTIVITY_MAX_STREAMS = int(os.getenv("ACTIVITY_MAX_STREAMS", "200"))
+ACTIVITY_MAX_BUFFERED_EVENTS = int(os.getenv("ACTIVITY_MAX_BUFFERED_EVENTS", "50000"))
+ACTIVE_GRACE_SECONDS = 60.0
+
+DROP_POLICIES = ("drop_oldest", "disconnect")
+
+
+class SubscriberLaggedError(Exception):
+    """A subscriber with the disconnect policy fell too far behind."""
+
+
+class StreamClosedError(Exception):
+    """The stream was evicted or cleaned up and every event has been read."""
+
+
+class RunActivityStream:
+    """Ring buffer of one run's activity events with cursor-based readers."""
+
+    def __init__(self, run_id: str, capacity: int = ACTIVITY_BUFFER_SIZE):
+        self.run_id = run_id
+        self.capacity = capacity
+        self.epoch = f"{time.time_ns() // 1000:x}"
+        self._slots: list[ActivityEvent | None] = [None] * capacity
+        # Sequence number the next published event gets (first event is 1)
+        self.next_seq = 1
+        self.subscribers = 0
+        self.closed = False
+        self.last_active = time.monotonic()
+        self._waiter: asyncio.Future | None = None
+
+    @property
+    def oldest_seq(self) -> int:
+        """Sequence number of the oldest event still in the ring."""
+        return max(1, self.next_seq - self.capacity)
+
+    @property
+    def buffered(self) -> int:
+        """Number of events currently held in the ring."""
+        return self.next_seq - self.oldest_seq
+
+    def buffered_bytes(self) -> int:
+        """Encoded JSON size of the buffered events."""
+        return sum(
+            len(self._slots[seq % self.capacity].encoded)
+            for seq in range(self.oldest_seq, self.next_seq)
+        )
+
+    def event_id(self, seq: int) -> str:
+        """SSE id for an event (see module docstring)."""
+        return f"{self.epoch}-{seq}"
+
+    def parse_event_id(self, event_id: str | None) -> int | None:
+        """Sequence number from an SSE id of this stream; None if not ours."""
+        if not event_id:
+            return None
+        epoch, _, seq = event_id.strip().rpartition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def publish(self, event: ActivityEvent) -> int:
+        """Append an event, wake waiting subscribers and forward it on the bus.
+
+        Returns its sequence number.
+        """
+        seq = self.receive(event)
+        bus.get_bus().publish(ACTIVITY_CHANNEL, self.run_id, event.encoded)
+        return seq
+
+    def receive(self, event: ActivityEvent) -> int:
+        """Append an event without forwarding it (events from other processes)."""
+        seq = self.next_seq
+        self._slots[seq % self.capacity] = event
+        self.next_seq = seq + 1
+        self.last_active = time.monotonic()
+        self._wake()
+        return seq
+
+    def close(self) -> None:
+        """Stop accepting subscribers' waits; they drain and get StreamClosedError."""
+        self.closed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def read(self, from_seq: int, limit: int = READ_BATCH_SIZE) -> list[tuple[int, ActivityEvent]]:
+        """Events with sequence numbers from `from_seq` on (caller checks oldest_seq)."""
+        end = min(self.next_seq, from_seq + limit)
+        return [(seq, self._slots[seq % self.capacity]) for seq in range(from_seq, end)]
+
+    async def wait_beyond(self, seq: int, timeout: float | None = None) -> bool:
+        """Wait until an event with sequence number >= `seq` exists.
+
+        Returns False on timeout. All waiting subscribers share one future.
+        """
+        if self.next_seq > seq:
+            return True
+        if self.closed:
+            return False
+        loop = asyncio.get_running_loop()
+        if self._waiter is None or self._waiter.done() or self._waiter.get_loop() is not loop:
+            self._waiter = loop.create_future()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._waiter), timeout)
+        except TimeoutError:
+            return False
+        return self.next_seq > seq
+
+    def subscribe(
+        self,
+        max_lag: int | None = None,
+        policy: str = "drop_oldest",
+        last_event_id: str | None = None,
+    ) -> "ActivitySubscriber":
+        """New subscriber.
+
+        Resumes after `last_event_id` (an SSE Last-Event-ID) when it belongs
+        to this stream; otherwise starts with the events still in the ring.
+        If the resume point has already left the ring, the subscriber's
+        drop policy applies on its first read.
+        """
+        self.last_active = time.monotonic()
+        last_seq = self.parse_event_id(last_event_id)
+        if last_seq is None:
+            cursor = self.oldest_seq
+        else:
+            cursor = min(last_seq + 1, self.next_seq)
+        return ActivitySubscriber(self, cursor, max_lag, policy)
+
+
+class ActivitySubscriber:
+    """One reader of a RunActivityStream (e.g. one SSE connection)."""
+
+    def __init__(
+        self,
+        stream: RunActivityStream,
+        cursor: int,
+        max_lag: int | None = None,
+        policy: str = "drop_oldest",
+    ):
+        if policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy '{policy}'")
+        self.stream = stream
+        self.cursor = cursor  # Sequence number of the next event to read
+        self.max_lag = min(max_lag or stream.capacity, stream.capacity)
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+        stream.subscribers += 1
+
+    def _check_lag(self) -> None:
+        oldest = max(self.stream.oldest_seq, self.stream.next_seq - self.max_lag)
+        if self.cursor >= oldest:
+            return
+        skipped = oldest - self.cursor
+        if self.policy == "disconnect":
+            raise SubscriberLaggedError(
+                f"Subscriber to run {self.stream.run_id} fell {skipped} events behind"
+            )
+        self.dropped += skipped
+        self.cursor = oldest
+        logger.debug(f"Slow activity subscriber for run {self.stream.run_id} skipped {skipped} events")
+
+    async def get(
+        self,
+        timeout: float | None = None,
+        limit: int = READ_BATCH_SIZE,
+    ) -> list[tuple[int, ActivityEvent]]:
+        """Next (seq, event) pairs; waits up to `timeout` and returns [] if none arrived.
+
+        Raises StreamClosedError once the stream is closed and fully read.
+        """
+        if not await self.stream.wait_beyond(self.cursor, timeout):
+            if self.stream.closed:
+                raise StreamClosedError(f"Activity stream for run {self.stream.run_id} closed")
+            return []
+        self._check_lag()
+        events = self.stream.read(self.cursor, limit)
+        if events:
+            self.cursor = events[-1][0] + 1
+        return events
+
+    async def get_batch(
+        self,
+        window: float,
+        timeout: float | None = None,
+        limit: int = MAX_FRAME_EVENTS,
+    ) -> list[tuple[int, ActivityEvent]]:
+        """Wait up to `timeout` for an event, then collect for `window` seconds.
+
+        Returns everything published until the window closes (or `limit`
+        events), or [] if nothing arrived within `timeout`.
+        """
+        events = await self.get(timeout, limit)
+        if not events:
+            return events
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + window
+        while len(events) < limit and not self.stream.closed:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            events += await self.get(remaining, limit - len(events))
+        return events
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.stream.subscribers -= 1
+
+
+def collapse_superseded(
+    events: list[tuple[int, ActivityEvent]],
+) -> list[tuple[int, ActivityEvent]]:
+    """Drop `fetching` events followed by a later event from the same worker.
+
+    Only the worker's latest state is kept; system events (worker 0) are
+    never dropped. Clients that count requests from `fetching` events
+    should not use this.
+    """
+    kept = []
+    workers_seen: set[int] = set()
+    for seq, event in reversed(events):
+        worker_id = event.worker_id
+        if worker_id > 0:
+            if event.action == "fetching" and worker_id in workers_seen:
+                continue
+            workers_seen.add(worker_id)
+        kept.append((seq, event))
+    kept.reverse()
+    return kept
 
 
 class ActivityStreamManager:
     """
     Singleton manager for activity streams.
 
-    Each collection run gets its own asyncio.Queue for activity events.
-    Queues are automatically cleaned up when no longer referenced.
+    Each collection run gets its own RunActivityStream, created on first
+    publish or subscribe and removed by cleanup() when the run finishes or
+    by sweep() once idle (see module docstring).
+
+    All methods are synchronous and lock-free: they run on the event loop
+    thread and only do dict lookups, so no await point can interleave.
+    Publishers resolve a run's stream once (get_or_create) and call its
+    publish() directly - no task or lock per event.
     """
 
     _instance: "ActivityStreamManager | None" = None
@@ -28,51 +335,120 @@ class ActivityStreamManager:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._streams: dict[str, asyncio.Queue] = {}
-            cls._instance._lock = asyncio.Lock()
+            cls._instance._streams: dict[str, RunActivityStream] = {}
+            cls._instance.evicted_total = 0
         return cls._instance
 
-    async def get_or_create(self, run_id: str) -> asyncio.Queue:
-        """Get existing queue or create new one for run_id."""
-        async with self._lock:
-            if run_id not in self._streams:
-                self._streams[run_id] = asyncio.Queue(maxsize=ACTIVITY_BUFFER_SIZE)
-                logger.debug(f"Created activity stream for run {run_id}")
-            return self._streams[run_id]
+    def get_or_create(self, run_id: str) -> RunActivityStream:
+        """Get existing stream or create new one for run_id."""
+        stream = self._streams.get(run_id)
+        if stream is None:
+            stream = self._streams[run_id] = RunActivityStream(run_id)
+            logger.debug(f"Created activity stream for run {run_id}")
+            self._enforce_caps()
+        return stream
+
+    def publish(self, run_id: str, event: ActivityEvent) -> int:
+        """Publish event to every subscriber of the run's stream."""
+        return self.get_or_create(run_id).publish(event)
+
+    def subscribe(
+        self,
+        run_id: str,
+        max_lag: int | None = None,
+        policy: str = "drop_oldest",
+        last_event_id: str | None = None,
+    ) -> ActivitySubscriber:
+        """Subscribe to a run's buffered and future events.
+
+        Pass the client's Last-Event-ID to resume where it left off.
+        """
+        return self.get_or_create(run_id).subscribe(max_lag, policy, last_event_id)
+
+    def cleanup(self, run_id: str):
+        """Remove and close stream for a finished run.
 
-    async def push(self, run_id: str, event: dict[str, Any]):
+        Connected subscribers keep their reference and can still read what
+        was published before, then get StreamClosedError.
         """
-        Push event to run's queue.
+        self._remove(run_id)
+        bus.get_bus().publish(ACTIVITY_CHANNEL, run_id, None)
+
+    def _remove(self, run_id: str) -> None:
+        stream = self._streams.pop(run_id, None)
+        if stream is not None:
+            stream.close()
+            logger.debug(f"Cleaned up activity stream for run {run_id}")
+
+    def apply_remote(self, run_id: str, event: dict[str, Any] | None) -> None:
+        """Bus handler: an event published, or a cleanup (None), elsewhere."""
+        if event is None:
+            self._remove(run_id)
+        else:
+            self.get_or_create(run_id).receive(ActivityEvent.from_dict(event))
 
-        If queue is full, drops oldest event to make room.
+    def sweep(self, now: float | None = None) -> int:
+        """Evict streams idle past the TTL, then enforce the caps.
+
+        Returns the number of streams evicted.
         """
-        queue = await self.get_or_create(run_id)
+        now = time.monotonic() if now is None else now
+        expired = [
+            run_id for run_id, stream in self._streams.items()
+            if now - stream.last_active > ACTIVITY_STREAM_TTL_SECONDS
+            and not run_progress.is_tracked(run_id)
+        ]
+        for run_id in expired:
+            self._evict(run_id, "idle")
+        return len(expired) + self._enforce_caps(now)
 
-        # If queue full, drop oldest
-        if queue.full():
-            try:
-                queue.get_nowait()
-                logger.debug(f"Activity queue full, dropped oldest event for run {run_id}")
-            except asyncio.QueueEmpty:
-                pass
+    def _enforce_caps(self, now: float | None = None) -> int:
+        """Evict least recently active streams while over a cap."""
+        now = time.monotonic() if now is None else now
+        streams = len(self._streams)
+        buffered = sum(stream.buffered for stream in self._streams.values())
+        if streams <= ACTIVITY_MAX_STREAMS and buffered <= ACTIVITY_MAX_BUFFERED_EVENTS:
+            return 0
+        candidates = sorted(
+            (
+                stream for stream in self._streams.values()
+                if now - stream.last_active >= ACTIVE_GRACE_SECONDS
+                and not run_progress.is_tracked(stream.run_id)
+            ),
+            key=lambda stream: stream.last_active,
+        )
+        evicted = 0
+        for stream in candidates:
+            if streams <= ACTIVITY_MAX_STREAMS and buffered <= ACTIVITY_MAX_BUFFERED_EVENTS:
+                break
+            streams -= 1
+            buffered -= stream.buffered
+            self._evict(stream.run_id, "over capacity")
+            evicted += 1
+        return evicted
 
-        try:
-            queue.put_nowait(event)
-            action = event.get("action", "unknown")
-            logger.debug(f"Pushed activity event: {action} for run {run_id} (queue size: {queue.qsize()})")
-        except asyncio.QueueFull:
-            # Should not happen after dropping oldest, but handle anyway
-            logger.warning(f"Activity queue full for run {run_id}")
+    def _evict(self, run_id: str, reason: str) -> None:
+        stream = self._streams.pop(run_id)
+        stream.close()
+        self.evicted_total += 1
+        logger.info(f"Evicted activity stream for run {run_id} ({reason})")
 
-    async def cleanup(self, run_id: str):
-        """Remove queue for completed run."""
-        async with self._lock:
-            if run_id in self._streams:
-                del self._streams[run_id]
-                logger.debug(f"Cleaned up activity stream for run {run_id}")
+    def stats(self) -> dict[str, int]:
+        """Gauges for the admin runtime stats endpoint."""
+        streams = list(self._streams.values())
+        return {
+            "streams": len(streams),
+            "subscribers": sum(stream.subscribers for stream in streams),
+            "buffered_events": sum(stream.buffered for stream in streams),
+            "buffered_bytes": sum(stream.buffered_bytes() for stream in streams),
+            "evicted_total": self.evicted_total,
+        }
 
 
 # Global instance getter
 def get_activity_stream() -> ActivityStreamManager:
     """Get the singleton ActivityStreamManager instance."""
     return ActivityStreamManager()
+
+
+bus.register(ACTIVITY_CHANNEL, get_activity_stream().apply_remote)
@@ -0,0 +1,479 @@
+"""Cross-process bus for activity events and run signals.
+
+Activity streams (activity_stream) and pause/cancel signals (run_signals)
+live in each process's memory. With several uvicorn workers, a pause
+request or an SSE client can land on a worker that is not running the
+collection. The bus mirrors both to every other process: each publish is
+applied locally first, as before, and then forwarded; remote messages are
+applied with the local, non-forwarding path.
+
+Backends (BUS_BACKEND):
+
+    inprocess  default - single process, publish() is a no-op
+    postgres   LISTEN/NOTIFY on BUS_POSTGRES_CHANNEL through
+               BUS_POSTGRES_DSN (needs asyncpg, imported lazily)
+    tcp        the local broker in this module at BUS_BROKER_URL
+               (tcp://host:port), started with `python -m app.services.bus`;
+               a stand-in for Redis/NATS-style brokers and used in tests
+
+publish() never blocks or awaits: messages go to a bounded outbox that a
+sender task drains, packing as many as fit into one frame (one NOTIFY,
+whose payload is capped at 8000 bytes, or one broker line). When the
+outbox is full, or the backend is disconnected for long enough to fill
+it, messages are dropped and counted rather than stalling collection
+workers. Every message carries its publish time; receivers record the
+delivery latency, reported by stats() next to the time publish() itself
+adds to the caller. A payload that is already JSON (bytes, e.g. an
+ActivityEvent's encoding) is spliced into the frame as it is.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Callable
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+BUS_BACKEND = os.getenv("BUS_BACKEND", "inprocess").lower()
+BUS_POSTGRES_DSN = os.getenv("BUS_POSTGRES_DSN") or os.getenv("DATABASE_URL")
+BUS_POSTGRES_CHANNEL = os.getenv("BUS_POSTGRES_CHANNEL", "ds_bus")
+BUS_BROKER_URL = os.getenv("BUS_BROKER_URL", "tcp://127.0.0.1:7390")
+BUS_MAX_PENDING = int(os.getenv("BUS_MAX_PENDING", "10000"))
+
+# NOTIFY payloads must be shorter than 8000 bytes
+POSTGRES_MAX_FRAME_BYTES = 7900
+BROKER_MAX_FRAME_BYTES = 64 * 1024
+# The broker stops writing to a client whose unsent backlog exceeds this
+BROKER_MAX_CLIENT_BACKLOG = 8 * 1024 * 1024
+
+RECONNECT_DELAY_SECONDS = 1.0
+LATENCY_SAMPLES = 1000
+
+# channel -> handler(key, payload), registered by the modules that own the
+# state (activity_stream, run_signals) and shared by every backend
+Handler = Callable[[str, Any], None]
+_handlers: dict[str, Handler] = {}
+
+
+def register(channel: str, handler: Handler) -> None:
+    """Apply remote messages on `channel` with `handler(key, payload)`."""
+    _handlers[channel] = handler
+
+
+class Bus:
+    """In-process bus: nothing to forward to."""
+
+    backend = "inprocess"
+    remote = False
+
+    def publish(self, channel: str, key: str, payload: Any) -> None:
+        """Forward a message to the other processes (no-op in-process)."""
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": self.backend}
+
+
+class RemoteBus(Bus, ABC):
+    """Outbox, framing, delivery and stats shared by the networked backends.
+
+    Subclasses implement _connect(), _send(frame) and _disconnect(), and
+    call _deliver(frame) for every frame received. Frames taken from the
+    outbox but not sent when the connection drops are sent first after
+    reconnecting.
+    """
+
+    remote = True
+    max_frame_bytes = BROKER_MAX_FRAME_BYTES
+
+    def __init__(
+        self,
+        handlers: dict[str, Handler] | None = None,
+        max_pending: int = BUS_MAX_PENDING,
+    ):
+        self.node_id = uuid.uuid4().hex[:12]
+        self.handlers = _handlers if handlers is None else handlers
+        self.max_pending = max_pending
+        self.connected = False
+        self._outbox: deque[tuple[str, str, Any, float]] = deque()
+        # Framed but not yet sent: (frame, number of messages in it)
+        self._unsent: deque[tuple[bytes, int]] = deque()
+        self._wakeup = asyncio.Event()
+        self._lost = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.published = 0
+        self.received = 0
+        self.dropped = 0
+        self.frames_sent = 0
+        self._publish_ns = 0
+        self._latencies_ms: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    # Publisher side (sync, on the caller's hot path)
+
+    def publish(self, channel: str, key: str, payload: Any) -> None:
+        started = time.perf_counter_ns()
+        if len(self._outbox) >= self.max_pending:
+            self.dropped += 1
+        else:
+            self._outbox.append((channel, key, payload, time.time()))
+            self.published += 1
+            self._wakeup.set()
+        self._publish_ns += time.perf_counter_ns() - started
+
+    # Connection lifecycle
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"bus-{self.backend}")
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._disconnect()
+        self.connected = False
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                self._lost.clear()
+                await self._connect()
+                self.connected = True
+                logger.info(f"Bus connected ({self.backend}, node {self.node_id})")
+                await self._pump()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Bus connection lost ({self.backend}): {e}")
+            self.connected = False
+            await self._disconnect()
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    async def _pump(self) -> None:
+        """Send outbox frames until the connection is lost."""
+        while not self._lost.is_set():
+            if not self._outbox and not self._unsent:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=1.0)
+                except TimeoutError:
+                    continue
+            self._unsent.extend(self._take_frames())
+            while self._unsent:
+                # Only dequeued once sent, so a failed send is retried
+                await self._send(self._unsent[0][0])
+                self._unsent.popleft()
+                self.frames_sent += 1
+        raise ConnectionError("connection closed")
+
+    def _take_frames(self) -> list[tuple[bytes, int]]:
+        """Drain the outbox into JSON array frames of at most max_frame_bytes.
+
+        Returns (frame, number of messages in it) pairs.
+        """
+        frames: list[tuple[bytes, int]] = []
+        parts: list[bytes] = []
+        size = 2
+        while self._outbox:
+            channel, key, payload, sent_at = self._outbox.popleft()
+            if not isinstance(payload, bytes):
+                payload = json.dumps(payload, separators=(",", ":"), default=str).encode()
+            head = json.dumps(
+                {"o": self.node_id, "c": channel, "k": key, "t": sent_at},
+                separators=(",", ":"),
+            )
+            part = b"".join((head[:-1].encode(), b',"p":', payload, b"}"))
+            if len(part) + 2 > self.max_frame_bytes:
+                self.dropped += 1
+                logger.warning(f"Bus message on {channel} for {key} too large, dropped")
+                continue
+            if parts and size + len(part) + 1 > self.max_frame_bytes:
+                frames.append((b"[" + b",".join(parts) + b"]", len(parts)))
+                parts, size = [], 2
+            parts.append(part)
+            size += len(part) + 1
+        if parts:
+            frames.append((b"[" + b",".join(parts) + b"]", len(parts)))
+        return frames
+
+    # Receiver side
+
+    def _deliver(self, frame: str | bytes) -> None:
+        try:
+            messages = json.loads(frame)
+        except ValueError:
+            logger.warning("Bus received a malformed frame")
+            return
+        now = time.time()
+        for message in messages:
+            if message.get("o") == self.node_id:
+                continue  # our own message (NOTIFY reaches the sender too)
+            self.received += 1
+            self._latencies_ms.append((now - message["t"]) * 1000)
+            handler = self.handlers.get(message["c"])
+            if handler is None:
+                continue
+            try:
+                handler(message["k"], message["p"])
+            except Exception:
+                logger.exception(f"Bus handler for {message['c']} failed")
+
+    def stats(self) -> dict[str, Any]:
+        latencies = sorted(self._latencies_ms)
+
+        def percentile(p: float) -> float | None:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 3)
+
+        return {
+            "backend": self.backend,
+            "node_id": self.node_id,
+            "connected": self.connected,
+            "published": self.published,
+            "received": self.received,
+            "dropped": self.dropped,
+            "pending": len(self._outbox) + sum(count for _, count in self._unsent),
+            "frames_sent": self.frames_sent,
+            "publish_overhead_us": (
+                round(self._publish_ns / self.published / 1000, 3) if self.published else None
+            ),
+            "delivery_latency_ms": {"p50": percentile(0.5), "p99": percentile(0.99)},
+        }
+
+    @abstractmethod
+    async def _connect(self) -> None:
+        """Open the connection and start receiving frames."""
+
+    @abstractmethod
+    async def _send(self, frame: bytes) -> None:
+        """Send one frame; raises if the connection is lost."""
+
+    @abstractmethod
+    async def _disconnect(self) -> None:
+        """Close the connection, if open."""
+
+
+class PostgresBus(RemoteBus):
+    """LISTEN/NOTIFY on one channel; frames are NOTIFY payloads."""
+
+    backend = "postgres"
+    max_frame_bytes = POSTGRES_MAX_FRAME_BYTES
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = BUS_POSTGRES_CHANNEL,
+        handlers: dict[str, Handler] | None = None,
+        max_pending: int = BUS_MAX_PENDING,
+    ):
+        super().__init__(handlers, max_pending)
+        self.dsn = dsn
+        self.channel = channel
+        self._conn = None
+
+    async def _connect(self) -> None:
+        import asyncpg
+
+        self._conn = await asyncpg.connect(self.dsn)
+        self._conn.add_termination_listener(lambda conn: self._lost.set())
+        await self._conn.add_listener(self.channel, self._on_notify)
+
+    def _on_notify(self, conn, pid: int, channel: str, payload: str) -> None:
+        self._deliver(payload)
+
+    async def _send(self, frame: bytes) -> None:
+        await self._conn.execute("SELECT pg_notify($1, $2)", self.channel, frame.decode())
+
+    async def _disconnect(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            try:
+                await conn.close(timeout=5)
+            except Exception:
+                conn.terminate()
+
+
+class TcpBus(RemoteBus):
+    """Client of the local broker (BusBroker); frames are newline-delimited."""
+
+    backend = "tcp"
+
+    def __init__(
+        self,
+        url: str = BUS_BROKER_URL,
+        handlers: dict[str, Handler] | None = None,
+        max_pending: int = BUS_MAX_PENDING,
+    ):
+        super().__init__(handlers, max_pending)
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 7390
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+
+    async def _connect(self) -> None:
+        reader, self._writer = await asyncio.open_connection(
+            self.host, self.port, limit=BROKER_MAX_FRAME_BYTES * 2
+        )
+        self._reader_task = asyncio.create_task(self._read(reader))
+
+    async def _read(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while line := await reader.readline():
+                self._deliver(line)
+        finally:
+            self._lost.set()
+            self._wakeup.set()
+
+    async def _send(self, frame: bytes) -> None:
+        self._writer.write(frame + b"\n")
+        await self._writer.drain()
+
+    async def _disconnect(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+
+class BusBroker:
+    """Relays every line a client sends to all other connected clients."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 7390):
+        self.host = host
+        self.port = port
+        self.clients: set[asyncio.StreamWriter] = set()
+        self._connections: set[asyncio.Task] = set()
+        self.relayed = 0
+        self.dropped = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, limit=BROKER_MAX_FRAME_BYTES * 2
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Bus broker listening on {self.host}:{self.port}")
+
+    @property
+    def url(self) -> str:
+        return f"tcp://{self.host}:{self.port}"
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self.clients):
+                writer.close()
+            # Let connection handlers see EOF and return rather than cancel them
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.clients.add(writer)
+        self._connections.add(asyncio.current_task())
+        try:
+            while line := await reader.readline():
+                for client in self.clients:
+                    if client is writer:
+                        continue
+                    if client.transport.get_write_buffer_size() > BROKER_MAX_CLIENT_BACKLOG:
+                        self.dropped += 1
+                        continue
+                    client.write(line)
+                    self.relayed += 1
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.clients.discard(writer)
+            self._connections.discard(asyncio.current_task())
+            writer.close()
+
+
+# ============================================================
+# Process-wide bus
+# ============================================================
+
+_bus: Bus = Bus()
+
+
+def get_bus() -> Bus:
+    """The bus in use (in-process until start_bus() configures another)."""
+    return _bus
+
+
+def create_bus(backend: str = BUS_BACKEND) -> Bus:
+    """Bus for a BUS_BACKEND value."""
+    if backend == "inprocess":
+        return Bus()
+    if backend == "postgres":
+        if not BUS_POSTGRES_DSN:
+            raise ValueError("BUS_BACKEND=postgres needs BUS_POSTGRES_DSN (or DATABASE_URL)")
+        return PostgresBus(BUS_POSTGRES_DSN)
+    if backend == "tcp":
+        return TcpBus(BUS_BROKER_URL)
+    raise ValueError(f"Unknown BUS_BACKEND '{backend}' (expected inprocess, postgres or tcp)")
+
+
+async def start_bus(bus: Bus | None = None) -> Bus:
+    """Start `bus`, or the configured one, as the process bus (app startup)."""
+    global _bus
+    _bus = bus or create_bus()
+    await _bus.start()
+    if _bus.remote:
+        logger.info(f"Activity and signal bus: {_bus.backend}")
+    return _bus
+
+
+async def stop_bus() -> None:
+    """Stop the bus and fall back to in-process (app shutdown)."""
+    global _bus
+    bus, _bus = _bus, Bus()
+    await bus.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the local activity/signal bus broker")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7390)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    async def serve() -> None:
+        broker = BusBroker(args.host, args.port)
+        await broker.start()
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,13 +9,23 @@ This module handles:
 
 import asyncio
 import logging
+import os
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import quote_plus
 from supabase import Client
 
-from app.services.scrapers import OxylabsAmazonScraper, OxylabsEbayScraper
+from app.services.scrapers import (
+    AmazonScraperService,
+    BatchDispatcher,
+    BestsellerRequest,
+    EbayScraperService,
+    SellerSearchRequest,
+    create_amazon_scraper,
+    create_ebay_scraper,
+    merge_pages,
+)
 from app.services.db_utils import (
     batched_query,
     batched_insert,
@@ -30,17 +40,52 @@ from app.services.parallel_runner import (
     create_activity_event,
     CollectionPausedException,
 )
+from app.services import run_progress
 from app.services.activity_stream import get_activity_stream
+from app.services.retry import RetryPolicy, backoff_sleep, get_circuit_breaker
+from app.services.run_metrics import RunMetrics, classify_outcome
 from app.services.run_signals import is_paused_or_cancelled, is_cancelled, clear_signal
 
 logger = logging.getLogger(__name__)
 
+# Best-seller pages fetched per category. Pages are separate runner tasks, so
+# extra pages are fetched in parallel within the same worker limit.
+AMAZON_PAGES_PER_CATEGORY = max(1, int(os.getenv("AMAZON_PAGES_PER_CATEGORY", "1")))
+
+# Runner workers per phase (0 = the scraper's max_concurrency). Workers submit
+# requests through the scraper's fetch_many / search_many, which bound the
+# upstream requests in flight to max_concurrency on their own, so this only
+# sets how many tasks (retries, backoffs, DB writes) progress at once.
+COLLECTION_WORKERS = int(os.getenv("COLLECTION_WORKERS", "0"))
+
+
+def runner_workers(scraper: AmazonScraperService | EbayScraperService) -> int:
+    return COLLECTION_WORKERS if COLLECTION_WORKERS > 0 else scraper.max_concurrency
+
 
 class CollectionService:
     """Orchestrates collection runs with checkpointing."""
 
-    def __init__(self, supabase: Client):
+    def __init__(
+        self,
+        supabase: Client,
+        amazon_scraper: AmazonScraperService | None = None,
+        ebay_scraper: EbayScraperService | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        """
+        Args:
+            supabase: Supabase client
+            amazon_scraper: Scraper to use instead of the configured backend
+                (benchmarks, tests). Defaults to create_amazon_scraper().
+            ebay_scraper: Same for the eBay phase. Defaults to create_ebay_scraper().
+            retry_policy: Retry schedule for failed scraper calls. Defaults to
+                RetryPolicy() (see services/retry.py).
+        """
         self.supabase = supabase
+        self.amazon_scraper = amazon_scraper
+        self.ebay_scraper = ebay_scraper
+        self.retry_policy = retry_policy or RetryPolicy()
 
     async def get_settings(self, org_id: str) -> dict:
         """Get or create collection settings for an org."""
@@ -187,7 +232,7 @@ class CollectionService:
                 "started_at, completed_at, "
                 "products_total, products_searched, "
                 "sellers_found, sellers_new, "
-                "failed_items, created_by, seller_count_snapshot",
+                "failed_items, created_by, seller_count_snapshot, metrics",
                 count="exact"
             )
             .eq("org_id", org_id)
@@ -221,6 +266,7 @@ class CollectionService:
                 "failed_items": r.get("failed_items") or 0,
                 "created_by": r["created_by"],
                 "seller_count_snapshot": r.get("seller_count_snapshot"),
+                "metrics": r.get("metrics"),
             })
 
         return runs, result.count or 0
@@ -248,12 +294,11 @@ class CollectionService:
         """Pause a running collection."""
         run = await self.get_run(run_id, org_id)
         if not run:
-            print(f"[PAUSE-SVC] Run {run_id} not found")
+            logger.info(f"Pause requested for unknown run {run_id}")
             return {"error": "not_found", "message": "Run not found"}
 
-        print(f"[PAUSE-SVC] Run {run_id} current status: {run['status']}")
         if run["status"] != "running":
-            print(f"[PAUSE-SVC] Cannot pause - status is {run['status']}")
+            logger.info(f"Cannot pause run {run_id} - status is {run['status']}")
             return {"error": "invalid_status", "message": f"Cannot pause run in {run['status']} status"}
 
         now = datetime.now(timezone.utc).isoformat()
@@ -263,20 +308,18 @@ class CollectionService:
             "updated_at": now,
         }).eq("id", run_id).execute()
 
-        print(f"[PAUSE-SVC] DB update executed, affected rows: {len(result.data) if result.data else 0}")
-        logger.info(f"Paused collection run {run_id}")
+        logger.info(f"Paused collection run {run_id} ({len(result.data) if result.data else 0} rows updated)")
         return {"ok": True, "status": "paused"}
 
     async def resume_run(self, run_id: str, org_id: str) -> dict:
         """Resume a paused collection."""
         run = await self.get_run(run_id, org_id)
         if not run:
-            print(f"[RESUME-SVC] Run {run_id} not found")
+            logger.info(f"Resume requested for unknown run {run_id}")
             return {"error": "not_found", "message": "Run not found"}
 
-        print(f"[RESUME-SVC] Run {run_id} current status: {run['status']}")
         if run["status"] != "paused":
-            print(f"[RESUME-SVC] Cannot resume - status is {run['status']}")
+            logger.info(f"Cannot resume run {run_id} - status is {run['status']}")
             return {"error": "invalid_status", "message": f"Cannot resume run in {run['status']} status"}
 
         now = datetime.now(timezone.utc).isoformat()
@@ -286,8 +329,7 @@ class CollectionService:
             "updated_at": now,
         }).eq("id", run_id).execute()
 
-        print(f"[RESUME-SVC] DB update executed, affected rows: {len(result.data) if result.data else 0}")
-        logger.info(f"Resumed collection run {run_id}")
+        logger.info(f"Resumed collection run {run_id} ({len(result.data) if result.data else 0} rows updated)")
         return {"ok": True, "status": "running"}
 
     async def cancel_run(self, run_id: str, org_id: str) -> dict:
@@ -1237,7 +1279,18 @@ class CollectionService:
     # ============================================================
 
     async def get_enhanced_progress(self, org_id: str, run_id: str) -> dict:
-        """Get detailed progress for a collection run."""
+        """Get detailed progress for a collection run.
+
+        Served from the in-memory snapshot while the run's workers execute in
+        this process; read from collection_runs otherwise.
+        """
+        local = run_progress.get_local_progress(run_id, org_id)
+        if local is not None:
+            return local.snapshot()
+        return run_progress.progress_fields(await self._load_progress_row(org_id, run_id))
+
+    async def _load_progress_row(self, org_id: str, run_id: str) -> dict:
+        """Progress columns of a run from collection_runs."""
         result = (
             self.supabase.table("collection_runs")
             .select(
@@ -1245,7 +1298,7 @@ class CollectionService:
                 "categories_total, categories_completed, "
                 "products_total, products_searched, "
                 "sellers_found, sellers_new, "
-                "worker_status, checkpoint, started_at"
+                "worker_status, checkpoint, started_at, status"
             )
             .eq("id", run_id)
             .eq("org_id", org_id)
@@ -1255,24 +1308,22 @@ class CollectionService:
         if not result.data:
             raise ValueError("Run not found")
 
-        data = result.data[0]
+        return result.data[0]
 
-        # Determine phase from checkpoint
-        checkpoint = data.get("checkpoint") or {}
-        checkpoint_phase = checkpoint.get("phase", "")
-        if checkpoint_phase == "ebay_search" or checkpoint_phase == "amazon_complete":
-            phase = "ebay"
-        else:
-            phase = "amazon"
+    # ============================================================
+    # Run Lifecycle
+    # ============================================================
 
-        # products_found is products_total during Amazon phase
-        products_found = data.get("products_total") or 0
+    async def release_run(self, run_id: str) -> None:
+        """Drop a finished run's in-memory state (signal, activity stream, progress).
 
-        return {
-            **data,
-            "phase": phase,
-            "products_found": products_found,
-        }
+        Called when a run completes, fails or is cancelled. Paused runs keep
+        both until resumed; runs that die with the process are left to the
+        runtime sweeper's TTL.
+        """
+        await clear_signal(run_id)
+        get_activity_stream().cleanup(run_id)
+        run_progress.release(run_id)
 
     # ============================================================
     # Amazon Collection Execution
@@ -1287,7 +1338,10 @@ class CollectionService:
         """
         Execute Amazon best sellers collection for selected categories.
 
-        Uses ParallelCollectionRunner with 5 workers for concurrent execution.
+        Uses ParallelCollectionRunner (runner_workers()) for concurrent
+        execution; workers' requests go through scraper.fetch_many, which
+        keeps up to max_concurrency of them in flight. Each category page (AMAZON_PAGES_PER_CATEGORY) is its own task; pages
+        are merged per category with merge_pages before saving.
         Emits activity events for SSE streaming.
 
         Args:
@@ -1299,7 +1353,6 @@ class CollectionService:
             dict with status, products_fetched, errors
         """
         import json
-        import uuid
 
         # Load category data to get node IDs
         categories_path = Path(__file__).parent.parent / "data" / "amazon_categories.json"
@@ -1332,7 +1385,6 @@ class CollectionService:
             resume_from_idx = checkpoint["categories_completed"]
             products_fetched = checkpoint.get("products_fetched", 0)
             logger.info(f"Resuming Amazon collection from category {resume_from_idx + 1}/{categories_total}")
-            print(f"\n[COLLECTION] Resuming from category {resume_from_idx + 1}/{categories_total}")
         else:
             # Fresh start - reset counters
             self.supabase.table("collection_runs").update({
@@ -1345,44 +1397,63 @@ class CollectionService:
 
         # Initialize scraper
         try:
-            scraper = OxylabsAmazonScraper()
+            scraper = self.amazon_scraper or create_amazon_scraper()
         except ValueError as e:
             logger.error(f"Scraper initialization failed: {e}")
+            await self.release_run(run_id)
             return {
                 "status": "failed",
-                "error": "Oxylabs credentials not configured",
+                "error": "Scraper backend not configured",
                 "products_fetched": 0,
             }
 
+        # Per-run request accounting (merged with totals from before a pause)
+        metrics = RunMetrics.from_dict(run_data.get("metrics"))
+        scraper.metrics = metrics
+
+        # Retry schedule, and the breaker shared by every worker on this source
+        retry_policy = self.retry_policy
+        breaker = get_circuit_breaker("amazon")
+
         # Track errors
         errors: list[dict] = []
 
         # Log collection start
-        print(f"\n{'#'*60}")
-        print(f"[COLLECTION] {'Resuming' if resume_from_idx > 0 else 'Starting'} Amazon Best Sellers Collection (PARALLEL)")
-        print(f"[COLLECTION] Run ID: {run_id}")
-        print(f"[COLLECTION] Departments: {departments_total}")
-        print(f"[COLLECTION] Categories: {categories_total} ({resume_from_idx} already done)")
-        print(f"[COLLECTION] Workers: 5")
-        print(f"{'#'*60}")
+        logger.info(
+            f"{'Resuming' if resume_from_idx > 0 else 'Starting'} Amazon best sellers collection "
+            f"for run {run_id}: {departments_total} departments, {categories_total} categories "
+            f"({resume_from_idx} already done), {AMAZON_PAGES_PER_CATEGORY} page(s) per category, "
+            f"{runner_workers(scraper)} workers, {scraper.max_concurrency} concurrent requests"
+        )
 
-        # Set up activity streaming
-        activity_manager = get_activity_stream()
+        # Set up activity streaming: resolve the run's stream once and
+        # publish synchronously (no task or lock per event)
+        activity_stream = get_activity_stream().get_or_create(run_id)
 
         def emit_activity(event):
-            """Push activity event to SSE stream."""
-            asyncio.create_task(activity_manager.push(run_id, event.to_dict()))
+            """Publish activity event to SSE stream."""
+            activity_stream.publish(event)
+
+        # Serve progress from memory while the workers run (seeded once from the DB)
+        progress = run_progress.track(run_id, org_id, await self._load_progress_row(org_id, run_id))
 
         # Create parallel runner
         runner = ParallelCollectionRunner(
-            max_workers=6,
+            max_workers=runner_workers(scraper),
             on_activity=emit_activity,
+            metrics=metrics,
+            run_id=run_id,
         )
 
+        # Single-request front end to scraper.fetch_many for the workers
+        batch = BatchDispatcher(scraper.fetch_many)
+
         # Shared counters for real-time progress
         shared_categories_completed = 0
         shared_products_found = 0
         amazon_progress_lock = asyncio.Lock()
+        # cat_id -> page tasks not yet finished (a category completes with its last page)
+        pages_remaining: dict[str, int] = {}
 
         # Instant cancellation check using in-memory signal registry
         # No database polling needed - API endpoints set signals directly
@@ -1390,97 +1461,137 @@ class CollectionService:
             """Check if run was cancelled/paused. INSTANT - uses in-memory signal registry."""
             # Check 1: Another worker already detected and set the runner flag
             if runner.is_cancelled:
-                print(f"[WORKER] Detected runner.is_cancelled=True at {context}")
+                logger.debug(f"Runner already cancelled at {context}")
                 raise CollectionPausedException(f"Run cancelled: {context}")
 
             # Check 2: Signal registry (set by API endpoints - instant, no DB call)
             if is_paused_or_cancelled(run_id):
-                print(f"[WORKER] Detected signal for run {run_id} at {context} - stopping")
+                logger.info(f"Stop signal for run {run_id} detected at {context}")
                 runner.cancel()  # Signal other workers via runner flag
                 raise CollectionPausedException(f"Run signaled to stop: {context}")
 
         async def update_amazon_progress_in_db():
-            """Write current Amazon phase progress to database for frontend polling."""
+            """Publish current Amazon phase progress and write it to the database."""
+            counters = {
+                "categories_completed": resume_from_idx + shared_categories_completed,
+                "products_total": products_fetched + shared_products_found,
+            }
+            progress.update(**counters)
             async with amazon_progress_lock:
                 self.supabase.table("collection_runs").update({
-                    "categories_completed": resume_from_idx + shared_categories_completed,
-                    "products_total": products_fetched + shared_products_found,
+                    **counters,
                     "updated_at": datetime.now(timezone.utc).isoformat(),
                 }).eq("id", run_id).execute()
 
-        # Define the task processing function
-        async def process_category(task: dict, worker_id: int) -> dict:
-            """Process a single category - called by parallel worker."""
+        async def finish_page(cat_id: str, products_found: int) -> None:
+            """Count a finished page; the category completes with its last page."""
             nonlocal shared_categories_completed, shared_products_found
 
+            # Skip if cancelled to avoid race conditions
+            if runner.is_cancelled:
+                return
+            pages_remaining[cat_id] -= 1
+            if pages_remaining[cat_id] == 0:
+                shared_categories_completed += 1
+            shared_products_found += products_found
+            await update_amazon_progress_in_db()
+
+        # Define the task processing function
+        async def process_category(task: dict, worker_id: int) -> dict:
+            """Process one page of a category - called by parallel worker."""
             cat_id = task["cat_id"]
             node_id = task["node_id"]
             category_name = task["category_name"]
+            page = task["page"]
 
             # FIRST: Check if paused/cancelled BEFORE doing ANY work
             await check_cancelled_throttled("before category processing")
 
-            # Retry logic (3 attempts)
-            for attempt_num in range(3):
+            # Retries follow the per-error-class policy; the circuit breaker
+            # parks every worker while Amazon is failing or rate limiting
+            attempt_num = 0
+            while True:
+                attempt_num += 1
+                await runner.interruptible(
+                    breaker.wait_ready(lambda: check_cancelled_throttled("circuit open")),
+                    "circuit open",
+                )
+
                 # Emit fetching activity with api_params and attempt
                 await runner.emit_activity(create_activity_event(
                     worker_id=worker_id,
                     phase="amazon",
                     action="fetching",
                     category=category_name,
-                    api_params={"node_id": node_id},
-                    attempt=attempt_num + 1,
+                    api_params={"node_id": node_id, "page": page},
+                    attempt=attempt_num,
                 ))
-                print(f"[W{worker_id}] Fetching: {category_name}" + (f" (attempt {attempt_num + 1})" if attempt_num > 0 else ""))
+                logger.info(f"Fetching: {category_name} (page {page})" + (f" (attempt {attempt_num})" if attempt_num > 1 else ""))
 
                 # Check before API call (includes DB check for fast cancel detection)
                 await check_cancelled_throttled("before API call")
 
                 # Track request timing
                 request_start = time.time()
-                result = await scraper.fetch_bestsellers(node_id, category_name=category_name)
+                # Abandoned (request aborted) as soon as the run is paused/cancelled
+                result = await runner.interruptible(
+                    batch.submit(BestsellerRequest(node_id, page, category_name)), "API call"
+                )
                 duration_ms = int((time.time() - request_start) * 1000)
+                outcome = classify_outcome(result.error)
+                metrics.record_attempt("amazon", attempt_num, outcome)
+                if breaker.record(outcome, result.retry_after):
+                    metrics.record_circuit_open("amazon")
 
                 # Check after API call (includes DB check for fast cancel detection)
                 await check_cancelled_throttled("after API call")
 
-                if result.error == "rate_limited":
-                    await runner.emit_activity(create_activity_event(
-                        worker_id=worker_id,
-                        phase="amazon",
-                        action="rate_limited",
-                        category=category_name,
-                        duration_ms=duration_ms,
-                        error_type="rate_limit",
-                        error_stage="api",
-                        attempt=attempt_num + 1,
-                    ))
-                    print(f"[W{worker_id}] Rate limited, waiting 5s...")
-                    # Check during wait - check DB every second for fast cancel response
-                    for i in range(10):
-                        if i % 2 == 0:  # Check DB every 1 second
-                            await check_cancelled_throttled("during rate limit wait")
-                        await asyncio.sleep(0.5)
-                    continue
-
                 if result.error:
-                    # Classify error type
-                    error_type = "timeout" if "timeout" in result.error.lower() else (
-                        "http_500" if "http" in result.error.lower() or "500" in result.error else "api_error"
+                    delay = retry_policy.next_delay(outcome, attempt_num, result.retry_after)
+                    if result.error == "rate_limited":
+                        await runner.emit_activity(create_activity_event(
+                            worker_id=worker_id,
+                            phase="amazon",
+                            action="rate_limited",
+                            category=category_name,
+                            duration_ms=duration_ms,
+                            error_type="rate_limit",
+                            error_stage="api",
+                            attempt=attempt_num,
+                        ))
+                        if delay is None:
+                            # Max retries reached
+                            await finish_page(cat_id, 0)
+                            return {"cat_id": cat_id, "page": page, "error": "max_retries"}
+                    else:
+                        # Classify error type
+                        error_type = "timeout" if "timeout" in result.error.lower() else (
+                            "http_500" if "http" in result.error.lower() or "500" in result.error else "api_error"
+                        )
+                        await runner.emit_activity(create_activity_event(
+                            worker_id=worker_id,
+                            phase="amazon",
+                            action="error",
+                            category=category_name,
+                            error_message=result.error,
+                            error_type=error_type,
+                            error_stage="api",
+                            duration_ms=duration_ms,
+                            attempt=attempt_num,
+                        ))
+                        if delay is None:
+                            logger.warning(f"Error fetching {category_name} (page {page}): {result.error}")
+                            await finish_page(cat_id, 0)
+                            raise Exception(result.error)
+
+                    logger.info(f"{result.error}, retrying in {delay:.1f}s")
+                    metrics.record_backoff("amazon", delay)
+                    # Check during wait for fast pause/cancel response
+                    await runner.interruptible(
+                        backoff_sleep(delay, lambda: check_cancelled_throttled("during retry backoff")),
+                        "retry backoff",
                     )
-                    await runner.emit_activity(create_activity_event(
-                        worker_id=worker_id,
-                        phase="amazon",
-                        action="error",
-                        category=category_name,
-                        error_message=result.error,
-                        error_type=error_type,
-                        error_stage="api",
-                        duration_ms=duration_ms,
-                        attempt=attempt_num + 1,
-                    ))
-                    print(f"[W{worker_id}] Error: {result.error}")
-                    raise Exception(result.error)
+                    continue
 
                 # Success - emit found event with duration
                 await runner.emit_activity(create_activity_event(
@@ -1491,27 +1602,17 @@ class CollectionService:
                     new_sellers_count=len(result.products),  # Reusing field for product count
                     duration_ms=duration_ms,
                 ))
-                print(f"[W{worker_id}] Found {len(result.products)} products in {category_name}")
+                logger.info(f"Found {len(result.products)} products in {category_name} (page {page})")
 
                 # Update shared counters and sync to DB for real-time progress
-                # (skip if cancelled to avoid race conditions)
-                if not runner.is_cancelled:
-                    shared_categories_completed += 1
-                    shared_products_found += len(result.products)
-                    await update_amazon_progress_in_db()
+                await finish_page(cat_id, len(result.products))
 
                 return {
                     "cat_id": cat_id,
-                    "products": result.products,
+                    "page_result": result,
                     "category_name": category_name,
                 }
 
-            # Max retries reached
-            if not runner.is_cancelled:
-                shared_categories_completed += 1
-                await update_amazon_progress_in_db()
-            return {"cat_id": cat_id, "products": [], "error": "max_retries"}
-
         # Prepare tasks list (skip already-processed when resuming)
         tasks = []
         for idx, cat_id in enumerate(category_ids):
@@ -1522,32 +1623,52 @@ class CollectionService:
                 logger.warning(f"Unknown category ID: {cat_id}")
                 errors.append({"category": cat_id, "error": "unknown_category"})
                 continue
-            tasks.append({
-                "cat_id": cat_id,
-                "node_id": node_id,
-                "category_name": name_lookup.get(cat_id, cat_id),
-            })
+            pages_remaining[cat_id] = AMAZON_PAGES_PER_CATEGORY
+            for page in range(1, AMAZON_PAGES_PER_CATEGORY + 1):
+                tasks.append({
+                    "cat_id": cat_id,
+                    "node_id": node_id,
+                    "category_name": name_lookup.get(cat_id, cat_id),
+                    "page": page,
+                })
 
         # Execute parallel
         try:
-            results = await runner.run(tasks, process_category, phase="amazon")
+            async with batch:
+                results = await runner.run(tasks, process_category, phase="amazon")
         except CollectionPausedException:
             action = "CANCELLED" if is_cancelled(run_id) else "PAUSED"
-            print(f"\n[COLLECTION] Run {action} - stopping Amazon collection")
-            return {"status": "paused" if not is_cancelled(run_id) else "cancelled", "products_fetched": products_fetched}
-
-        # Process results and save to database
+            logger.info(f"Run {run_id} {action} - stopping Amazon collection")
+            self.supabase.table("collection_runs").update({
+                "metrics": metrics.to_dict(),
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            }).eq("id", run_id).execute()
+            if is_cancelled(run_id):
+                await self.release_run(run_id)
+                return {"status": "cancelled", "products_fetched": products_fetched}
+            return {"status": "paused", "products_fetched": products_fetched}
+        finally:
+            # Workers stopped: progress readers go back to collection_runs
+            run_progress.release(run_id)
+
+        # Merge each category's pages (dedupe by ASIN, renumber positions)
+        category_pages: dict[str, list] = {}
+        category_names: dict[str, str] = {}
         for result in results:
             if "error" in result:
-                errors.append({"category": result["cat_id"], "error": result["error"]})
+                errors.append({"category": result["cat_id"], "page": result["page"], "error": result["error"]})
                 continue
+            category_pages.setdefault(result["cat_id"], []).append(result["page_result"])
+            category_names[result["cat_id"]] = result["category_name"]
 
-            cat_id = result["cat_id"]
-            products_fetched += len(result["products"])
+        # Process results and save to database
+        for cat_id, pages in category_pages.items():
+            products = merge_pages(pages)
+            products_fetched += len(products)
 
             # Save products as collection items (batch for efficiency)
             items_to_insert = []
-            for product in result["products"]:
+            for product in products:
                 items_to_insert.append({
                     "run_id": run_id,
                     "item_type": "amazon_product",
@@ -1573,7 +1694,7 @@ class CollectionService:
                     action="uploading",
                     items_count=len(items_to_insert),
                     operation_type="product_batch",
-                    category=result.get("category_name"),
+                    category=category_names[cat_id],
                 ))
 
         # Update progress - set to 100% complete for Amazon phase
@@ -1591,27 +1712,21 @@ class CollectionService:
             },
             "processed_items": products_fetched,
             "failed_items": len(errors),
+            "metrics": metrics.to_dict(),
             "updated_at": now,
         }).eq("id", run_id).execute()
 
         # Emit phase complete activity
-        await activity_manager.push(run_id, {
-            "id": str(uuid.uuid4()),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "worker_id": 0,  # 0 = system message
-            "phase": "amazon",
-            "action": "complete",
-        })
-
-        logger.info(f"Amazon collection complete: {products_fetched} products fetched")
-
-        print(f"\n{'#'*60}")
-        print(f"[COLLECTION] Amazon Phase Complete!")
-        print(f"[COLLECTION] Departments: {departments_total}/{departments_total}")
-        print(f"[COLLECTION] Categories: {categories_total}/{categories_total}")
-        print(f"[COLLECTION] Total Products Fetched: {products_fetched}")
-        print(f"[COLLECTION] Errors: {len(errors)}")
-        print(f"{'#'*60}")
+        activity_stream.publish(create_activity_event(
+            worker_id=0,  # 0 = system message
+            phase="amazon",
+            action="complete",
+        ))
+
+        logger.info(
+            f"Amazon collection complete for run {run_id}: {products_fetched} products fetched "
+            f"from {categories_total} categories, {len(errors)} errors"
+        )
 
         return {
             "status": "completed",
@@ -1631,7 +1746,9 @@ class CollectionService:
         """
         Execute eBay seller search for Amazon products in a collection run.
 
-        Uses ParallelCollectionRunner with 5 workers for concurrent execution.
+        Uses ParallelCollectionRunner (runner_workers()) for concurrent
+        execution; workers' searches go through scraper.search_many, which
+        keeps up to max_concurrency of them in flight.
         Emits activity events for SSE streaming.
         Stores seller count snapshot on completion.
 
@@ -1643,7 +1760,6 @@ class CollectionService:
             dict with status, sellers_found, sellers_new
         """
         import json
-        import uuid
 
         # Get Amazon products from collection_items
         products_result = (
@@ -1657,6 +1773,7 @@ class CollectionService:
         products = products_result.data or []
         if not products:
             logger.info(f"No Amazon products to search for run {run_id}")
+            await self.release_run(run_id)
             return {
                 "status": "completed",
                 "message": "No Amazon products to search",
@@ -1692,12 +1809,13 @@ class CollectionService:
 
         # Initialize eBay scraper
         try:
-            scraper = OxylabsEbayScraper()
+            scraper = self.ebay_scraper or create_ebay_scraper()
         except ValueError as e:
             logger.error(f"eBay scraper initialization failed: {e}")
+            await self.release_run(run_id)
             return {
                 "status": "failed",
-                "error": "Oxylabs credentials not configured",
+                "error": "Scraper backend not configured",
                 "sellers_found": 0,
                 "sellers_new": 0,
             }
@@ -1715,13 +1833,20 @@ class CollectionService:
 
         total_products = len(products)
 
+        # Per-run request accounting (carries over the Amazon phase totals)
+        metrics = RunMetrics.from_dict(run_data.get("metrics"))
+        scraper.metrics = metrics
+
+        # Retry schedule, and the breaker shared by every worker on this source
+        retry_policy = self.retry_policy
+        breaker = get_circuit_breaker("ebay")
+
         if checkpoint.get("phase") == "ebay_search" and checkpoint.get("products_processed"):
             # Resuming - skip already searched products
             resume_from_idx = checkpoint["products_processed"]
             sellers_found = run_data.get("sellers_found", 0)
             sellers_new = run_data.get("sellers_new", 0)
             logger.info(f"Resuming eBay search from product {resume_from_idx + 1}/{total_products}")
-            print(f"\n[COLLECTION] Resuming from product {resume_from_idx + 1}/{total_products}")
         else:
             # Fresh start - reset progress for eBay phase
             self.supabase.table("collection_runs").update({
@@ -1738,30 +1863,35 @@ class CollectionService:
                 "updated_at": datetime.now(timezone.utc).isoformat(),
             }).eq("id", run_id).execute()
 
-        logger.info(f"{'Resuming' if resume_from_idx > 0 else 'Starting'} eBay seller search for {total_products} products")
-
-        print(f"\n{'#'*60}")
-        print(f"[COLLECTION] {'Resuming' if resume_from_idx > 0 else 'Starting'} eBay Seller Search Phase (PARALLEL)")
-        print(f"[COLLECTION] Run ID: {run_id}")
-        print(f"[COLLECTION] Products to Search: {total_products} ({resume_from_idx} already done)")
-        print(f"[COLLECTION] Categories: {categories_total}")
-        print(f"[COLLECTION] Departments: {departments_total}")
-        print(f"[COLLECTION] Workers: 5")
-        print(f"{'#'*60}")
+        logger.info(
+            f"{'Resuming' if resume_from_idx > 0 else 'Starting'} eBay seller search for run {run_id}: "
+            f"{total_products} products ({resume_from_idx} already done), "
+            f"{categories_total} categories, {departments_total} departments, "
+            f"{runner_workers(scraper)} workers, {scraper.max_concurrency} concurrent requests"
+        )
 
-        # Set up activity streaming
-        activity_manager = get_activity_stream()
+        # Set up activity streaming: resolve the run's stream once and
+        # publish synchronously (no task or lock per event)
+        activity_stream = get_activity_stream().get_or_create(run_id)
 
         def emit_activity(event):
-            """Push activity event to SSE stream."""
-            asyncio.create_task(activity_manager.push(run_id, event.to_dict()))
+            """Publish activity event to SSE stream."""
+            activity_stream.publish(event)
+
+        # Serve progress from memory while the workers run (seeded once from the DB)
+        progress = run_progress.track(run_id, org_id, await self._load_progress_row(org_id, run_id))
 
         # Create parallel runner
         runner = ParallelCollectionRunner(
-            max_workers=6,
+            max_workers=runner_workers(scraper),
             on_activity=emit_activity,
+            metrics=metrics,
+            run_id=run_id,
         )
 
+        # Single-request front end to scraper.search_many for the workers
+        batch = BatchDispatcher(scraper.search_many)
+
         # Shared counters for real-time tracking (updated by workers)
         # Using nonlocal to allow workers to update these
         shared_sellers_found = 0
@@ -1775,22 +1905,26 @@ class CollectionService:
             """Check if run was cancelled/paused. INSTANT - uses in-memory signal registry."""
             # Check 1: Another worker already detected and set the runner flag
             if runner.is_cancelled:
-                print(f"[WORKER] Detected runner.is_cancelled=True at {context}")
+                logger.debug(f"Runner already cancelled at {context}")
                 raise CollectionPausedException(f"Run cancelled: {context}")
 
             # Check 2: Signal registry (set by API endpoints - instant, no DB call)
             if is_paused_or_cancelled(run_id):
-                print(f"[WORKER] Detected signal for run {run_id} at {context} - stopping")
+                logger.info(f"Stop signal for run {run_id} detected at {context}")
                 runner.cancel()  # Signal other workers via runner flag
                 raise CollectionPausedException(f"Run signaled to stop: {context}")
 
         async def update_progress_in_db():
-            """Write current progress to database for frontend polling."""
+            """Publish current progress and write it to the database."""
+            counters = {
+                "products_searched": resume_from_idx + shared_products_searched,
+                "sellers_found": sellers_found + shared_sellers_found,
+                "sellers_new": sellers_new + shared_sellers_new,
+            }
+            progress.update(**counters)
             async with progress_lock:
                 self.supabase.table("collection_runs").update({
-                    "products_searched": resume_from_idx + shared_products_searched,
-                    "sellers_found": sellers_found + shared_sellers_found,
-                    "sellers_new": sellers_new + shared_sellers_new,
+                    **counters,
                     "updated_at": datetime.now(timezone.utc).isoformat(),
                 }).eq("id", run_id).execute()
 
@@ -1839,96 +1973,122 @@ class CollectionService:
             total_duration_ms = 0
 
             # Search 3 pages per product
-            for page in range(1, PAGES_PER_PRODUCT + 1):
-                # Build URL for display (same logic as scraper)
-                ebay_url = f"https://www.ebay.com/sch/i.html?_nkw={quote_plus(title)}&LH_ItemCondition=1000&LH_Free=1&LH_PrefLoc=1&_udlo={price_min_dollars}&_udhi={price_max_dollars}&_ipg=60&_pgn={page}"
-
-                # Retry logic (3 attempts) - same as Amazon phase
-                page_success = False
-                for attempt_num in range(3):
-                    # Emit fetching activity with api_params, URL, and attempt
-                    await runner.emit_activity(create_activity_event(
-                        worker_id=worker_id,
-                        phase="ebay",
-                        action="fetching",
-                        category=cat_name,
-                        product_name=short_title,
-                        api_params={
-                            "query": title[:50],  # Truncate for readability
-                            "amazon_price": amazon_price_cents,  # Amazon price in cents
-                            "price_min": price_min_cents,  # eBay min price in cents (80% markup)
-                            "price_max": price_max_cents,  # eBay max price in cents (120% markup)
-                            "page": page,
-                        },
-                        attempt=attempt_num + 1,
-                        url=ebay_url,
-                    ))
-                    print(f"[W{worker_id}] Searching: {short_title} (page {page})" + (f" (attempt {attempt_num + 1})" if attempt_num > 0 else ""))
-
-                    # Check before API call
-                    await check_cancelled_throttled("before API call")
-
-                    # Track request timing
-                    request_start = time.time()
-                    result = await scraper.search_sellers(title, price, page)
-                    duration_ms = int((time.time() - request_start) * 1000)
-                    total_duration_ms += duration_ms
-
-                    # Check after API call (which can take 10-90 seconds)
-                    await check_cancelled_throttled("after API call")
+            # A pause/cancel stops the search mid-product but keeps the pages
+            # already fetched: their sellers are saved below before exiting
+            interrupted: CollectionPausedException | None = None
+            try:
+                for page in range(1, PAGES_PER_PRODUCT + 1):
+                    # Build URL for display (same logic as scraper)
+                    ebay_url = f"https://www.ebay.com/sch/i.html?_nkw={quote_plus(title)}&LH_ItemCondition=1000&LH_Free=1&LH_PrefLoc=1&_udlo={price_min_dollars}&_udhi={price_max_dollars}&_ipg=60&_pgn={page}"
+
+                    # Retries follow the per-error-class policy - same as Amazon phase
+                    page_success = False
+                    attempt_num = 0
+                    while True:
+                        attempt_num += 1
+                        await runner.interruptible(
+                            breaker.wait_ready(lambda: check_cancelled_throttled("circuit open")),
+                            "circuit open",
+                        )
 
-                    if result.error == "rate_limited":
+                        # Emit fetching activity with api_params, URL, and attempt
                         await runner.emit_activity(create_activity_event(
                             worker_id=worker_id,
                             phase="ebay",
-                            action="rate_limited",
+                            action="fetching",
+                            category=cat_name,
                             product_name=short_title,
-                            duration_ms=duration_ms,
-                            error_type="rate_limit",
-                            error_stage="api",
-                            attempt=attempt_num + 1,
+                            api_params={
+                                "query": title[:50],  # Truncate for readability
+                                "amazon_price": amazon_price_cents,  # Amazon price in cents
+                                "price_min": price_min_cents,  # eBay min price in cents (80% markup)
+                                "price_max": price_max_cents,  # eBay max price in cents (120% markup)
+                                "page": page,
+                            },
+                            attempt=attempt_num,
+                            url=ebay_url,
                         ))
-                        print(f"[W{worker_id}] Rate limited, waiting 5s...")
-                        # Check during wait - check DB every second for fast cancel response
-                        for i in range(10):
-                            if i % 2 == 0:  # Check DB every 1 second (every 2 iterations)
-                                await check_cancelled_throttled("during rate limit wait")
-                            await asyncio.sleep(0.5)
-                        continue  # Retry this page
-
-                    if result.error:
-                        # Classify error type
-                        error_type = "timeout" if "timeout" in result.error.lower() else (
-                            "http_500" if "http" in result.error.lower() or "500" in result.error else "api_error"
-                        )
-                        await runner.emit_activity(create_activity_event(
-                            worker_id=worker_id,
-                            phase="ebay",
-                            action="error",
-                            product_name=short_title,
-                            error_message=result.error,
-                            error_type=error_type,
-                            error_stage="api",
-                            duration_ms=duration_ms,
-                            attempt=attempt_num + 1,
-                        ))
-                        print(f"[W{worker_id}] Error: {result.error}" + (f" (attempt {attempt_num + 1})" if attempt_num > 0 else ""))
-                        raise Exception(result.error)
-
-                    # Success - break out of retry loop
-                    all_sellers.extend(result.sellers)
-                    page_success = True
-                    break
-
-                # If all retries failed (only happens with rate limits), skip remaining pages
-                if not page_success:
-                    print(f"[W{worker_id}] Max retries reached for page {page}, skipping remaining pages")
-                    break
+                        logger.info(f"Searching: {short_title} (page {page})" + (f" (attempt {attempt_num})" if attempt_num > 1 else ""))
 
-                if not result.has_more:
-                    break
+                        # Check before API call
+                        await check_cancelled_throttled("before API call")
 
-                await asyncio.sleep(REQUEST_DELAY_MS / 1000)
+                        # Track request timing
+                        request_start = time.time()
+                        # Abandoned (request aborted) as soon as the run is paused/cancelled
+                        result = await runner.interruptible(
+                            batch.submit(SellerSearchRequest(title, price, page)), "API call"
+                        )
+                        duration_ms = int((time.time() - request_start) * 1000)
+                        total_duration_ms += duration_ms
+                        outcome = classify_outcome(result.error)
+                        metrics.record_attempt("ebay", attempt_num, outcome)
+                        if breaker.record(outcome, result.retry_after):
+                            metrics.record_circuit_open("ebay")
+
+                        # No check here: a result that arrived is kept (its sellers
+                        # are saved) even if the run was signaled meanwhile
+
+                        if result.error:
+                            delay = retry_policy.next_delay(outcome, attempt_num, result.retry_after)
+                            if result.error == "rate_limited":
+                                await runner.emit_activity(create_activity_event(
+                                    worker_id=worker_id,
+                                    phase="ebay",
+                                    action="rate_limited",
+                                    product_name=short_title,
+                                    duration_ms=duration_ms,
+                                    error_type="rate_limit",
+                                    error_stage="api",
+                                    attempt=attempt_num,
+                                ))
+                                if delay is None:
+                                    break  # Max retries reached - skip remaining pages
+                            else:
+                                # Classify error type
+                                error_type = "timeout" if "timeout" in result.error.lower() else (
+                                    "http_500" if "http" in result.error.lower() or "500" in result.error else "api_error"
+                                )
+                                await runner.emit_activity(create_activity_event(
+                                    worker_id=worker_id,
+                                    phase="ebay",
+                                    action="error",
+                                    product_name=short_title,
+                                    error_message=result.error,
+                                    error_type=error_type,
+                                    error_stage="api",
+                                    duration_ms=duration_ms,
+                                    attempt=attempt_num,
+                                ))
+                                if delay is None:
+                                    logger.warning(f"Error searching {short_title}: {result.error} (attempt {attempt_num})")
+                                    raise Exception(result.error)
+
+                            logger.info(f"{result.error}, retrying in {delay:.1f}s")
+                            metrics.record_backoff("ebay", delay)
+                            # Check during wait for fast pause/cancel response
+                            await runner.interruptible(
+                                backoff_sleep(delay, lambda: check_cancelled_throttled("during retry backoff")),
+                                "retry backoff",
+                            )
+                            continue  # Retry this page
+
+                        # Success - break out of retry loop
+                        all_sellers.extend(result.sellers)
+                        page_success = True
+                        break
+
+                    # If rate limit retries ran out, skip remaining pages
+                    if not page_success:
+                        logger.warning(f"Max retries reached for page {page}, skipping remaining pages")
+                        break
+
+                    if not result.has_more:
+                        break
+
+                    await asyncio.sleep(REQUEST_DELAY_MS / 1000)
+            except CollectionPausedException as e:
+                interrupted = e
 
             # Emit found activity with total duration
             found_count = len(all_sellers)
@@ -1942,7 +2102,7 @@ class CollectionService:
                     new_sellers_count=found_count,
                     duration_ms=total_duration_ms,
                 ))
-                print(f"[W{worker_id}] Found {found_count} sellers for {short_title}")
+                logger.info(f"Found {found_count} sellers for {short_title}")
 
             # INSERT SELLERS IMMEDIATELY (don't wait until end)
             # NOTE: We intentionally save sellers BEFORE checking cancellation
@@ -2040,7 +2200,7 @@ class CollectionService:
                     )
                     new_count = inserted
                     if inserted > 0:
-                        print(f"[W{worker_id}] +{inserted} NEW SELLERS")
+                        logger.info(f"+{inserted} new sellers")
                         # Emit insert event
                         await runner.emit_activity(create_activity_event(
                             worker_id=0,  # System event
@@ -2052,15 +2212,19 @@ class CollectionService:
                         ))
 
             # Update shared counters and sync to DB for real-time progress
-            # Always update (sellers were saved, we want accurate counts)
+            # Always update (sellers were saved, we want accurate counts);
+            # an interrupted product is not counted as searched
             shared_sellers_found += found_count
             shared_sellers_new += new_count
-            shared_products_searched += 1
+            if interrupted is None:
+                shared_products_searched += 1
 
             # Update database periodically for frontend polling (every product)
             await update_progress_in_db()
 
             # Check cancellation AFTER saving sellers - data is preserved, now we can exit
+            if interrupted is not None:
+                raise interrupted
             if runner.is_cancelled:
                 raise CollectionPausedException("Run cancelled after seller save")
 
@@ -2080,27 +2244,34 @@ class CollectionService:
 
         # Execute parallel - sellers are inserted immediately per-product
         try:
-            results = await runner.run(tasks, process_product, phase="ebay")
+            async with batch:
+                results = await runner.run(tasks, process_product, phase="ebay")
         except CollectionPausedException:
             was_cancelled = is_cancelled(run_id)
             action = "CANCELLED" if was_cancelled else "PAUSED"
-            print(f"\n[COLLECTION] Run {action} - stopping eBay search")
-            print(f"[COLLECTION] Sellers saved so far: {shared_sellers_found} found, {shared_sellers_new} new")
+            logger.info(
+                f"Run {run_id} {action} - stopping eBay search "
+                f"(saved so far: {shared_sellers_found} found, {shared_sellers_new} new)"
+            )
             # Update run with partial results before returning
             now = datetime.now(timezone.utc).isoformat()
             self.supabase.table("collection_runs").update({
                 "sellers_found": sellers_found + shared_sellers_found,
                 "sellers_new": sellers_new + shared_sellers_new,
+                "metrics": metrics.to_dict(sellers_new=sellers_new + shared_sellers_new),
                 "updated_at": now,
             }).eq("id", run_id).execute()
+            if was_cancelled:
+                await self.release_run(run_id)
             return {"status": "cancelled" if was_cancelled else "paused", "sellers_found": sellers_found + shared_sellers_found, "sellers_new": sellers_new + shared_sellers_new}
+        finally:
+            # Workers stopped: progress readers go back to collection_runs
+            run_progress.release(run_id)
 
         # Update totals from shared counters (sellers already inserted per-product)
         sellers_found += shared_sellers_found
         sellers_new += shared_sellers_new
 
-        print(f"\n[EBAY] Total: {sellers_found} sellers found, {sellers_new} NEW")
-
         # Mark run as completed
         now = datetime.now(timezone.utc).isoformat()
         products_processed = resume_from_idx + len(tasks)
@@ -2110,41 +2281,29 @@ class CollectionService:
             "products_searched": products_processed,
             "sellers_found": sellers_found,
             "sellers_new": sellers_new,
+            "metrics": metrics.to_dict(sellers_new=sellers_new),
             "updated_at": now,
         }).eq("id", run_id).execute()
 
         # Store seller count snapshot
         await self._store_run_snapshot(run_id, org_id)
 
-        # Clean up signal registry (run is done)
-        await clear_signal(run_id)
-
         # Emit complete activity
-        await activity_manager.push(run_id, {
-            "id": str(uuid.uuid4()),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "worker_id": 0,
-            "phase": "ebay",
-            "action": "complete",
-            "new_sellers_count": sellers_new,
-        })
-
-        # Cleanup activity stream
-        await activity_manager.cleanup(run_id)
+        activity_stream.publish(create_activity_event(
+            worker_id=0,
+            phase="ebay",
+            action="complete",
+            new_sellers_count=sellers_new,
+        ))
+
+        # Run is done: clear its signal and close its activity stream
+        await self.release_run(run_id)
 
         logger.info(
-            f"eBay seller search completed for run {run_id}: "
+            f"eBay seller search completed for run {run_id}: {products_processed} products searched, "
             f"{sellers_found} sellers found, {sellers_new} new"
         )
 
-        print(f"\n{'#'*60}")
-        print(f"[COLLECTION] eBay Phase Complete!")
-        print(f"[COLLECTION] Products Searched: {products_processed}")
-        print(f"[COLLECTION] Total Sellers Found: {sellers_found}")
-        print(f"[COLLECTION] New Sellers Added: {sellers_new}")
-        print(f"{'#'*60}")
-        print(f"\n[COLLECTION] COLLECTION RUN COMPLETED")
-
         return {
             "status": "completed",
             "sellers_found": sellers_found,
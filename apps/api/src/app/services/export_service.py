@@ -22,6 +22,7 @@ from app.models import (
     EXPORT_COLUMNS,
 )
 from app.pagination import decode_cursor, encode_cursor
+from app.services.offload import offload
 
 logger = logging.getLogger(__name__)
 
@@ -495,6 +496,39 @@ async def generate_sellers_json_stream(
     yield "]}"
 
 
+def _write_excel_rows(
+    worksheet,
+    start_row: int,
+    records: list[dict],
+    columns: list[str],
+    currency_columns: set[str],
+    currency_format,
+) -> int:
+    """Write a batch of records starting at start_row. Returns the next row index."""
+    row_idx = start_row
+    for record in records:
+        filtered = filter_columns(record, columns)
+
+        for col_idx, col_name in enumerate(columns):
+            value = filtered.get(col_name)
+
+            if value is None:
+                worksheet.write_blank(row_idx, col_idx, None)
+            elif col_name in currency_columns and isinstance(value, (int, float)):
+                # Convert cents to dollars for display
+                worksheet.write_number(row_idx, col_idx, value / 100, currency_format)
+            elif col_name == "sale_date":
+                if hasattr(value, "isoformat"):
+                    worksheet.write_string(row_idx, col_idx, value.isoformat())
+                else:
+                    worksheet.write_string(row_idx, col_idx, str(value))
+            else:
+                worksheet.write(row_idx, col_idx, value)
+
+        row_idx += 1
+    return row_idx
+
+
 async def generate_excel_file(
     supabase,
     account_id: str,
@@ -507,6 +541,8 @@ async def generate_excel_file(
     Generate Excel file with streaming.
 
     Uses xlsxwriter with constant_memory mode for memory efficiency.
+    Records are fetched on the event loop and written in batches on the
+    "spreadsheet" offload pool, along with the final (zip) close.
     Returns path to the generated temporary file.
     """
     import xlsxwriter
@@ -544,37 +580,32 @@ async def generate_excel_file(
     # Freeze header row
     worksheet.freeze_panes(1, 0)
 
-    # Write data rows
+    # Write data rows in batches (constant_memory requires row order, so
+    # batches are written one at a time)
     row_idx = 1
+    batch: list[dict] = []
     async for record in fetch_export_records_paginated(
         supabase, account_id, status_filter, date_from, date_to
     ):
-        filtered = filter_columns(record, columns)
-
-        for col_idx, col_name in enumerate(columns):
-            value = filtered.get(col_name)
-
-            if value is None:
-                worksheet.write_blank(row_idx, col_idx, None)
-            elif col_name in currency_columns and isinstance(value, (int, float)):
-                # Convert cents to dollars for display
-                worksheet.write_number(row_idx, col_idx, value / 100, currency_format)
-            elif col_name == "sale_date":
-                if hasattr(value, "isoformat"):
-                    worksheet.write_string(row_idx, col_idx, value.isoformat())
-                else:
-                    worksheet.write_string(row_idx, col_idx, str(value))
-            else:
-                worksheet.write(row_idx, col_idx, value)
-
-        row_idx += 1
+        batch.append(record)
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            row_idx = await offload(
+                "spreadsheet", _write_excel_rows, worksheet, row_idx, batch,
+                columns, currency_columns, currency_format,
+            )
+            batch = []
+    if batch:
+        row_idx = await offload(
+            "spreadsheet", _write_excel_rows, worksheet, row_idx, batch,
+            columns, currency_columns, currency_format,
+        )
 
     # Set column widths
     for col_idx, col_name in enumerate(columns):
         width = max(len(col_name), 12)  # Minimum width of 12
         worksheet.set_column(col_idx, col_idx, width)
 
-    workbook.close()
+    await offload("spreadsheet", workbook.close)
     return file_path
 
 
@@ -0,0 +1,201 @@
+"""Managed offload pools for CPU-bound work.
+
+Parsing uploads, building spreadsheets, extracting sellers from rendered
+HTML and Argon2 verification are CPU-bound; run directly in an async
+endpoint they block the event loop and stall every other request. Call
+sites hand that work to a named pool instead:
+
+    rows = await offload("import", parse_full_file, content, format, mapping)
+
+Pools (sizes overridable with OFFLOAD_<NAME>_WORKERS):
+    parse        threads    eBay HTML extraction (short, frequent)
+    import       processes  pandas read_csv/read_excel + row validation
+    spreadsheet  threads    xlsxwriter generation (objects can't be pickled)
+    hash         threads    Argon2 hashing/verification (releases the GIL)
+
+The parse pool uses threads even though the regex scan holds the GIL: it
+is ~1ms per megabyte of page (the seller region is sliced out first), so
+it stalls the loop for a few ms at most, while a process pool has to
+pickle the whole page and stalls it longer (~4ms at 1MB, ~30ms at 8MB).
+`python -m benchmarks.ebay_extraction --loop-stall` measures both.
+
+Each pool has a concurrency limit (an asyncio.Semaphore sized to its
+workers), so excess work waits on the event loop without tying up
+executor threads, and keeps queue-depth and timing counters exposed via
+offload_stats(). Executors start lazily and are shut down from the app
+lifespan (shutdown_pools()).
+
+Functions sent to a process pool, and their arguments and results, must
+be picklable (module-level functions, plain data).
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class PoolConfig:
+    kind: str  # "thread" or "process"
+    workers: int
+
+
+DEFAULT_POOLS = {
+    "parse": PoolConfig("thread", 4),
+    "import": PoolConfig("process", 2),
+    "spreadsheet": PoolConfig("thread", 2),
+    "hash": PoolConfig("thread", 4),
+}
+
+
+@dataclass
+class PoolStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    queued: int = 0
+    running: int = 0
+    max_queued: int = 0
+    wait_ms_total: float = 0.0
+    run_ms_total: float = 0.0
+    max_wait_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        finished = self.completed + self.failed
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "queued": self.queued,
+            "running": self.running,
+            "max_queued": self.max_queued,
+            "avg_wait_ms": round(self.wait_ms_total / finished, 2) if finished else None,
+            "max_wait_ms": round(self.max_wait_ms, 2),
+            "avg_run_ms": round(self.run_ms_total / finished, 2) if finished else None,
+        }
+
+
+@dataclass
+class OffloadPool:
+    """A named executor with a concurrency limit and queue-depth counters."""
+
+    name: str
+    kind: str
+    workers: int
+    stats: PoolStats = field(default_factory=PoolStats)
+    _executor: Executor | None = None
+    _semaphore: asyncio.Semaphore | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                # spawn: forking a process that runs an event loop and
+                # thread pools is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix=f"offload-{self.name}",
+                )
+            logger.info(f"Started offload pool '{self.name}' ({self.kind}, {self.workers} workers)")
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.workers)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run func(*args, **kwargs) in the pool once a slot is free."""
+        stats = self.stats
+        stats.submitted += 1
+        stats.queued += 1
+        stats.max_queued = max(stats.max_queued, stats.queued)
+        queued_at = time.monotonic()
+
+        semaphore = self._get_semaphore()
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.queued -= 1
+
+        started = time.monotonic()
+        wait_ms = (started - queued_at) * 1000
+        stats.wait_ms_total += wait_ms
+        stats.max_wait_ms = max(stats.max_wait_ms, wait_ms)
+        stats.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._get_executor(), functools.partial(func, *args, **kwargs)
+            )
+            stats.completed += 1
+            return result
+        except BaseException:
+            stats.failed += 1
+            raise
+        finally:
+            stats.running -= 1
+            stats.run_ms_total += (time.monotonic() - started) * 1000
+            semaphore.release()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def _pool_config(name: str, default: PoolConfig) -> PoolConfig:
+    workers = os.getenv(f"OFFLOAD_{name.upper()}_WORKERS")
+    return PoolConfig(default.kind, int(workers) if workers else default.workers)
+
+
+_pools: dict[str, OffloadPool] = {}
+
+
+def get_pool(name: str) -> OffloadPool:
+    """Get a named pool (created on first use)."""
+    pool = _pools.get(name)
+    if pool is None:
+        if name not in DEFAULT_POOLS:
+            raise ValueError(f"Unknown offload pool '{name}'")
+        config = _pool_config(name, DEFAULT_POOLS[name])
+        pool = OffloadPool(name=name, kind=config.kind, workers=config.workers)
+        _pools[name] = pool
+    return pool
+
+
+async def offload(pool_name: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a CPU-bound callable in the named pool and await its result."""
+    return await get_pool(pool_name).run(func, *args, **kwargs)
+
+
+def offload_stats() -> dict[str, dict]:
+    """Queue depth and timing counters for every pool used so far."""
+    return {
+        name: {"kind": pool.kind, "workers": pool.workers, **pool.stats.to_dict()}
+        for name, pool in _pools.items()
+    }
+
+
+def shutdown_pools() -> None:
+    """Stop all executors. Called on app shutdown."""
+    for pool in _pools.values():
+        pool.shutdown()
+    _pools.clear()
@@ -3,19 +3,37 @@
 Provides concurrent execution of collection tasks with:
 - asyncio.Queue for work distribution (atomic task claiming)
 - Shared failure counter with asyncio.Lock
-- Activity event emission for SSE streaming
+- Activity event emission for SSE streaming (events are slotted and
+  JSON-encoded once, at creation; see ActivityEvent)
 - Configurable worker count (default 5)
+- Optional per-run accounting (task outcomes, phase wall time)
+- Structured log context (run_id, worker_id, phase) bound per worker
+- Pause/cancel signals for the run (run_signals) cancel the runner at once;
+  workers awaiting through interruptible() abandon their in-flight request
 """
 
 import asyncio
+import json
 import logging
+import operator
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from typing import Any, Awaitable, Callable, TypeVar
 
+from app.logging_config import bind_log_context
+from app.services import run_signals
+from app.services.run_metrics import RunMetrics
+
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 T = TypeVar('T')
 R = TypeVar('R')
 
@@ -23,9 +41,23 @@ MAX_WORKERS = 5
 MAX_CONSECUTIVE_FAILURES = 5
 
 
-@dataclass
+def encode_json(value: Any) -> bytes:
+    """Compact UTF-8 JSON; orjson when installed, the stdlib otherwise."""
+    if ORJSON_AVAILABLE:
+        # orjson's result keeps its ~1KB output buffer; copying it down to
+        # its length saves ~700 bytes per buffered event for ~0.4us
+        return bytes(memoryview(orjson.dumps(value, default=str)))
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+
+
+@dataclass(slots=True)
 class ActivityEvent:
-    """Activity event for SSE streaming."""
+    """Activity event for SSE streaming.
+
+    Slotted, and treated as immutable once created: `encoded` (its JSON,
+    None fields omitted) is computed at creation and reused for every SSE
+    subscriber, replay and bus forward instead of re-serializing per reader.
+    """
     # Core identification
     id: str
     timestamp: str
@@ -61,8 +93,27 @@ class ActivityEvent:
     source_worker_id: int | None = None         # Which worker produced this data
     operation_type: str | None = None           # "product_batch", "seller_dedupe", "seller_insert"
 
+    # JSON of to_dict(), set in __post_init__
+    encoded: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.encoded = encode_json(self.to_dict())
+
     def to_dict(self) -> dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {
+            name: value
+            for name, value in zip(_EVENT_FIELDS, _event_values(self))
+            if value is not None
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ActivityEvent":
+        """Rebuild an event from to_dict() output (e.g. received on the bus)."""
+        return cls(**{name: data[name] for name in _EVENT_FIELDS if name in data})
+
+
+_EVENT_FIELDS = tuple(f.name for f in fields(ActivityEvent) if f.init)
+_event_values = operator.attrgetter(*_EVENT_FIELDS)
 
 
 class CollectionPausedException(Exception):
@@ -85,17 +136,56 @@ class ParallelCollectionRunner:
         self,
         max_workers: int = MAX_WORKERS,
         on_activity: Callable[[ActivityEvent], None] | None = None,
+        metrics: RunMetrics | None = None,
+        run_id: str | None = None,
     ):
         self.max_workers = max_workers
         self.on_activity = on_activity
+        self.metrics = metrics
+        self.run_id = run_id
         self.work_queue: asyncio.Queue = asyncio.Queue()
         self.consecutive_failures = 0
         self.failure_lock = asyncio.Lock()
         self._cancelled = False
+        # Resolved by cancel(); interruptible() awaits race against it
+        self._stopped: asyncio.Future | None = None
 
     def cancel(self):
         """Signal workers to stop processing."""
         self._cancelled = True
+        if self._stopped is not None and not self._stopped.done():
+            self._stopped.set_result(None)
+
+    def _on_signal(self, signal: run_signals.RunSignal) -> None:
+        """run_signals listener: a pause/cancel stops the workers immediately."""
+        logger.info(f"Run {self.run_id} signaled ({signal.value}), interrupting workers")
+        self.cancel()
+
+    async def interruptible(self, awaitable: Awaitable[R], context: str) -> R:
+        """
+        Await `awaitable`, abandoning it as soon as the runner is cancelled.
+
+        Workers wrap upstream calls and waits in this so a pause or cancel
+        does not wait for a response (up to 90s per eBay page): the awaitable
+        is cancelled, which aborts its HTTP request, and
+        CollectionPausedException is raised for the worker to clean up.
+        """
+        if self._cancelled:
+            raise CollectionPausedException(f"Run cancelled: {context}")
+        task = asyncio.ensure_future(awaitable)
+        if self._stopped is None:
+            return await task
+        try:
+            await asyncio.wait((task, self._stopped), return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if not task.done():
+            task.cancel()
+            # Let the cancellation unwind (closes the request) before moving on
+            await asyncio.wait((task,))
+            raise CollectionPausedException(f"Run interrupted: {context}")
+        return task.result()
 
     @property
     def is_cancelled(self) -> bool:
@@ -148,6 +238,8 @@ class ParallelCollectionRunner:
             List of results from processed tasks
         """
         results: list[R] = []
+        # Each worker is its own task, so this only tags this worker's records
+        bind_log_context(run_id=self.run_id, worker_id=worker_id, phase=phase)
 
         while not self._cancelled:
             try:
@@ -171,6 +263,8 @@ class ParallelCollectionRunner:
                 result = await process_task(task, worker_id)
                 results.append(result)
                 await self.reset_failures()
+                if self.metrics:
+                    self.metrics.record_task(phase, ok=True)
 
             except CollectionPausedException:
                 # Signal all other workers to stop immediately
@@ -179,6 +273,8 @@ class ParallelCollectionRunner:
                 raise
 
             except Exception as e:
+                if self.metrics:
+                    self.metrics.record_task(phase, ok=False)
                 should_pause = await self.handle_failure(worker_id, str(e))
                 if should_pause:
                     self.work_queue.task_done()
@@ -211,6 +307,7 @@ class ParallelCollectionRunner:
 
         # Reset state
         self._cancelled = False
+        self._stopped = asyncio.get_running_loop().create_future()
         self.consecutive_failures = 0
         self.work_queue = asyncio.Queue()
 
@@ -228,13 +325,22 @@ class ParallelCollectionRunner:
             for i in range(self.max_workers)
         ]
 
-        # Wait for all workers
+        # Wait for all workers; a pause/cancel signal interrupts them at once
+        if self.run_id:
+            run_signals.add_listener(self.run_id, self._on_signal)
+        if self.metrics:
+            self.metrics.start_phase(phase)
         try:
             results_per_worker = await asyncio.gather(*worker_tasks, return_exceptions=True)
         except Exception as e:
             logger.error(f"Parallel run failed: {e}")
             self.cancel()
             raise
+        finally:
+            if self.run_id:
+                run_signals.remove_listener(self.run_id, self._on_signal)
+            if self.metrics:
+                self.metrics.end_phase(phase)
 
         # Check if any worker raised CollectionPausedException - if so, re-raise it
         # This ensures pause/cancel propagates up to the caller
@@ -0,0 +1,272 @@
+"""Retry policies and per-source circuit breakers for upstream scraping.
+
+RetryPolicy decides, per error class, whether a failed scraper call is
+retried and how long to wait first:
+- exponential backoff (base * multiplier^(attempt-1), capped at max_delay)
+- "equal" jitter: half the delay is fixed, half random, so workers that
+  failed together do not retry together
+- Retry-After from the upstream response wins over the computed delay
+
+Error classes are the RunMetrics outcome buckets (classify_outcome):
+rate_limited, timeout, http_5xx, http_4xx, empty, error.
+
+CircuitBreaker tracks consecutive failures for one upstream source across
+all workers (and runs) in the process. After `failure_threshold` failures,
+or when the upstream sends Retry-After, the circuit opens and every worker
+waits in wait_ready() until it closes instead of each one burning its own
+retries against an outage. After the open period one probe request is let
+through (half-open); its outcome closes or re-opens the circuit.
+
+Tunables (environment):
+    CIRCUIT_FAILURE_THRESHOLD   consecutive failures that open a circuit (5)
+    CIRCUIT_OPEN_SECONDS        how long a circuit stays open (30)
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("CIRCUIT_OPEN_SECONDS", "30"))
+
+# Outcomes that say the upstream itself is unhealthy (count toward opening)
+CIRCUIT_FAILURES = frozenset({"rate_limited", "timeout", "http_5xx"})
+
+# Sleep granularity while waiting, so pause/cancel checks stay responsive
+WAIT_STEP_SECONDS = 0.5
+
+CancelCheck = Callable[[], Awaitable[None]]
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+async def backoff_sleep(seconds: float, check: CancelCheck | None = None) -> None:
+    """Sleep in short steps, awaiting `check` between them.
+
+    `check` is expected to raise (e.g. CollectionPausedException) to abort
+    the wait when the run is paused or cancelled.
+    """
+    deadline = time.monotonic() + seconds
+    while True:
+        if check is not None:
+            await check()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        await asyncio.sleep(min(WAIT_STEP_SECONDS, remaining))
+
+
+# ============================================================
+# Retry policy
+# ============================================================
+
+
+@dataclass(frozen=True)
+class Backoff:
+    """Retry schedule for one error class."""
+
+    max_attempts: int  # total attempts including the first; 1 = no retry
+    base_delay: float = 1.0
+    multiplier: float = 2.0
+    max_delay: float = 60.0
+
+    def delay(self, attempt: int, rng: random.Random) -> float:
+        """Jittered delay before attempt `attempt + 1`."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return delay / 2 + rng.uniform(0, delay / 2)
+
+
+NO_RETRY = Backoff(max_attempts=1)
+
+
+def _default_backoffs() -> dict[str, Backoff]:
+    return {
+        "rate_limited": Backoff(max_attempts=5, base_delay=5.0, max_delay=60.0),
+        "timeout": Backoff(max_attempts=3, base_delay=2.0, max_delay=30.0),
+        "http_5xx": Backoff(max_attempts=3, base_delay=2.0, max_delay=30.0),
+        "empty": Backoff(max_attempts=2, base_delay=1.0),
+        "http_4xx": NO_RETRY,
+        "error": NO_RETRY,
+    }
+
+
+@dataclass
+class RetryPolicy:
+    """Per-error-class retry schedules."""
+
+    backoffs: dict[str, Backoff] = field(default_factory=_default_backoffs)
+    rng: random.Random = field(default_factory=random.Random)
+
+    def scaled(self, factor: float) -> "RetryPolicy":
+        """Same attempts with all delays multiplied by `factor` (tests, benchmarks)."""
+        return RetryPolicy(
+            backoffs={
+                outcome: replace(
+                    backoff,
+                    base_delay=backoff.base_delay * factor,
+                    max_delay=backoff.max_delay * factor,
+                )
+                for outcome, backoff in self.backoffs.items()
+            },
+            rng=self.rng,
+        )
+
+    def max_attempts(self, outcome: str) -> int:
+        return self.backoffs.get(outcome, NO_RETRY).max_attempts
+
+    def next_delay(
+        self,
+        outcome: str,
+        attempt: int,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """Seconds to wait before retrying, or None if attempts are used up.
+
+        Args:
+            outcome: classify_outcome() bucket of the failed attempt
+            attempt: 1-based number of the attempt that just failed
+            retry_after: upstream Retry-After in seconds, if sent
+        """
+        backoff = self.backoffs.get(outcome, NO_RETRY)
+        if attempt >= backoff.max_attempts:
+            return None
+        if retry_after is not None:
+            return min(retry_after, backoff.max_delay)
+        return backoff.delay(attempt, self.rng)
+
+
+# ============================================================
+# Circuit breaker
+# ============================================================
+
+
+class CircuitBreaker:
+    """Shared failure state for one upstream source.
+
+    All methods are called from coroutines on the event loop; state is
+    plain attributes and time-based, so no locks are needed.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        open_seconds: float = CIRCUIT_OPEN_SECONDS,
+    ):
+        self.source = source
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.consecutive_failures = 0
+        self.opened_count = 0
+        self._open_until = 0.0
+        self._probe_started: float | None = None
+
+    @property
+    def state(self) -> str:
+        if self._open_until > time.monotonic():
+            return "open"
+        if self._open_until:
+            return "half_open"
+        return "closed"
+
+    def open(self, seconds: float | None = None) -> None:
+        """Park every worker for this source for `seconds` (default open_seconds)."""
+        seconds = self.open_seconds if seconds is None else seconds
+        until = time.monotonic() + seconds
+        if until > self._open_until:
+            if self.state != "open":
+                self.opened_count += 1
+                logger.warning(f"Circuit for {self.source} open for {seconds:.1f}s")
+            self._open_until = until
+
+    def record(self, outcome: str, retry_after: float | None = None) -> bool:
+        """Record one request outcome. Returns True if this opened the circuit."""
+        was_open = self.state == "open"
+        opened_before = self.opened_count
+        self._probe_started = None
+
+        if outcome not in CIRCUIT_FAILURES:
+            # Success (or a per-request error): close the circuit
+            if self._open_until and self.state != "open":
+                logger.info(f"Circuit for {self.source} closed")
+            self.consecutive_failures = 0
+            if not was_open:
+                self._open_until = 0.0
+            return False
+
+        self.consecutive_failures += 1
+        if retry_after is not None:
+            # Upstream told us how long to back off; applies to every worker
+            self.open(retry_after)
+        elif self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            self.open()
+        return self.opened_count > opened_before
+
+    async def wait_ready(self, check: CancelCheck | None = None) -> None:
+        """Wait while the circuit is open; admit one probe when half-open."""
+        while True:
+            state = self.state
+            if state == "closed":
+                return
+            if state == "half_open":
+                # A probe that never reported back (cancelled worker) expires
+                now = time.monotonic()
+                if self._probe_started is None or now - self._probe_started > self.open_seconds:
+                    self._probe_started = now
+                    return
+            remaining = self._open_until - time.monotonic()
+            await backoff_sleep(max(remaining, WAIT_STEP_SECONDS), check)
+
+    def to_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened_count": self.opened_count,
+        }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_open_seconds = CIRCUIT_OPEN_SECONDS
+
+
+def get_circuit_breaker(source: str) -> CircuitBreaker:
+    """The process-wide breaker for an upstream source (created on first use)."""
+    breaker = _breakers.get(source)
+    if breaker is None:
+        breaker = CircuitBreaker(source, open_seconds=_open_seconds)
+        _breakers[source] = breaker
+    return breaker
+
+
+def reset_circuit_breakers(open_seconds: float = CIRCUIT_OPEN_SECONDS) -> None:
+    """Forget all breaker state; new breakers stay open for `open_seconds`.
+
+    For tests and benchmarks, which need short open periods.
+    """
+    global _open_seconds
+    _breakers.clear()
+    _open_seconds = open_seconds
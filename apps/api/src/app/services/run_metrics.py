@@ -0,0 +1,249 @@
+"""Per-run scraping cost and latency accounting.
+
+Collects request-level statistics from the scrapers and task-level
+statistics from ParallelCollectionRunner for a single collection run:
+- Request counts by source (amazon/ebay), by outcome and by attempt
+- Latency histogram and response bytes per source
+- Rendered page count (JS-rendered requests are billed higher)
+- Per-tier attempts and hits for tiered fetches (renders avoided)
+- Retry backoff time and circuit breaker openings per source
+- New vs reused upstream connections (pooled HTTP client)
+- Wall-clock seconds per phase
+- Estimated cost and cost per new seller
+
+The accumulated snapshot is persisted to collection_runs.metrics when a
+phase finishes (completed, paused or cancelled) and merged back in on
+resume, so a run's totals survive pause/resume cycles.
+"""
+
+import os
+import time
+from typing import Any
+
+# Upper bounds (inclusive) for latency histogram buckets, in milliseconds.
+# A final overflow bucket catches anything slower than the last bound.
+LATENCY_BUCKETS_MS = (250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 90000)
+
+# Oxylabs bills per successful result; rendered pages cost more.
+# Values are in cents per request and can be overridden per deployment.
+COST_CENTS_PER_REQUEST = float(os.getenv("OXYLABS_COST_CENTS_PER_REQUEST", "0.15"))
+RENDER_COST_CENTS_PER_REQUEST = float(
+    os.getenv("OXYLABS_RENDER_COST_CENTS_PER_REQUEST", "0.25")
+)
+
+METRICS_VERSION = 1
+
+
+def classify_outcome(error: str | None) -> str:
+    """Map a scraper result error string to a metrics outcome bucket."""
+    if error is None:
+        return "ok"
+    if error == "rate_limited":
+        return "rate_limited"
+    if error == "empty_response":
+        return "empty"
+    if "timeout" in error.lower():
+        return "timeout"
+    if error.startswith("http_error:"):
+        status = error.split(":", 1)[1]
+        return "http_5xx" if status.startswith("5") else "http_4xx"
+    return "error"
+
+
+def outcome_for_status(status_code: int) -> str:
+    """Map an HTTP status code to a metrics outcome bucket."""
+    if status_code == 429:
+        return "rate_limited"
+    if status_code >= 500:
+        return "http_5xx"
+    if status_code >= 400:
+        return "http_4xx"
+    return "ok"
+
+
+def _empty_source() -> dict[str, Any]:
+    return {
+        "requests": 0,
+        "outcomes": {},
+        "attempts": {},
+        "retries": 0,
+        "backoff_ms": 0,
+        "circuit_opens": 0,
+        "rendered": 0,
+        "billable": 0,
+        "billable_rendered": 0,
+        "response_bytes": 0,
+        "new_connections": 0,
+        "reused_connections": 0,
+        "tiers": {},
+        "latency_ms_total": 0,
+        "latency_histogram": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+    }
+
+
+class RunMetrics:
+    """
+    Mutable accounting for one collection run.
+
+    All methods are synchronous and lock-free: they are only called from
+    coroutines on the event loop, so plain dict updates are safe.
+    """
+
+    def __init__(self):
+        self.sources: dict[str, dict[str, Any]] = {}
+        self.tasks: dict[str, dict[str, int]] = {}
+        self.phase_seconds: dict[str, float] = {}
+        self._phase_started: dict[str, float] = {}
+
+    # ------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------
+
+    def _source(self, source: str) -> dict[str, Any]:
+        if source not in self.sources:
+            self.sources[source] = _empty_source()
+        return self.sources[source]
+
+    def record_request(
+        self,
+        source: str,
+        outcome: str,
+        latency_ms: float,
+        response_bytes: int = 0,
+        rendered: bool = False,
+    ) -> None:
+        """Record a single upstream HTTP request (called by scrapers)."""
+        stats = self._source(source)
+        stats["requests"] += 1
+        stats["outcomes"][outcome] = stats["outcomes"].get(outcome, 0) + 1
+        stats["response_bytes"] += response_bytes
+        stats["latency_ms_total"] += int(latency_ms)
+        if rendered:
+            stats["rendered"] += 1
+        if outcome == "ok":
+            stats["billable"] += 1
+            if rendered:
+                stats["billable_rendered"] += 1
+
+        bucket = len(LATENCY_BUCKETS_MS)
+        for idx, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                bucket = idx
+                break
+        stats["latency_histogram"][bucket] += 1
+
+    def record_connection(self, source: str, new: bool) -> None:
+        """Record whether a request opened a connection or reused a pooled one."""
+        stats = self._source(source)
+        stats["new_connections" if new else "reused_connections"] += 1
+
+    def record_tier(self, source: str, tier: str, hit: bool) -> None:
+        """Record one tiered-fetch attempt and whether its result was used."""
+        tiers = self._source(source)["tiers"]
+        stats = tiers.setdefault(tier, {"attempts": 0, "hits": 0})
+        stats["attempts"] += 1
+        if hit:
+            stats["hits"] += 1
+
+    def record_attempt(self, source: str, attempt: int, outcome: str) -> None:
+        """Record one attempt of a retry loop (called by CollectionService)."""
+        stats = self._source(source)
+        key = str(attempt)
+        stats["attempts"][key] = stats["attempts"].get(key, 0) + 1
+        if attempt > 1:
+            stats["retries"] += 1
+
+    def record_backoff(self, source: str, seconds: float) -> None:
+        """Record time a worker waited before retrying (called by CollectionService)."""
+        self._source(source)["backoff_ms"] += int(seconds * 1000)
+
+    def record_circuit_open(self, source: str) -> None:
+        """Record that the source's circuit breaker opened during this run."""
+        self._source(source)["circuit_opens"] += 1
+
+    def record_task(self, phase: str, ok: bool) -> None:
+        """Record a finished runner task (called by ParallelCollectionRunner)."""
+        tasks = self.tasks.setdefault(phase, {"completed": 0, "failed": 0})
+        tasks["completed" if ok else "failed"] += 1
+
+    def start_phase(self, phase: str) -> None:
+        """Mark the start of a timed phase."""
+        self._phase_started[phase] = time.monotonic()
+
+    def end_phase(self, phase: str) -> None:
+        """Accumulate wall-clock seconds for a phase started with start_phase."""
+        started = self._phase_started.pop(phase, None)
+        if started is not None:
+            elapsed = time.monotonic() - started
+            self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + elapsed
+
+    # ------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------
+
+    def cost_cents(self) -> float:
+        """Estimated spend for all billable requests so far."""
+        total = 0.0
+        for stats in self.sources.values():
+            plain = stats["billable"] - stats["billable_rendered"]
+            total += plain * COST_CENTS_PER_REQUEST
+            total += stats["billable_rendered"] * RENDER_COST_CENTS_PER_REQUEST
+        return round(total, 4)
+
+    def to_dict(self, sellers_new: int | None = None) -> dict[str, Any]:
+        """Snapshot for persistence on collection_runs.metrics."""
+        cost = self.cost_cents()
+        cost_per_new_seller = None
+        if sellers_new:
+            cost_per_new_seller = round(cost / sellers_new, 4)
+
+        return {
+            "version": METRICS_VERSION,
+            "latency_buckets_ms": list(LATENCY_BUCKETS_MS),
+            "sources": self.sources,
+            "tasks": self.tasks,
+            "phase_seconds": {k: round(v, 3) for k, v in self.phase_seconds.items()},
+            "totals": {
+                "requests": sum(s["requests"] for s in self.sources.values()),
+                "retries": sum(s["retries"] for s in self.sources.values()),
+                "circuit_opens": sum(s["circuit_opens"] for s in self.sources.values()),
+                "rendered": sum(s["rendered"] for s in self.sources.values()),
+                "response_bytes": sum(
+                    s["response_bytes"] for s in self.sources.values()
+                ),
+                "new_connections": sum(
+                    s["new_connections"] for s in self.sources.values()
+                ),
+                "reused_connections": sum(
+                    s["reused_connections"] for s in self.sources.values()
+                ),
+                "renders_avoided": sum(
+                    s["tiers"].get("plain", {}).get("hits", 0)
+                    for s in self.sources.values()
+                ),
+                "seconds": round(sum(self.phase_seconds.values()), 3),
+                "cost_cents": cost,
+                "sellers_new": sellers_new,
+                "cost_per_new_seller_cents": cost_per_new_seller,
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict | None) -> "RunMetrics":
+        """Rebuild accumulated metrics from a persisted snapshot (for resume)."""
+        metrics = cls()
+        if not data or data.get("version") != METRICS_VERSION:
+            return metrics
+        if data.get("latency_buckets_ms") != list(LATENCY_BUCKETS_MS):
+            # Bucket layout changed since the snapshot was written; histograms
+            # can't be merged, but counters can.
+            for stats in (data.get("sources") or {}).values():
+                stats["latency_histogram"] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+        for source, stats in (data.get("sources") or {}).items():
+            merged = _empty_source()
+            merged.update(stats)
+            metrics.sources[source] = merged
+        metrics.tasks = {k: dict(v) for k, v in (data.get("tasks") or {}).items()}
+        metrics.phase_seconds = dict(data.get("phase_seconds") or {})
+        return metrics
@@ -0,0 +1,142 @@
+"""In-memory progress snapshots for collection runs executing in this process.
+
+The progress endpoints used to read collection_runs on every poll, from
+every open tab, while the workers already held the counters. Now each
+phase registers a RunProgress (track) when its workers start, updates it
+from the same shared counters it writes to the database, and releases it
+when the workers stop. Readers:
+
+- GET /collection/runs/{id}/progress answers from the snapshot when the run
+  is executing here, and from the database otherwise (another process, or
+  between phases).
+- GET /collection/runs/{id}/progress/stream pushes snapshots over SSE,
+  at most one per PROGRESS_PUSH_INTERVAL_MS however often counters move.
+
+Snapshots hold the same fields get_enhanced_progress reads from
+collection_runs; progress_fields() derives phase and products_found for
+both sources.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_PUSH_INTERVAL_MS = int(os.getenv("PROGRESS_PUSH_INTERVAL_MS", "500"))
+
+
+def progress_fields(data: dict[str, Any]) -> dict[str, Any]:
+    """Progress response fields from collection_runs columns."""
+    # Determine phase from checkpoint
+    checkpoint = data.get("checkpoint") or {}
+    checkpoint_phase = checkpoint.get("phase", "")
+    if checkpoint_phase == "ebay_search" or checkpoint_phase == "amazon_complete":
+        phase = "ebay"
+    else:
+        phase = "amazon"
+
+    # products_found is products_total during Amazon phase
+    products_found = data.get("products_total") or 0
+
+    return {
+        **data,
+        "phase": phase,
+        "products_found": products_found,
+    }
+
+
+class RunProgress:
+    """Latest progress counters of one run, with a version to wait on."""
+
+    def __init__(self, run_id: str, org_id: str, fields: dict[str, Any]):
+        self.run_id = run_id
+        self.org_id = org_id
+        self.fields = dict(fields)
+        self.version = 1
+        self.released = False
+        self.updated_at = time.monotonic()
+        self._waiter: asyncio.Future | None = None
+
+    def update(self, **fields: Any) -> None:
+        """Apply counter changes and wake stream readers."""
+        self.fields.update(fields)
+        self.version += 1
+        self.updated_at = time.monotonic()
+        self._wake()
+
+    def snapshot(self) -> dict[str, Any]:
+        return progress_fields(self.fields)
+
+    def release(self) -> None:
+        self.released = True
+        self._wake()
+
+    def _wake(self) -> None:
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def wait_newer(self, version: int, timeout: float) -> bool:
+        """Wait until version moves past `version` or the run is released.
+
+        Returns False on timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while self.version <= version and not self.released:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            if self._waiter is None or self._waiter.get_loop() is not loop:
+                self._waiter = loop.create_future()
+            try:
+                await asyncio.wait_for(asyncio.shield(self._waiter), remaining)
+            except TimeoutError:
+                return False
+        return True
+
+
+# run_id -> progress of runs whose workers are running in this process
+_runs: dict[str, RunProgress] = {}
+
+
+def track(run_id: str, org_id: str, fields: dict[str, Any]) -> RunProgress:
+    """Register a run's progress as its workers start (seeded from the database)."""
+    progress = _runs.get(run_id)
+    if progress is not None and not progress.released:
+        progress.update(**fields)
+        return progress
+    progress = _runs[run_id] = RunProgress(run_id, org_id, fields)
+    logger.debug(f"Tracking progress for run {run_id} in memory")
+    return progress
+
+
+def release(run_id: str) -> None:
+    """Stop serving the run from memory; readers fall back to the database."""
+    progress = _runs.pop(run_id, None)
+    if progress is not None:
+        progress.release()
+        logger.debug(f"Released in-memory progress for run {run_id}")
+
+
+def get_local_progress(run_id: str, org_id: str) -> RunProgress | None:
+    """The run's progress if its workers run in this process (and org matches)."""
+    progress = _runs.get(run_id)
+    if progress is None or progress.org_id != org_id:
+        return None
+    return progress
+
+
+def is_tracked(run_id: str) -> bool:
+    """Whether the run's workers are running in this process."""
+    return run_id in _runs
+
+
+def progress_stats() -> dict[str, int]:
+    """Gauges for the admin runtime stats endpoint."""
+    return {"tracked_runs": len(_runs)}
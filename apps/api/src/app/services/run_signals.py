@@ -7,18 +7,40 @@ How it works:
 1. When /pause or /cancel endpoint is called, it adds run_id to the registry
 2. Workers check `is_cancelled(run_id)` - instant, no DB call
 3. When /resume is called, it removes from the registry
-4. Registry is cleaned up when run completes
+4. Registry is cleaned up when run completes, fails or is cancelled
+5. Signals left behind (e.g. a paused run that is never resumed, or a run
+   that died with the process) are evicted by sweep_signals() after
+   SIGNAL_TTL_SECONDS
 
 This eliminates the need for database polling while providing instant response.
+
+Checks only run between steps, so a worker waiting on an upstream call
+(up to 90s per eBay page) would notice a pause late. Listeners added with
+add_listener() are called as soon as a run is signaled; the collection
+runner uses one to abandon its workers' in-flight requests (see
+ParallelCollectionRunner.interruptible).
+
+With several processes, signal_run/clear_signal are also forwarded on the
+bus (app.services.bus) so the process running the collection sees a pause
+or cancel that arrived at another worker.
 """
 
 import asyncio
+import os
+import time
 from enum import Enum
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 import logging
 
+from app.services import bus
+
 logger = logging.getLogger(__name__)
 
+SIGNAL_CHANNEL = "signal"
+
+# Signals older than this are dropped by sweep_signals()
+SIGNAL_TTL_SECONDS = float(os.getenv("SIGNAL_TTL_SECONDS", "86400"))
+
 
 class RunSignal(Enum):
     """Signal types for collection runs."""
@@ -29,10 +51,15 @@ class RunSignal(Enum):
 # Global registry: run_id -> signal
 # Using a simple dict protected by a lock for thread safety
 _signals: Dict[str, RunSignal] = {}
+_signal_times: Dict[str, float] = {}  # run_id -> monotonic time signaled
 _lock = asyncio.Lock()
 
-# Debug: Print registry ID on module load
-print(f"[SIGNAL] Registry initialized: id={id(_signals)}")
+SignalListener = Callable[[RunSignal], None]
+
+# run_id -> callbacks to run when the run is signaled (see add_listener)
+_listeners: Dict[str, list[SignalListener]] = {}
+
+logger.debug(f"Signal registry initialized: id={id(_signals)}")
 
 
 async def signal_run(run_id: str, signal: RunSignal) -> None:
@@ -44,8 +71,10 @@ async def signal_run(run_id: str, signal: RunSignal) -> None:
     """
     async with _lock:
         _signals[run_id] = signal
-        print(f"[SIGNAL] Run {run_id} signaled: {signal.value} (registry now has {len(_signals)} signals)")
-        logger.info(f"Run {run_id} signaled: {signal.value}")
+        _signal_times[run_id] = time.monotonic()
+        logger.info(f"Run {run_id} signaled: {signal.value} (registry now has {len(_signals)} signals)")
+    _notify(run_id, signal)
+    bus.get_bus().publish(SIGNAL_CHANNEL, run_id, signal.value)
 
 
 async def clear_signal(run_id: str) -> None:
@@ -59,10 +88,91 @@ async def clear_signal(run_id: str) -> None:
         if run_id in _signals:
             old_signal = _signals[run_id]
             del _signals[run_id]
-            print(f"[SIGNAL] Run {run_id} signal cleared (was: {old_signal.value}, registry now has {len(_signals)} signals)")
-            logger.info(f"Run {run_id} signal cleared")
+            _signal_times.pop(run_id, None)
+            logger.info(f"Run {run_id} signal cleared (was: {old_signal.value}, registry now has {len(_signals)} signals)")
         else:
-            print(f"[SIGNAL] Run {run_id} clear requested but no signal was set")
+            logger.debug(f"Run {run_id} clear requested but no signal was set")
+    # Forwarded even if unset here: the run may be executing in another process
+    bus.get_bus().publish(SIGNAL_CHANNEL, run_id, None)
+
+
+def _apply_remote(run_id: str, value: Optional[str]) -> None:
+    """Bus handler: a signal set (value) or cleared (None) in another process.
+
+    Synchronous, so it cannot interleave with signal_run/clear_signal, whose
+    locked sections do not await.
+    """
+    if value is None:
+        _signals.pop(run_id, None)
+        _signal_times.pop(run_id, None)
+    else:
+        _signals[run_id] = RunSignal(value)
+        _signal_times[run_id] = time.monotonic()
+    logger.info(f"Run {run_id} signal {'cleared' if value is None else value} by another process")
+    if value is not None:
+        _notify(run_id, _signals[run_id])
+
+
+bus.register(SIGNAL_CHANNEL, _apply_remote)
+
+
+def add_listener(run_id: str, listener: SignalListener) -> None:
+    """
+    Call `listener(signal)` whenever the run is paused or cancelled.
+
+    Called from the event loop, in signal_run or when the signal arrives
+    from another process; listeners must not block. Remove with
+    remove_listener() when the run's workers stop.
+    """
+    _listeners.setdefault(run_id, []).append(listener)
+
+
+def remove_listener(run_id: str, listener: SignalListener) -> None:
+    """Remove a listener added with add_listener (no-op if absent)."""
+    listeners = _listeners.get(run_id)
+    if listeners is None:
+        return
+    if listener in listeners:
+        listeners.remove(listener)
+    if not listeners:
+        del _listeners[run_id]
+
+
+def _notify(run_id: str, signal: RunSignal) -> None:
+    for listener in list(_listeners.get(run_id, ())):
+        try:
+            listener(signal)
+        except Exception as e:
+            logger.warning(f"Signal listener for run {run_id} failed: {e}")
+
+
+def sweep_signals(now: Optional[float] = None) -> int:
+    """
+    Drop signals set more than SIGNAL_TTL_SECONDS ago.
+
+    Synchronous (no await between reading and deleting), so it cannot
+    interleave with signal_run/clear_signal. Returns the number dropped.
+    """
+    now = time.monotonic() if now is None else now
+    expired = [
+        run_id for run_id, signaled_at in _signal_times.items()
+        if now - signaled_at > SIGNAL_TTL_SECONDS
+    ]
+    for run_id in expired:
+        signal = _signals.pop(run_id, None)
+        del _signal_times[run_id]
+        logger.info(f"Run {run_id} signal expired (was: {signal.value if signal else None})")
+    return len(expired)
+
+
+def signal_stats() -> dict[str, int]:
+    """Gauges for the admin runtime stats endpoint."""
+    return {
+        "signals": len(_signals),
+        "paused": sum(1 for signal in _signals.values() if signal == RunSignal.PAUSE),
+        "cancelled": sum(1 for signal in _signals.values() if signal == RunSignal.CANCEL),
+        "listeners": sum(len(listeners) for listeners in _listeners.values()),
+    }
 
 
 def check_signal(run_id: str) -> Optional[RunSignal]:
@@ -82,12 +192,10 @@ def is_paused_or_cancelled(run_id: str) -> bool:
     """
     Quick check if run should stop processing.
 
-    Returns True if run has PAUSE or CANCEL signal.
+    Returns True if run has PAUSE or CANCEL signal. Called on every worker
+    check, so it does no logging; callers log when they act on a signal.
     """
-    result = run_id in _signals
-    if result:
-        print(f"[SIGNAL] Worker detected signal for run {run_id}: {_signals.get(run_id)}")
-    return result
+    return run_id in _signals
 
 
 def is_cancelled(run_id: str) -> bool:
@@ -7,12 +7,33 @@ Amazon scrapers:
 eBay scrapers:
 - EbayScraperService: Abstract interface for eBay seller search
 - OxylabsEbayScraper: Production implementation using Oxylabs Web Scraper API
+
+Backend selection (SCRAPER_BACKEND) and record/replay:
+- create_amazon_scraper / create_ebay_scraper: Build the configured backend
+- ReplayAmazonScraper / ReplayEbayScraper: Serve recorded Oxylabs responses
+- OxylabsBatchAmazonScraper / OxylabsBatchEbayScraper: Push-pull batch API
+- MockAmazonScraper / MockEbayScraper: Seeded data with latency and fault injection
+
+Batching (fetch_many / search_many):
+- BestsellerRequest / SellerSearchRequest: One request in a batch call
+- BatchDispatcher: Submit single requests into a long-lived batch call
 """
 
-from .base import AmazonProduct, AmazonScraperService, ScrapeResult
-from .ebay_base import EbaySeller, EbayScraperService, EbaySearchResult
+from .base import (
+    AmazonProduct,
+    AmazonScraperService,
+    BestsellerRequest,
+    ScrapeResult,
+    merge_pages,
+)
+from .batching import BatchDispatcher
+from .ebay_base import EbaySeller, EbayScraperService, EbaySearchResult, SellerSearchRequest
+from .factory import create_amazon_scraper, create_ebay_scraper
+from .mock import MockAmazonScraper, MockEbayScraper, MockProfile
 from .oxylabs import OxylabsAmazonScraper
+from .oxylabs_batch import OxylabsBatchAmazonScraper, OxylabsBatchEbayScraper
 from .oxylabs_ebay import OxylabsEbayScraper
+from .replay import ReplayAmazonScraper, ReplayEbayScraper
 
 __all__ = [
     # Amazon
@@ -20,9 +41,24 @@ __all__ = [
     "ScrapeResult",
     "AmazonScraperService",
     "OxylabsAmazonScraper",
+    "merge_pages",
+    "BestsellerRequest",
     # eBay
     "EbaySeller",
     "EbaySearchResult",
     "EbayScraperService",
     "OxylabsEbayScraper",
+    "SellerSearchRequest",
+    # Backend selection / replay / batch
+    "create_amazon_scraper",
+    "create_ebay_scraper",
+    "ReplayAmazonScraper",
+    "ReplayEbayScraper",
+    "OxylabsBatchAmazonScraper",
+    "OxylabsBatchEbayScraper",
+    "MockAmazonScraper",
+    "MockEbayScraper",
+    "MockProfile",
+    # Batching
+    "BatchDispatcher",
 ]
@@ -9,8 +9,14 @@ from __future__ import annotations
 
 import json
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Iterable
+
+from .batching import run_batch
+
+if TYPE_CHECKING:
+    from app.services.run_metrics import RunMetrics
 
 
 @dataclass
@@ -34,6 +40,48 @@ class ScrapeResult:
     page: int
     total_pages: int | None
     error: str | None = None
+    retry_after: float | None = None  # Seconds, from a rate-limited response
+
+
+@dataclass(frozen=True)
+class BestsellerRequest:
+    """One best-sellers page request, for fetch_many.
+
+    `tag` is for the caller to correlate results and is ignored when
+    comparing requests, so equal requests can share one upstream call.
+    """
+
+    category_node_id: str
+    page: int = 1
+    category_name: str | None = None
+    tag: Any = field(default=None, compare=False)
+
+
+def merge_pages(results: list[ScrapeResult]) -> list[AmazonProduct]:
+    """Merge the pages of one category into a single ranked product list.
+
+    Products are ordered by (page, position); an ASIN listed on more than
+    one page (the list can shift between requests) keeps its first slot.
+    Positions are renumbered 1..n across the merged list so they stay
+    unique whether the backend reports them per page or overall.
+    """
+    ranked = sorted(
+        (
+            (result.page, product.position, idx, product)
+            for result in results
+            for idx, product in enumerate(result.products)
+        ),
+        key=lambda item: item[:3],
+    )
+    merged: list[AmazonProduct] = []
+    seen: set[str] = set()
+    for _, _, _, product in ranked:
+        if product.asin in seen:
+            continue
+        seen.add(product.asin)
+        product.position = len(merged) + 1
+        merged.append(product)
+    return merged
 
 
 class AmazonScraperService(ABC):
@@ -41,26 +89,62 @@ class AmazonScraperService(ABC):
 
     Implementations:
     - OxylabsAmazonScraper: Production implementation using Oxylabs E-Commerce API
-    - MockAmazonScraper: Testing implementation with static data
+    - MockAmazonScraper: Seeded generated data with latency and fault
+      injection, for load testing without credentials (SCRAPER_BACKEND=mock)
+
+    Set `metrics` to a RunMetrics instance to have upstream requests
+    accounted against a collection run. `max_concurrency` is the number of
+    upstream requests the backend is designed to keep in flight.
     """
 
+    metrics: RunMetrics | None = None
+    max_concurrency: int = 6
+
     @abstractmethod
     async def fetch_bestsellers(
         self,
         category_node_id: str,
         page: int = 1,
+        category_name: str | None = None,
     ) -> ScrapeResult:
         """Fetch best sellers for a category.
 
         Args:
             category_node_id: Amazon browse node ID for the category
             page: Page number to fetch (1-indexed)
+            category_name: Display name, for logging only
 
         Returns:
             ScrapeResult with products and error info
         """
         pass
 
+    async def fetch_many(
+        self,
+        requests: Iterable[BestsellerRequest] | AsyncIterable[BestsellerRequest],
+        concurrency: int | None = None,
+    ) -> AsyncIterator[tuple[BestsellerRequest, ScrapeResult]]:
+        """Fetch many pages, yielding (request, result) as each completes.
+
+        The default runs fetch_bestsellers with up to `concurrency`
+        (default max_concurrency) requests in flight and collapses
+        identical requests; backends with a batch endpoint can override it.
+        """
+        async def fetch(request: BestsellerRequest) -> ScrapeResult:
+            return await self.fetch_bestsellers(
+                request.category_node_id,
+                page=request.page,
+                category_name=request.category_name,
+            )
+
+        def failed(request: BestsellerRequest, error: Exception) -> ScrapeResult:
+            return ScrapeResult(
+                products=[], page=request.page, total_pages=None, error=str(error)
+            )
+
+        async for item in run_batch(fetch, requests, concurrency or self.max_concurrency, failed):
+            yield item
+
     def get_categories(self) -> list[dict]:
         """Get available Amazon categories from static JSON file.
 
@@ -0,0 +1,190 @@
+"""Batch execution for scraper requests.
+
+fetch_many / search_many on the scraper ABCs take many requests and yield
+(request, result) pairs as they complete. The default implementation is
+run_batch(): a bounded fan-out over the backend's single-request method
+that also collapses identical requests in flight into one upstream call.
+Backends with a provider-side batch endpoint can override the ABC methods.
+
+CollectionService workers handle one request at a time (retries, activity
+events, checkpointing). BatchDispatcher sits between the two: workers
+submit() single requests into one long-lived batch call per phase, so the
+number of upstream requests in flight is set by the batch concurrency,
+independently of the runner's worker count.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from dataclasses import replace
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    TypeVar,
+)
+
+logger = logging.getLogger(__name__)
+
+Req = TypeVar("Req", bound=Hashable)
+Res = TypeVar("Res")
+
+BatchMethod = Callable[[AsyncIterable[Req]], AsyncIterator[tuple[Req, Res]]]
+
+_FEED_DONE = object()
+
+
+async def _iterate(requests: Iterable[Req] | AsyncIterable[Req]) -> AsyncIterator[Req]:
+    if isinstance(requests, AsyncIterable):
+        async for request in requests:
+            yield request
+    else:
+        for request in requests:
+            yield request
+
+
+async def run_batch(
+    call: Callable[[Req], Awaitable[Res]],
+    requests: Iterable[Req] | AsyncIterable[Req],
+    concurrency: int,
+    on_error: Callable[[Req, Exception], Res],
+) -> AsyncIterator[tuple[Req, Res]]:
+    """Run `call` for every request, at most `concurrency` at a time.
+
+    Yields (request, result) in completion order. Requests that compare
+    equal while one is in flight share its upstream call (and its result
+    object). An exception from `call` is turned into a result with
+    `on_error` so one failing request does not end the batch.
+
+    `requests` may be an async iterable that keeps producing until closed;
+    results are yielded while it is still being consumed.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    done: asyncio.Queue = asyncio.Queue()
+    # request -> every submitted request equal to it, waiting on one call
+    in_flight: dict[Req, list[Req]] = {}
+    tasks: set[asyncio.Task] = set()
+    feed_errors: list[Exception] = []
+
+    async def execute(request: Req) -> None:
+        async with semaphore:
+            try:
+                result = await call(request)
+            except Exception as e:
+                logger.exception(f"Batch request failed: {request}")
+                result = on_error(request, e)
+        done.put_nowait((request, result))
+
+    async def feed() -> None:
+        try:
+            async for request in _iterate(requests):
+                waiters = in_flight.get(request)
+                if waiters is not None:
+                    waiters.append(request)
+                    continue
+                in_flight[request] = [request]
+                task = asyncio.create_task(execute(request))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except Exception as e:
+            feed_errors.append(e)
+        finally:
+            done.put_nowait(_FEED_DONE)
+
+    feeder = asyncio.create_task(feed())
+    feeding = True
+    try:
+        while feeding or in_flight:
+            item = await done.get()
+            if item is _FEED_DONE:
+                feeding = False
+                # Surface errors from the request source itself
+                if feed_errors:
+                    raise feed_errors[0]
+                continue
+            request, result = item
+            for waiter in in_flight.pop(request):
+                yield waiter, result
+    finally:
+        feeder.cancel()
+        for task in list(tasks):
+            task.cancel()
+
+
+class BatchDispatcher(Generic[Req, Res]):
+    """Single-request front end to a long-lived batch call.
+
+    Use as an async context manager around the work that submits:
+
+        async with BatchDispatcher(scraper.fetch_many) as batch:
+            result = await batch.submit(BestsellerRequest(node_id, page))
+
+    Requests must be dataclasses with a `tag` field excluded from
+    comparison; submit() sets it to route the result back to the caller.
+    """
+
+    def __init__(self, batch: BatchMethod):
+        self._batch = batch
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._waiting: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._pump_task: asyncio.Task | None = None
+        self._error: BaseException | None = None
+
+    async def __aenter__(self) -> "BatchDispatcher[Req, Res]":
+        self._pump_task = asyncio.create_task(self._pump())
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+            try:
+                await self._pump_task
+            except asyncio.CancelledError:
+                pass
+            self._pump_task = None
+        for future in self._waiting.values():
+            future.cancel()
+        self._waiting.clear()
+
+    async def submit(self, request: Req) -> Res:
+        """Queue one request and wait for its result."""
+        if self._error is not None:
+            raise self._error
+        tag = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[tag] = future
+        self._queue.put_nowait(replace(request, tag=tag))
+        try:
+            return await future
+        finally:
+            self._waiting.pop(tag, None)
+
+    async def _requests(self) -> AsyncIterator[Req]:
+        while True:
+            yield await self._queue.get()
+
+    async def _pump(self) -> None:
+        batch = self._batch(self._requests())
+        try:
+            async for request, result in batch:
+                future = self._waiting.get(request.tag)
+                # The submitter may have been cancelled (pause) meanwhile
+                if future is not None and not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            logger.exception("Batch call failed")
+            self._error = e
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            aclose = getattr(batch, "aclose", None)
+            if aclose is not None:
+                await aclose()
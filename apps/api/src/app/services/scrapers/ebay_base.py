@@ -8,7 +8,13 @@ Oxylabs API, mock for testing).
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Iterable
+
+from .batching import run_batch
+
+if TYPE_CHECKING:
+    from app.services.run_metrics import RunMetrics
 
 
 @dataclass
@@ -30,6 +36,21 @@ class EbaySearchResult:
     has_more: bool
     error: str | None = None
     url: str | None = None  # The search URL used
+    retry_after: float | None = None  # Seconds, from a rate-limited response
+
+
+@dataclass(frozen=True)
+class SellerSearchRequest:
+    """One eBay search page request, for search_many.
+
+    `tag` is for the caller to correlate results and is ignored when
+    comparing requests, so equal requests can share one upstream call.
+    """
+
+    query: str
+    amazon_price: float
+    page: int = 1
+    tag: Any = field(default=None, compare=False)
 
 
 class EbayScraperService(ABC):
@@ -37,9 +58,17 @@ class EbayScraperService(ABC):
 
     Implementations:
     - OxylabsEbayScraper: Production implementation using Oxylabs Web Scraper API
-    - MockEbayScraper: Testing implementation with static data
+    - MockEbayScraper: Seeded generated data with latency and fault
+      injection, for load testing without credentials (SCRAPER_BACKEND=mock)
+
+    Set `metrics` to a RunMetrics instance to have upstream requests
+    accounted against a collection run. `max_concurrency` is the number of
+    upstream requests the backend is designed to keep in flight.
     """
 
+    metrics: RunMetrics | None = None
+    max_concurrency: int = 6
+
     @abstractmethod
     async def search_sellers(
         self,
@@ -67,3 +96,25 @@ class EbayScraperService(ABC):
             EbaySearchResult with extracted sellers and error info
         """
         pass
+
+    async def search_many(
+        self,
+        requests: Iterable[SellerSearchRequest] | AsyncIterable[SellerSearchRequest],
+        concurrency: int | None = None,
+    ) -> AsyncIterator[tuple[SellerSearchRequest, EbaySearchResult]]:
+        """Run many searches, yielding (request, result) as each completes.
+
+        The default runs search_sellers with up to `concurrency`
+        (default max_concurrency) requests in flight and collapses
+        identical requests; backends with a batch endpoint can override it.
+        """
+        async def search(request: SellerSearchRequest) -> EbaySearchResult:
+            return await self.search_sellers(request.query, request.amazon_price, request.page)
+
+        def failed(request: SellerSearchRequest, error: Exception) -> EbaySearchResult:
+            return EbaySearchResult(
+                sellers=[], page=request.page, has_more=False, error=str(error)
+            )
+
+        async for item in run_batch(search, requests, concurrency or self.max_concurrency, failed):
+            yield item
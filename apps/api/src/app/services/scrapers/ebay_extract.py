@@ -0,0 +1,281 @@
+"""Seller extraction from rendered eBay search result pages.
+
+Rendered result pages are often megabytes of HTML, most of it scripts,
+styles and page chrome. Extraction therefore:
+- slices the document down to the results container (srp-results ...
+  pagination) before scanning, falling back to the whole page if eBay
+  changes the markers
+- uses precompiled patterns
+- runs the layout-independent fallback only around "% positive" anchors
+  instead of over the whole document
+
+Two backends are available (EBAY_EXTRACTOR env var, default "regex"):
+    regex   Precompiled patterns over the sliced results container
+    html    Stdlib html.parser walk of the results container; slower, but
+            tolerant of attribute order and markup changes inside a card
+
+Both return the same ExtractedPage, filtered and deduped identically.
+benchmarks/ebay_extraction.py compares their speed and accuracy on the
+saved page corpus in benchmarks/corpus/ebay.
+"""
+
+import logging
+import os
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+
+from .ebay_base import EbaySeller
+
+logger = logging.getLogger(__name__)
+
+EXTRACTOR_BACKENDS = ("regex", "html")
+
+# Current card structure:
+# <div class="s-card__attribute-row">
+#   <span>sellername </span>
+#   <span>99.6% positive (785)</span>
+# </div>
+CARD_PATTERN = re.compile(
+    r's-card__attribute-row"[^>]*>\s*<span[^>]*>([^<]+)</span>\s*<span[^>]*>([^<]*positive[^<]*)</span>'
+)
+
+# Generic ">username</span> ... >XX.X% positive</span>", anchored at the end
+# so it can be applied to a small window ending at a "% positive" span.
+# Username must look valid (no spaces, 3-25 chars, starts with a letter).
+FALLBACK_PATTERN = re.compile(
+    r'>([a-zA-Z][a-zA-Z0-9_\-\.]{2,24})\s*</span>[^>]{0,200}>(\d{1,3}(?:\.\d)?\s*%\s*positive[^<]*)</span>\Z'
+)
+FALLBACK_ANCHOR = re.compile(r"%\s*positive")
+# Longest possible fallback match before its "% positive" anchor
+FALLBACK_WINDOW = 320
+
+PERCENT_PATTERN = re.compile(r"(\d+\.?\d*)%")
+FEEDBACK_TEXT_PATTERN = re.compile(r"^\d{1,3}(?:\.\d)?\s*%\s*positive")
+USERNAME_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9_\-\.]{2,24}$")
+
+# Most common marker first: a miss scans the whole page
+RESULTS_START_MARKERS = ('class="srp-results', 'id="srp-river-results"')
+RESULTS_END_MARKERS = ('class="pagination', 'class="srp-pagination')
+
+# Result item markers (current s-card and legacy s-item layouts)
+CARD_MARKERS = ('class="s-card ', 'class="s-item ')
+NO_RESULTS_MARKER = "srp-save-null-search"
+
+SKIP_NAMES = {"myebay", "savedsellers", "watchlist", "purchase-history", "signin"}
+
+
+@dataclass
+class ExtractedPage:
+    """Sellers found on one result page.
+
+    container_found, no_results, cards and matches describe the page itself
+    and are used to judge whether an unrendered fetch was good enough
+    (see looks_complete).
+    """
+
+    sellers: list[EbaySeller]
+    has_more: bool
+    used_fallback: bool = False
+    container_found: bool = False
+    no_results: bool = False
+    cards: int = 0
+    matches: int = 0
+
+    @property
+    def looks_complete(self) -> bool:
+        """True if the page needs no browser render to be trusted.
+
+        Either eBay says there are no results, or the results container was
+        present and seller info was found for at least half of the cards
+        (seller rows that are filled in by JavaScript would be missing).
+        """
+        if self.no_results:
+            return True
+        return bool(self.sellers) and self.container_found and self.matches * 2 >= self.cards
+
+
+def get_extractor_backend() -> str:
+    backend = os.environ.get("EBAY_EXTRACTOR", "regex").lower()
+    if backend not in EXTRACTOR_BACKENDS:
+        raise ValueError(
+            f"Unknown EBAY_EXTRACTOR '{backend}' (expected one of {', '.join(EXTRACTOR_BACKENDS)})"
+        )
+    return backend
+
+
+def results_bounds(content: str) -> tuple[int, int, bool]:
+    """(start, end, found) of the result cards; the whole page if not found.
+
+    The pagination nav follows the results, so `end` also marks where to
+    look for the next-page link.
+    """
+    start = -1
+    for marker in RESULTS_START_MARKERS:
+        start = content.find(marker)
+        if start != -1:
+            break
+    if start == -1:
+        return 0, len(content), False
+
+    # Back up to the opening tag so patterns anchored on '>' still match
+    start = max(0, content.rfind("<", 0, start))
+    for marker in RESULTS_END_MARKERS:
+        end = content.find(marker, start)
+        if end != -1:
+            return start, end, True
+    return start, len(content), False
+
+
+def build_sellers(matches: list[tuple[str, str]]) -> list[EbaySeller]:
+    """Filter and dedupe (username, feedback text) pairs into sellers."""
+    sellers = []
+    seen_usernames: set[str] = set()
+
+    for seller_name, feedback_str in matches:
+        seller_name = seller_name.strip()
+
+        if not seller_name or len(seller_name) < 2:
+            continue
+        if seller_name.lower() in SKIP_NAMES:
+            continue
+        if seller_name in seen_usernames:
+            continue
+        if " " in seller_name or seller_name.startswith("$"):
+            continue
+
+        seen_usernames.add(seller_name)
+
+        feedback_percent = None
+        percent_match = PERCENT_PATTERN.search(feedback_str)
+        if percent_match:
+            try:
+                feedback_percent = float(percent_match.group(1))
+            except ValueError:
+                pass
+
+        sellers.append(
+            EbaySeller(
+                username=seller_name,
+                feedback_count=None,
+                positive_percent=feedback_percent,
+                item_url=f"https://www.ebay.com/usr/{seller_name}",
+            )
+        )
+    return sellers
+
+
+# ============================================================
+# Regex backend
+# ============================================================
+
+
+def _fallback_matches(content: str, start: int, end: int) -> list[tuple[str, str]]:
+    """Apply FALLBACK_PATTERN only to windows ending at '% positive' spans."""
+    matches = []
+    for anchor in FALLBACK_ANCHOR.finditer(content, start, end):
+        span_end = content.find("</span>", anchor.end(), end)
+        if span_end == -1:
+            break
+        window_start = max(start, anchor.start() - FALLBACK_WINDOW)
+        match = FALLBACK_PATTERN.search(content[window_start:span_end + len("</span>")])
+        if match:
+            matches.append(match.groups())
+    return matches
+
+
+def _extract_regex(content: str, start: int, end: int) -> tuple[list[tuple[str, str]], bool]:
+    matches = CARD_PATTERN.findall(content, start, end)
+    if matches:
+        return matches, False
+    return _fallback_matches(content, start, end), True
+
+
+# ============================================================
+# HTML parser backend
+# ============================================================
+
+
+class _SpanCollector(HTMLParser):
+    """Collects the text of innermost spans, grouped by s-card__attribute-row."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: list[list[str]] = []
+        self.spans: list[str] = []
+        self._row_depth = 0
+        self._div_depth = 0
+        self._span_texts: list[list[str]] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "div":
+            self._div_depth += 1
+            classes = (dict(attrs).get("class") or "").split()
+            if "s-card__attribute-row" in classes and not self._row_depth:
+                self._row_depth = self._div_depth
+                self.rows.append([])
+        elif tag == "span":
+            self._span_texts.append([])
+
+    def handle_endtag(self, tag):
+        if tag == "div":
+            if self._row_depth == self._div_depth:
+                self._row_depth = 0
+            self._div_depth = max(0, self._div_depth - 1)
+        elif tag == "span" and self._span_texts:
+            text = "".join(self._span_texts.pop())
+            if text.strip():
+                self.spans.append(text)
+                if self._row_depth:
+                    self.rows[-1].append(text)
+
+    def handle_data(self, data):
+        if self._span_texts:
+            self._span_texts[-1].append(data)
+
+
+def _extract_html(content: str, start: int, end: int) -> tuple[list[tuple[str, str]], bool]:
+    collector = _SpanCollector()
+    collector.feed(content[start:end])
+    collector.close()
+
+    matches = [
+        (row[0], row[1])
+        for row in collector.rows
+        if len(row) >= 2 and "positive" in row[1]
+    ]
+    if matches:
+        return matches, False
+
+    # Fallback: a username-like span immediately followed by a feedback span
+    spans = [s.strip() for s in collector.spans]
+    fallback = [
+        (name, feedback)
+        for name, feedback in zip(spans, spans[1:])
+        if USERNAME_PATTERN.match(name) and FEEDBACK_TEXT_PATTERN.match(feedback)
+    ]
+    return fallback, True
+
+
+_BACKENDS = {
+    "regex": _extract_regex,
+    "html": _extract_html,
+}
+
+
+def extract_sellers(content: str, backend: str | None = None) -> ExtractedPage:
+    """Extract sellers and pagination state from a rendered result page."""
+    backend = backend or get_extractor_backend()
+    start, end, found = results_bounds(content)
+    matches, used_fallback = _BACKENDS[backend](content, start, end)
+    if used_fallback and matches:
+        logger.info(f"Using fallback pattern, found {len(matches)} matches")
+    return ExtractedPage(
+        sellers=build_sellers(matches),
+        has_more=content.find("pagination__next", end if found else 0) != -1,
+        used_fallback=used_fallback,
+        container_found=found,
+        no_results=content.find(NO_RESULTS_MARKER, start, end) != -1,
+        cards=sum(content.count(marker, start, end) for marker in CARD_MARKERS),
+        matches=len(matches),
+    )
@@ -0,0 +1,84 @@
+"""Scraper backend selection.
+
+CollectionService asks this module for its scrapers instead of constructing
+OxylabsAmazonScraper / OxylabsEbayScraper directly, so the backend can be
+switched through configuration:
+
+    SCRAPER_BACKEND=oxylabs   Live Oxylabs realtime API (default)
+    SCRAPER_BACKEND=batch     Live Oxylabs push-pull batch API (see oxylabs_batch.py)
+    SCRAPER_BACKEND=replay    Serve recorded responses from OXYLABS_REPLAY_DIR
+                              OXYLABS_REPLAY_LATENCY_SCALE: 0 = instant (default),
+                              1.0 = recorded timing
+                              OXYLABS_REPLAY_STRICT=1: 404 on unrecorded payloads
+    SCRAPER_BACKEND=mock      Generated data with injected latency and faults,
+                              no credentials needed (MOCK_* settings, see mock.py)
+
+Constructors raise ValueError when the backend is misconfigured (missing
+credentials or recording directory), matching the Oxylabs scrapers.
+"""
+
+import os
+
+from .base import AmazonScraperService
+from .ebay_base import EbayScraperService
+from .oxylabs import OxylabsAmazonScraper
+from .oxylabs_ebay import OxylabsEbayScraper
+
+SCRAPER_BACKENDS = ("oxylabs", "batch", "replay", "mock")
+
+
+def get_scraper_backend() -> str:
+    """Configured backend name (validated)."""
+    backend = os.environ.get("SCRAPER_BACKEND", "oxylabs").lower()
+    if backend not in SCRAPER_BACKENDS:
+        raise ValueError(
+            f"Unknown SCRAPER_BACKEND '{backend}' (expected one of {', '.join(SCRAPER_BACKENDS)})"
+        )
+    return backend
+
+
+def _replay_options() -> dict:
+    directory = os.environ.get("OXYLABS_REPLAY_DIR")
+    if not directory:
+        raise ValueError("OXYLABS_REPLAY_DIR environment variable required for replay backend")
+    return {
+        "directory": directory,
+        "latency_scale": float(os.environ.get("OXYLABS_REPLAY_LATENCY_SCALE", "0")),
+        "strict": os.environ.get("OXYLABS_REPLAY_STRICT", "").lower() in ("1", "true", "yes"),
+    }
+
+
+def create_amazon_scraper() -> AmazonScraperService:
+    """Build the Amazon scraper for the configured backend."""
+    backend = get_scraper_backend()
+    if backend == "replay":
+        from .replay import ReplayAmazonScraper
+
+        return ReplayAmazonScraper(**_replay_options())
+    if backend == "batch":
+        from .oxylabs_batch import OxylabsBatchAmazonScraper
+
+        return OxylabsBatchAmazonScraper()
+    if backend == "mock":
+        from .mock import MockAmazonScraper
+
+        return MockAmazonScraper.from_env()
+    return OxylabsAmazonScraper()
+
+
+def create_ebay_scraper() -> EbayScraperService:
+    """Build the eBay scraper for the configured backend."""
+    backend = get_scraper_backend()
+    if backend == "replay":
+        from .replay import ReplayEbayScraper
+
+        return ReplayEbayScraper(**_replay_options())
+    if backend == "batch":
+        from .oxylabs_batch import OxylabsBatchEbayScraper
+
+        return OxylabsBatchEbayScraper()
+    if backend == "mock":
+        from .mock import MockEbayScraper
+
+        return MockEbayScraper.from_env()
+    return OxylabsEbayScraper()
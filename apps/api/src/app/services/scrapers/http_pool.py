@@ -0,0 +1,179 @@
+"""Shared, long-lived HTTP clients for the Oxylabs scrapers.
+
+Opening an httpx.AsyncClient per request pays DNS, TCP and TLS setup on
+every call. Instead, all Oxylabs scrapers share one pooled client per event
+loop, created lazily on first use and closed on app shutdown
+(close_http_clients() from the FastAPI lifespan).
+
+- HTTP/2 is negotiated when the `h2` package is installed (httpx[http2]);
+  otherwise the pool falls back to HTTP/1.1 keep-alive.
+- Pool size and keepalive are tunable via OXYLABS_MAX_CONNECTIONS,
+  OXYLABS_MAX_KEEPALIVE and OXYLABS_KEEPALIVE_EXPIRY.
+- Connection reuse is measured with httpcore's "trace" request extension:
+  a request that opened a TCP connection counts as new, anything else as
+  reused. Totals are kept in `pool_stats` (served by GET /admin/http/stats)
+  and per run in RunMetrics.
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Workers per phase is 6 and several runs (orgs) can overlap, so allow a
+# few more connections than that. Rendered eBay pages hold a connection for
+# up to 90s, so idle connections are kept long enough to survive between them.
+MAX_CONNECTIONS = int(os.getenv("OXYLABS_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OXYLABS_MAX_KEEPALIVE", "20"))
+KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("OXYLABS_KEEPALIVE_EXPIRY", "120"))
+
+# Upper bound for a single request; callers pass tighter per-request timeouts
+DEFAULT_TIMEOUT = httpx.Timeout(90.0, connect=10.0)
+
+
+def pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+    )
+
+
+def create_pooled_transport() -> httpx.AsyncHTTPTransport:
+    """Network transport with the shared pool settings."""
+    return httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=pool_limits())
+
+
+class PoolStats:
+    """Process-wide connection reuse counters."""
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+
+    @property
+    def reused_connections(self) -> int:
+        return self.requests - self.new_connections
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "reuse_ratio": (
+                round(self.reused_connections / self.requests, 3) if self.requests else None
+            ),
+            "http2": HTTP2_AVAILABLE,
+        }
+
+
+pool_stats = PoolStats()
+
+# Shared network client, keyed to the loop it was created on
+_shared_client: httpx.AsyncClient | None = None
+_shared_loop: asyncio.AbstractEventLoop | None = None
+
+# Clients built around custom transports (recording); closed on shutdown too
+_extra_clients: "weakref.WeakSet[httpx.AsyncClient]" = weakref.WeakSet()
+
+# Shared clients replaced because their loop was no longer current, and
+# whose loop was not running to close them; closed on shutdown
+_retired_clients: list[httpx.AsyncClient] = []
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the pooled Oxylabs client for the running event loop."""
+    global _shared_client, _shared_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_loop is not loop:
+        if _shared_client is not None and not _shared_client.is_closed:
+            _retire_client(_shared_client, _shared_loop)
+        _shared_client = httpx.AsyncClient(
+            transport=create_pooled_transport(),
+            timeout=DEFAULT_TIMEOUT,
+        )
+        _shared_loop = loop
+        logger.info(
+            f"Created pooled Oxylabs client (http2={HTTP2_AVAILABLE}, "
+            f"max_connections={MAX_CONNECTIONS})"
+        )
+    return _shared_client
+
+
+def _retire_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Close a shared client left behind by another event loop.
+
+    Its connections belong to that loop, so it is closed there when the loop
+    is still running; otherwise it is kept for close_http_clients().
+    """
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    else:
+        _retired_clients.append(client)
+
+
+def create_client(transport: httpx.AsyncBaseTransport) -> httpx.AsyncClient:
+    """Long-lived client around a custom transport, closed with the pool."""
+    client = httpx.AsyncClient(transport=transport, timeout=DEFAULT_TIMEOUT)
+    _extra_clients.add(client)
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close all pooled clients. Called on app shutdown."""
+    global _shared_client, _shared_loop
+    clients = list(_extra_clients) + _retired_clients
+    if _shared_client is not None:
+        clients.append(_shared_client)
+    for client in clients:
+        if client.is_closed:
+            continue
+        try:
+            await client.aclose()
+        except RuntimeError as e:
+            # Connections of a loop that has since closed can't be shut down
+            # cleanly; the client is still marked closed and its sockets go
+            # with their transports
+            logger.debug(f"Closed Oxylabs HTTP client from a finished loop: {e}")
+    _extra_clients.clear()
+    _retired_clients.clear()
+    _shared_client = None
+    _shared_loop = None
+    if pool_stats.requests:
+        logger.info(f"Closed Oxylabs HTTP clients: {pool_stats.to_dict()}")
+
+
+def http_pool_stats() -> dict:
+    """Connection reuse totals and pool settings, for the admin stats."""
+    return {
+        **pool_stats.to_dict(),
+        "max_connections": MAX_CONNECTIONS,
+        "max_keepalive_connections": MAX_KEEPALIVE_CONNECTIONS,
+        "keepalive_expiry_seconds": KEEPALIVE_EXPIRY_SECONDS,
+        "open_clients": sum(
+            1 for client in [_shared_client, *_extra_clients, *_retired_clients]
+            if client is not None and not client.is_closed
+        ),
+    }
+
+
+class ConnectionTrace:
+    """httpcore trace callback that notes whether a request opened a connection."""
+
+    def __init__(self):
+        self.new_connection = False
+
+    async def __call__(self, event_name: str, info: dict) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.new_connection = True
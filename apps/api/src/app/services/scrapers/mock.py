@@ -0,0 +1,258 @@
+"""Mock scraper backends for load and chaos testing.
+
+MockAmazonScraper and MockEbayScraper implement the scraper interfaces
+without credentials or network access. Each request sleeps for a latency
+drawn from a configurable distribution and fails with injected rate
+limits, timeouts or 5xx errors at configurable rates, so the whole
+collection system (runner, retries, circuit breakers, SSE, database) can
+be driven at scale.
+
+Generated data is deterministic: products depend only on (seed, node,
+page) and sellers on (seed, query, page), whatever order concurrent
+requests complete in. Fault injection draws from its own seeded stream.
+
+Selected with SCRAPER_BACKEND=mock; configured per source through
+MOCK_AMAZON_* / MOCK_EBAY_* (see MockProfile.from_env):
+
+    MOCK_<SOURCE>_LATENCY_MS         mean latency (default 0)
+    MOCK_<SOURCE>_LATENCY_DIST       fixed, uniform, normal, lognormal (default)
+                                     or exponential
+    MOCK_<SOURCE>_LATENCY_SPREAD     relative spread (uniform/normal) or
+                                     sigma (lognormal) (default 0.5)
+    MOCK_<SOURCE>_RATE_LIMIT_RATE    probability of a 429 (default 0)
+    MOCK_<SOURCE>_RETRY_AFTER        Retry-After seconds sent with a 429
+    MOCK_<SOURCE>_TIMEOUT_RATE       probability of a timeout (default 0)
+    MOCK_<SOURCE>_SERVER_ERROR_RATE  probability of a 503 (default 0)
+    MOCK_<SOURCE>_CONCURRENCY        max_concurrency (default 6)
+    MOCK_SCRAPER_SEED                seed for data and faults (default 1)
+
+plus MOCK_AMAZON_PRODUCTS_PER_PAGE (50), MOCK_AMAZON_TOTAL_PAGES (2),
+MOCK_EBAY_SELLERS_PER_PAGE (20), MOCK_EBAY_SELLER_POOL (50000) and
+MOCK_EBAY_PAGES (3, pages per search before has_more is false).
+"""
+
+import asyncio
+import math
+import os
+import random
+import time
+from dataclasses import dataclass
+
+from app.services.run_metrics import classify_outcome
+
+from .base import AmazonProduct, AmazonScraperService, ScrapeResult
+from .ebay_base import EbayScraperService, EbaySearchResult, EbaySeller
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+
+@dataclass
+class MockProfile:
+    """Latency distribution and fault injection rates for one mock source."""
+
+    latency_ms: float = 0.0
+    latency_dist: str = "lognormal"
+    latency_spread: float = 0.5
+    rate_limit_rate: float = 0.0
+    retry_after: float | None = None
+    timeout_rate: float = 0.0
+    server_error_rate: float = 0.0
+    concurrency: int = 6
+    seed: int = 1
+
+    def __post_init__(self):
+        if self.latency_dist not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution '{self.latency_dist}' "
+                f"(expected one of {', '.join(LATENCY_DISTRIBUTIONS)})"
+            )
+
+    @classmethod
+    def from_env(cls, source: str) -> "MockProfile":
+        """Profile from MOCK_<SOURCE>_* environment variables."""
+        prefix = f"MOCK_{source.upper()}_"
+
+        def env(name: str, default: str) -> str:
+            return os.environ.get(prefix + name, default)
+
+        retry_after = env("RETRY_AFTER", "")
+        return cls(
+            latency_ms=float(env("LATENCY_MS", "0")),
+            latency_dist=env("LATENCY_DIST", "lognormal").lower(),
+            latency_spread=float(env("LATENCY_SPREAD", "0.5")),
+            rate_limit_rate=float(env("RATE_LIMIT_RATE", "0")),
+            retry_after=float(retry_after) if retry_after else None,
+            timeout_rate=float(env("TIMEOUT_RATE", "0")),
+            server_error_rate=float(env("SERVER_ERROR_RATE", "0")),
+            concurrency=int(env("CONCURRENCY", "6")),
+            seed=int(os.environ.get("MOCK_SCRAPER_SEED", "1")),
+        )
+
+    def sample_latency_ms(self, rng: random.Random) -> float:
+        mean, spread = self.latency_ms, self.latency_spread
+        if mean <= 0:
+            return 0.0
+        if self.latency_dist == "fixed":
+            return mean
+        if self.latency_dist == "uniform":
+            return rng.uniform(mean * (1 - spread), mean * (1 + spread))
+        if self.latency_dist == "normal":
+            return max(0.0, rng.gauss(mean, mean * spread))
+        if self.latency_dist == "exponential":
+            return rng.expovariate(1 / mean)
+        # lognormal with the configured mean: long tail, like real upstreams
+        mu = math.log(mean) - spread * spread / 2
+        return rng.lognormvariate(mu, spread)
+
+    def sample_error(self, rng: random.Random) -> str | None:
+        roll = rng.random()
+        if roll < self.rate_limit_rate:
+            return "rate_limited"
+        roll -= self.rate_limit_rate
+        if roll < self.timeout_rate:
+            return "timeout"
+        roll -= self.timeout_rate
+        if roll < self.server_error_rate:
+            return "http_error:503"
+        return None
+
+
+class _MockRequests:
+    """Shared latency/fault simulation and metrics accounting."""
+
+    metrics_source: str
+
+    def _init_mock(self, profile: MockProfile | None) -> None:
+        self.profile = profile or MockProfile()
+        self.max_concurrency = self.profile.concurrency
+        self._fault_rng = random.Random(f"{self.profile.seed}:{self.metrics_source}:faults")
+
+    async def _simulate(self) -> tuple[str | None, float | None]:
+        """Sleep for a sampled latency; return (injected error, retry_after)."""
+        started = time.monotonic()
+        await asyncio.sleep(self.profile.sample_latency_ms(self._fault_rng) / 1000)
+        error = self.profile.sample_error(self._fault_rng)
+        if self.metrics is not None:
+            self.metrics.record_request(
+                self.metrics_source,
+                classify_outcome(error),
+                (time.monotonic() - started) * 1000,
+            )
+        retry_after = self.profile.retry_after if error == "rate_limited" else None
+        return error, retry_after
+
+    def _data_rng(self, *key) -> random.Random:
+        return random.Random(":".join(str(part) for part in (self.profile.seed, *key)))
+
+
+class MockAmazonScraper(_MockRequests, AmazonScraperService):
+    """Generates `products_per_page` products for every best-sellers page."""
+
+    metrics_source = "amazon"
+
+    def __init__(
+        self,
+        profile: MockProfile | None = None,
+        products_per_page: int = 50,
+        total_pages: int = 2,
+    ):
+        self._init_mock(profile)
+        self.products_per_page = products_per_page
+        self.total_pages = total_pages
+
+    @classmethod
+    def from_env(cls) -> "MockAmazonScraper":
+        return cls(
+            MockProfile.from_env("amazon"),
+            products_per_page=int(os.environ.get("MOCK_AMAZON_PRODUCTS_PER_PAGE", "50")),
+            total_pages=int(os.environ.get("MOCK_AMAZON_TOTAL_PAGES", "2")),
+        )
+
+    async def fetch_bestsellers(
+        self,
+        category_node_id: str,
+        page: int = 1,
+        category_name: str | None = None,
+    ) -> ScrapeResult:
+        error, retry_after = await self._simulate()
+        if error:
+            return ScrapeResult(
+                products=[], page=page, total_pages=None, error=error, retry_after=retry_after
+            )
+        if page > self.total_pages:
+            return ScrapeResult(products=[], page=page, total_pages=self.total_pages)
+
+        rng = self._data_rng("amazon", category_node_id, page)
+        offset = (page - 1) * self.products_per_page
+        products = []
+        for pos in range(1, self.products_per_page + 1):
+            asin = f"B{category_node_id}{offset + pos:05d}"
+            products.append(
+                AmazonProduct(
+                    asin=asin,
+                    title=f"Mock product {offset + pos} in node {category_node_id}",
+                    price=round(5 + rng.random() * 95, 2),
+                    currency="USD",
+                    rating=round(3 + rng.random() * 2, 1),
+                    url=f"https://www.amazon.com/dp/{asin}",
+                    position=pos,
+                )
+            )
+        return ScrapeResult(products=products, page=page, total_pages=self.total_pages)
+
+
+class MockEbayScraper(_MockRequests, EbayScraperService):
+    """Returns `sellers_per_page` sellers drawn from a fixed-size seller pool.
+
+    A smaller pool means more sellers already exist, exercising the
+    update path; a larger pool exercises inserts.
+    """
+
+    metrics_source = "ebay"
+
+    def __init__(
+        self,
+        profile: MockProfile | None = None,
+        sellers_per_page: int = 20,
+        seller_pool_size: int = 50_000,
+        pages: int = 3,
+    ):
+        self._init_mock(profile)
+        self.sellers_per_page = sellers_per_page
+        self.seller_pool_size = seller_pool_size
+        self.pages = pages
+
+    @classmethod
+    def from_env(cls) -> "MockEbayScraper":
+        return cls(
+            MockProfile.from_env("ebay"),
+            sellers_per_page=int(os.environ.get("MOCK_EBAY_SELLERS_PER_PAGE", "20")),
+            seller_pool_size=int(os.environ.get("MOCK_EBAY_SELLER_POOL", "50000")),
+            pages=int(os.environ.get("MOCK_EBAY_PAGES", "3")),
+        )
+
+    async def search_sellers(
+        self,
+        query: str,
+        amazon_price: float,
+        page: int = 1,
+    ) -> EbaySearchResult:
+        error, retry_after = await self._simulate()
+        if error:
+            return EbaySearchResult(
+                sellers=[], page=page, has_more=False, error=error, retry_after=retry_after
+            )
+
+        rng = self._data_rng("ebay", query, page)
+        sellers = []
+        for _ in range(self.sellers_per_page):
+            name = f"seller{rng.randrange(self.seller_pool_size):06d}"
+            sellers.append(
+                EbaySeller(
+                    username=name,
+                    feedback_count=None,
+                    positive_percent=round(95 + rng.random() * 5, 1),
+                    item_url=f"https://www.ebay.com/usr/{name}",
+                )
+            )
+        return EbaySearchResult(sellers=sellers, page=page, has_more=page < self.pages)
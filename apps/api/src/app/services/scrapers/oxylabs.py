@@ -5,25 +5,24 @@ Credentials: OXYLABS_USERNAME and OXYLABS_PASSWORD environment variables.
 """
 
 import logging
-import os
 
 import httpx
 
+from app.services.retry import parse_retry_after
+
 from .base import AmazonProduct, AmazonScraperService, ScrapeResult
+from .oxylabs_http import OxylabsHttpMixin
 
 logger = logging.getLogger(__name__)
 
 
-class OxylabsAmazonScraper(AmazonScraperService):
+class OxylabsAmazonScraper(OxylabsHttpMixin, AmazonScraperService):
     """Oxylabs E-Commerce API implementation for Amazon Best Sellers."""
 
-    def __init__(self):
-        self.username = os.environ.get("OXYLABS_USERNAME")
-        self.password = os.environ.get("OXYLABS_PASSWORD")
-        self.base_url = "https://realtime.oxylabs.io/v1/queries"
+    metrics_source = "amazon"
 
-        if not self.username or not self.password:
-            raise ValueError("OXYLABS_USERNAME and OXYLABS_PASSWORD environment variables required")
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None):
+        self._init_oxylabs(transport=transport)
 
     async def fetch_bestsellers(
         self,
@@ -35,10 +34,7 @@ class OxylabsAmazonScraper(AmazonScraperService):
         # Build the Amazon bestsellers URL for logging
         amazon_url = f"https://www.amazon.com/gp/bestsellers/node/{category_node_id}"
         display_name = category_name or category_node_id
-        print(f"\n{'='*60}")
-        print(f"[AMAZON] Fetching: {display_name}")
-        print(f"[AMAZON] URL: {amazon_url}")
-        print(f"[AMAZON] Node ID: {category_node_id}, Page: {page}")
+        logger.debug(f"Fetching {display_name} (node {category_node_id}, page {page}): {amazon_url}")
 
         payload = {
             "source": "amazon_bestsellers",
@@ -50,23 +46,17 @@ class OxylabsAmazonScraper(AmazonScraperService):
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.base_url,
-                    json=payload,
-                    auth=(self.username, self.password),
-                    timeout=30.0,
-                )
+            response = await self._post(payload, timeout=30.0)
 
             # Handle rate limiting
             if response.status_code == 429:
                 logger.warning(f"Rate limited on category {category_node_id}")
-                print(f"[AMAZON] ⚠ Rate limited - waiting...")
                 return ScrapeResult(
                     products=[],
                     page=page,
                     total_pages=None,
                     error="rate_limited",
+                    retry_after=parse_retry_after(response.headers.get("retry-after")),
                 )
 
             response.raise_for_status()
@@ -91,11 +81,12 @@ class OxylabsAmazonScraper(AmazonScraperService):
                 try:
                     # Debug: log raw price data for first product
                     if len(products) == 0:
-                        print(f"[AMAZON] DEBUG - Raw product data sample:")
-                        print(f"         price: {p.get('price')} (type: {type(p.get('price')).__name__})")
-                        print(f"         price_strikethrough: {p.get('price_strikethrough')}")
-                        print(f"         price_string: {p.get('price_string')}")
-                        print(f"         currency: {p.get('currency')}")
+                        logger.debug(
+                            f"Raw product data sample: price={p.get('price')} "
+                            f"(type: {type(p.get('price')).__name__}), "
+                            f"price_strikethrough={p.get('price_strikethrough')}, "
+                            f"price_string={p.get('price_string')}, currency={p.get('currency')}"
+                        )
 
                     # Price handling: Oxylabs may return price in cents or as float
                     raw_price = p.get("price")
@@ -122,12 +113,12 @@ class OxylabsAmazonScraper(AmazonScraperService):
                     continue
 
             logger.info(f"Fetched {len(products)} products from category {category_node_id}")
-            print(f"[AMAZON] ✓ Found {len(products)} products")
-            if products:
-                print(f"[AMAZON] Sample products:")
-                for p in products[:3]:  # Show first 3 products
-                    price_str = f"${p.price:.2f}" if p.price else "N/A"
-                    print(f"         - {p.title[:50]}... ({price_str})")
+            if products and logger.isEnabledFor(logging.DEBUG):
+                samples = ", ".join(
+                    f"{p.title[:50]}... ({f'${p.price:.2f}' if p.price else 'N/A'})"
+                    for p in products[:3]  # Show first 3 products
+                )
+                logger.debug(f"Sample products: {samples}")
 
             return ScrapeResult(
                 products=products,
@@ -138,7 +129,6 @@ class OxylabsAmazonScraper(AmazonScraperService):
 
         except httpx.TimeoutException:
             logger.error(f"Timeout fetching category {category_node_id}")
-            print(f"[AMAZON] ✗ Timeout error")
             return ScrapeResult(
                 products=[],
                 page=page,
@@ -147,7 +137,6 @@ class OxylabsAmazonScraper(AmazonScraperService):
             )
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching category {category_node_id}: {e}")
-            print(f"[AMAZON] ✗ HTTP error: {e.response.status_code}")
             return ScrapeResult(
                 products=[],
                 page=page,
@@ -156,7 +145,6 @@ class OxylabsAmazonScraper(AmazonScraperService):
             )
         except Exception as e:
             logger.error(f"Unexpected error fetching category {category_node_id}: {e}")
-            print(f"[AMAZON] ✗ Error: {e}")
             return ScrapeResult(
                 products=[],
                 page=page,
@@ -0,0 +1,210 @@
+"""Oxylabs push-pull (asynchronous batch) backend.
+
+The realtime endpoint holds a connection open until the page is scraped,
+which is up to 90s for a rendered eBay page, so run throughput is capped by
+the number of collection workers. The push-pull API instead accepts jobs
+immediately and lets us collect results later:
+
+    POST {base}/batch          submit up to OXYLABS_BATCH_MAX_SIZE queries
+    GET  {base}/{id}           job status: pending / done / faulted
+    GET  {base}/{id}/results   same JSON body the realtime endpoint returns
+
+OxylabsBatchAmazonScraper / OxylabsBatchEbayScraper reuse the realtime
+scrapers' payload building and parsing and only replace how a payload is
+sent (_send). Queries submitted by concurrent workers within
+OXYLABS_BATCH_WINDOW_MS are coalesced into one batch request, and waiting
+workers poll their job with backoff instead of holding a connection.
+Because a waiting worker costs nothing upstream, these backends advertise a
+much larger `max_concurrency`, so throughput is bounded by the provider's
+queue rather than by our worker count.
+
+Select with SCRAPER_BACKEND=batch. OXYLABS_BATCH_URL points the backend at
+a different server (e.g. a local stand-in in tests).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+
+import httpx
+
+from .oxylabs import OxylabsAmazonScraper
+from .oxylabs_ebay import OxylabsEbayScraper
+
+logger = logging.getLogger(__name__)
+
+OXYLABS_PUSH_PULL_URL = "https://data.oxylabs.io/v1/queries"
+
+BATCH_CONCURRENCY = int(os.getenv("OXYLABS_BATCH_CONCURRENCY", "50"))
+BATCH_WINDOW_SECONDS = int(os.getenv("OXYLABS_BATCH_WINDOW_MS", "250")) / 1000
+BATCH_MAX_SIZE = int(os.getenv("OXYLABS_BATCH_MAX_SIZE", "100"))
+POLL_INTERVAL_SECONDS = float(os.getenv("OXYLABS_BATCH_POLL_INTERVAL", "2"))
+POLL_MAX_INTERVAL_SECONDS = float(os.getenv("OXYLABS_BATCH_POLL_MAX_INTERVAL", "10"))
+JOB_TIMEOUT_SECONDS = float(os.getenv("OXYLABS_BATCH_JOB_TIMEOUT", "600"))
+
+# Payload field that varies per query; everything else must match to share a batch
+_VARYING_FIELDS = ("query", "url")
+
+
+class BatchSubmitError(Exception):
+    """Batch submission was rejected; carries the upstream response."""
+
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"Batch submission failed: HTTP {response.status_code}")
+        self.response = response
+
+
+def _batch_key(payload: dict) -> tuple[str, str]:
+    """(group key, varying field) for a payload.
+
+    Payloads can only share a batch when every field except the query/url
+    is identical.
+    """
+    field = next((f for f in _VARYING_FIELDS if f in payload), "query")
+    common = {k: v for k, v in payload.items() if k != field}
+    return json.dumps(common, sort_keys=True), field
+
+
+class BatchSubmitter:
+    """Coalesces concurrently submitted payloads into batch jobs.
+
+    submit() returns the Oxylabs job ID for one payload. Payloads with the
+    same shape arriving within `window_seconds` go out in one request; a
+    group is flushed early once it reaches `max_size`.
+    """
+
+    def __init__(self, scraper: "OxylabsBatchMixin", window_seconds: float, max_size: int):
+        self.scraper = scraper
+        self.window_seconds = window_seconds
+        self.max_size = max_size
+        self._pending: dict[str, list[tuple[dict, asyncio.Future]]] = {}
+        self._fields: dict[str, str] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._inflight: set[asyncio.Task] = set()
+        self.batches_sent = 0
+
+    async def submit(self, payload: dict) -> str:
+        loop = asyncio.get_running_loop()
+        key, field = _batch_key(payload)
+        future = loop.create_future()
+        group = self._pending.setdefault(key, [])
+        group.append((payload, future))
+        self._fields[key] = field
+
+        if len(group) >= self.max_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.window_seconds, self._flush, key)
+        return await future
+
+    def _flush(self, key: str) -> None:
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        group = self._pending.pop(key, [])
+        field = self._fields.pop(key, "query")
+        if group:
+            task = asyncio.create_task(self._submit_group(group, field))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _submit_group(self, group: list[tuple[dict, asyncio.Future]], field: str) -> None:
+        payloads = [p for p, _ in group]
+        try:
+            job_ids = await self.scraper._submit_batch(payloads, field)
+            self.batches_sent += 1
+        except Exception as e:
+            for _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), job_id in zip(group, job_ids):
+            if not future.done():
+                future.set_result(job_id)
+
+
+class OxylabsBatchMixin:
+    """Replaces the realtime request with submit + poll + fetch results."""
+
+    max_concurrency = BATCH_CONCURRENCY
+
+    def _init_oxylabs(self, *args, **kwargs) -> None:
+        super()._init_oxylabs(*args, **kwargs)
+        self.base_url = os.environ.get("OXYLABS_BATCH_URL", OXYLABS_PUSH_PULL_URL).rstrip("/")
+        self.poll_interval = POLL_INTERVAL_SECONDS
+        self.job_timeout = JOB_TIMEOUT_SECONDS
+        self.submitter = BatchSubmitter(self, BATCH_WINDOW_SECONDS, BATCH_MAX_SIZE)
+
+    async def _submit_batch(self, payloads: list[dict], field: str) -> list[str]:
+        """Submit payloads sharing all fields but `field`; returns job IDs in order."""
+        body = {k: v for k, v in payloads[0].items() if k != field}
+        body[field] = [p.get(field) for p in payloads]
+
+        response = await self._client().post(
+            f"{self.base_url}/batch",
+            json=body,
+            auth=(self.username, self.password),
+            timeout=30.0,
+        )
+        if response.status_code not in (200, 201, 202):
+            raise BatchSubmitError(response)
+
+        queries = response.json().get("queries") or []
+        if len(queries) != len(payloads):
+            raise ValueError(
+                f"Batch returned {len(queries)} jobs for {len(payloads)} queries"
+            )
+        logger.debug(f"Submitted Oxylabs batch of {len(payloads)} ({self.metrics_source})")
+        return [q["id"] for q in queries]
+
+    async def _send(self, payload: dict, timeout: float) -> httpx.Response:
+        """Submit the payload as a batch job and wait for its results.
+
+        `timeout` is the realtime per-request limit and is not used here;
+        jobs are given OXYLABS_BATCH_JOB_TIMEOUT seconds instead. Returns the
+        results response, or an error response for rejected/faulted jobs.
+        """
+        try:
+            job_id = await self.submitter.submit(payload)
+        except BatchSubmitError as e:
+            return e.response
+
+        client = self._client()
+        auth = (self.username, self.password)
+        deadline = time.monotonic() + self.job_timeout
+        delay = self.poll_interval
+
+        while True:
+            status_response = await client.get(f"{self.base_url}/{job_id}", auth=auth, timeout=30.0)
+            if status_response.status_code != 200:
+                return status_response
+
+            status = status_response.json().get("status")
+            if status == "done":
+                break
+            if status == "faulted":
+                return httpx.Response(
+                    502,
+                    json={"message": f"Oxylabs job {job_id} faulted"},
+                    request=status_response.request,
+                )
+            if time.monotonic() + delay > deadline:
+                raise httpx.ReadTimeout(
+                    f"Oxylabs job {job_id} not done after {self.job_timeout:.0f}s",
+                    request=status_response.request,
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, POLL_MAX_INTERVAL_SECONDS)
+
+        return await client.get(f"{self.base_url}/{job_id}/results", auth=auth, timeout=30.0)
+
+
+class OxylabsBatchAmazonScraper(OxylabsBatchMixin, OxylabsAmazonScraper):
+    """OxylabsAmazonScraper using the push-pull batch API."""
+
+
+class OxylabsBatchEbayScraper(OxylabsBatchMixin, OxylabsEbayScraper):
+    """OxylabsEbayScraper using the push-pull batch API."""
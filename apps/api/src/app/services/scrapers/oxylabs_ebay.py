@@ -1,34 +1,44 @@
 """Oxylabs Web Scraper API implementation for eBay seller search.
 
 Uses Oxylabs universal_ecommerce source to fetch eBay search results and extract
-seller data from the HTML. Credentials: OXYLABS_USERNAME and OXYLABS_PASSWORD
-environment variables.
+seller data from the HTML (see ebay_extract.py). Searches try an unrendered
+fetch first and fall back to a browser render (EBAY_TIERED_FETCH). Credentials: OXYLABS_USERNAME
+and OXYLABS_PASSWORD environment variables.
 """
 
 import logging
 import os
-import re
 from urllib.parse import quote_plus
 
 import httpx
 
-from .ebay_base import EbaySeller, EbayScraperService, EbaySearchResult
+from app.services.offload import offload
+from app.services.retry import parse_retry_after
+
+from .ebay_base import EbayScraperService, EbaySearchResult
+from .ebay_extract import ExtractedPage, extract_sellers
+from .oxylabs_http import OxylabsHttpMixin
 
 logger = logging.getLogger(__name__)
 
+# Tiered fetch: an unrendered page first, the browser render only when that
+# page has no sellers or looks incomplete. EBAY_TIERED_FETCH=0 always renders.
+PLAIN_TIMEOUT = 30.0
+RENDER_TIMEOUT = 90.0
+
+
+def tiered_fetch_enabled() -> bool:
+    return os.getenv("EBAY_TIERED_FETCH", "1").lower() not in ("0", "false", "no")
 
-class OxylabsEbayScraper(EbayScraperService):
+
+class OxylabsEbayScraper(OxylabsHttpMixin, EbayScraperService):
     """Oxylabs Web Scraper API implementation for eBay seller search."""
 
-    def __init__(self):
-        self.username = os.environ.get("OXYLABS_USERNAME")
-        self.password = os.environ.get("OXYLABS_PASSWORD")
-        self.base_url = "https://realtime.oxylabs.io/v1/queries"
+    metrics_source = "ebay"
 
-        if not self.username or not self.password:
-            raise ValueError(
-                "OXYLABS_USERNAME and OXYLABS_PASSWORD environment variables required"
-            )
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None):
+        self._init_oxylabs(transport=transport)
+        self.tiered_fetch = tiered_fetch_enabled()
 
     def _build_search_url(
         self,
@@ -90,8 +100,11 @@ class OxylabsEbayScraper(EbayScraperService):
     ) -> EbaySearchResult:
         """Search eBay for sellers listing products matching the query.
 
-        Uses Oxylabs universal_ecommerce source with rendered HTML to extract
-        seller names from eBay's card structure.
+        Uses Oxylabs universal_ecommerce source to fetch the result page and
+        extract seller names from eBay's card structure. With tiered fetching
+        (the default), an unrendered page is requested first and the browser
+        render is only paid for when that page comes back without sellers or
+        looks incomplete.
 
         Args:
             query: Search term (Amazon product title)
@@ -105,46 +118,76 @@ class OxylabsEbayScraper(EbayScraperService):
 
         # Log the search with all parameters
         truncated_query = query[:60] + "..." if len(query) > 60 else query
-        print(f"\n{'-'*60}")
-        print(f"[EBAY] Searching: \"{truncated_query}\"")
-        print(f"[EBAY] Parameters:")
-        print(f"       Condition: {params['condition']}")
-        print(f"       Free Shipping: {params['free_shipping']}")
-        print(f"       US Only: {params['us_only']}")
-        print(f"       Price Range: ${params['price_min']:.2f} - ${params['price_max']:.2f}")
-        print(f"       Page: {params['page']}, Items/Page: {params['items_per_page']}")
-        print(f"[EBAY] URL: {url[:100]}...")
+        logger.debug(
+            f"Searching \"{truncated_query}\": condition={params['condition']}, "
+            f"free_shipping={params['free_shipping']}, us_only={params['us_only']}, "
+            f"price=${params['price_min']:.2f}-${params['price_max']:.2f}, "
+            f"page={params['page']}, per_page={params['items_per_page']}, url={url[:100]}..."
+        )
 
         payload = {
             "source": "universal_ecommerce",
             "url": url,
             "geo_location": "United States",
             "user_agent_type": "desktop",
+        }
+
+        if self.tiered_fetch:
+            result, extracted = await self._fetch_page(
+                "plain", payload, PLAIN_TIMEOUT, query, url, page
+            )
+            complete = extracted is not None and extracted.looks_complete
+            self._record_tier("plain", complete)
+            # A rate limit applies to the rendered request too; let the
+            # caller's retry loop back off instead of escalating
+            if complete or result.error == "rate_limited":
+                return result
+            logger.debug(f"Unrendered page incomplete, escalating to browser render: {query[:50]}...")
+
+        rendered_payload = {
+            **payload,
             "render": "html",
             "browser_instructions": [
                 {"type": "wait", "wait_time_s": 5},
             ],
         }
+        result, _ = await self._fetch_page(
+            "render", rendered_payload, RENDER_TIMEOUT, query, url, page
+        )
+        self._record_tier("render", result.error is None)
+        return result
 
+    def _record_tier(self, tier: str, hit: bool) -> None:
+        if self.metrics is not None:
+            self.metrics.record_tier(self.metrics_source, tier, hit)
+
+    async def _fetch_page(
+        self,
+        tier: str,
+        payload: dict,
+        timeout: float,
+        query: str,
+        url: str,
+        page: int,
+    ) -> tuple[EbaySearchResult, ExtractedPage | None]:
+        """Fetch one result page and extract sellers from it.
+
+        Returns the search result plus the extracted page (None when the
+        request failed), so the caller can judge whether to escalate.
+        """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.base_url,
-                    json=payload,
-                    auth=(self.username, self.password),
-                    timeout=90.0,
-                )
+            response = await self._post(payload, timeout=timeout)
 
             if response.status_code == 429:
                 logger.warning(f"Rate limited on eBay search: {query[:50]}...")
-                print(f"[EBAY] ⚠ Rate limited - waiting...")
                 return EbaySearchResult(
                     sellers=[],
                     page=page,
                     has_more=False,
                     error="rate_limited",
                     url=url,
-                )
+                    retry_after=parse_retry_after(response.headers.get("retry-after")),
+                ), None
 
             response.raise_for_status()
             data = response.json()
@@ -157,79 +200,22 @@ class OxylabsEbayScraper(EbayScraperService):
                     has_more=False,
                     error="empty_response",
                     url=url,
-                )
+                ), None
 
             content = results[0].get("content", "")
             if not isinstance(content, str):
                 content = str(content)
 
-            # PRIMARY: Extract from eBay's card structure (current format)
-            # <div class="s-card__attribute-row">
-            #   <span>sellername </span>
-            #   <span>99.6% positive (785)</span>
-            # </div>
-            card_matches = re.findall(
-                r's-card__attribute-row"[^>]*>\s*<span[^>]*>([^<]+)</span>\s*<span[^>]*>([^<]*positive[^<]*)</span>',
-                content
-            )
+            # Rendered pages are megabytes of HTML; keep the scan off the event loop
+            extracted = await offload("parse", extract_sellers, content)
+            sellers = extracted.sellers
+            has_more = extracted.has_more
 
-            # FALLBACK: Generic pattern for "username" followed by "XX.X% positive"
-            # Works if eBay changes class names but keeps the same text structure
-            if not card_matches:
-                # Look for: >username</span> ... >XX.X% positive</span>
-                # Constrained: username must look valid (no spaces, 3-25 chars, starts with letter)
-                fallback_matches = re.findall(
-                    r'>([a-zA-Z][a-zA-Z0-9_\-\.]{2,24})\s*</span>[^>]{0,200}>(\d{1,3}(?:\.\d)?\s*%\s*positive[^<]*)</span>',
-                    content
-                )
-                if fallback_matches:
-                    logger.info(f"Using fallback pattern, found {len(fallback_matches)} matches")
-                    card_matches = fallback_matches
-
-            sellers = []
-            seen_usernames: set[str] = set()
-            skip_names = {'myebay', 'savedsellers', 'watchlist', 'purchase-history', 'signin'}
-
-            for seller_name, feedback_str in card_matches:
-                seller_name = seller_name.strip()
-
-                if not seller_name or len(seller_name) < 2:
-                    continue
-                if seller_name.lower() in skip_names:
-                    continue
-                if seller_name in seen_usernames:
-                    continue
-                if ' ' in seller_name or seller_name.startswith('$'):
-                    continue
-
-                seen_usernames.add(seller_name)
-
-                feedback_percent = None
-                percent_match = re.search(r'(\d+\.?\d*)%', feedback_str)
-                if percent_match:
-                    try:
-                        feedback_percent = float(percent_match.group(1))
-                    except ValueError:
-                        pass
-
-                sellers.append(
-                    EbaySeller(
-                        username=seller_name,
-                        feedback_count=None,
-                        positive_percent=feedback_percent,
-                        item_url=f"https://www.ebay.com/usr/{seller_name}",
-                    )
-                )
-
-            has_more = "pagination__next" in content
-
-            logger.info(f"eBay search found {len(sellers)} sellers for: {query[:50]}...")
-            print(f"[EBAY] ✓ Found {len(sellers)} sellers")
+            logger.info(f"eBay search ({tier}) found {len(sellers)} sellers for: {query[:50]}...")
             if sellers:
-                print(f"[EBAY] Sellers: {', '.join(s.username for s in sellers[:5])}" +
-                      (f" (+{len(sellers)-5} more)" if len(sellers) > 5 else ""))
-            if has_more:
-                print(f"[EBAY] More pages available")
+                logger.debug(f"Sellers: {', '.join(s.username for s in sellers[:5])}" +
+                             (f" (+{len(sellers)-5} more)" if len(sellers) > 5 else "") +
+                             (", more pages available" if has_more else ""))
 
             return EbaySearchResult(
                 sellers=sellers,
@@ -237,35 +223,32 @@ class OxylabsEbayScraper(EbayScraperService):
                 has_more=has_more,
                 error=None,
                 url=url,
-            )
+            ), extracted
 
         except httpx.TimeoutException:
-            logger.error(f"Timeout on eBay search: {query[:50]}...")
-            print(f"[EBAY] ✗ Timeout error")
+            logger.error(f"Timeout on eBay search ({tier}): {query[:50]}...")
             return EbaySearchResult(
                 sellers=[],
                 page=page,
                 has_more=False,
                 error="timeout",
                 url=url,
-            )
+            ), None
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error on eBay search: {e}")
-            print(f"[EBAY] ✗ HTTP error: {e.response.status_code}")
+            logger.error(f"HTTP error on eBay search ({tier}): {e}")
             return EbaySearchResult(
                 sellers=[],
                 page=page,
                 has_more=False,
                 error=f"http_error:{e.response.status_code}",
                 url=url,
-            )
+            ), None
         except Exception as e:
             logger.error(f"Unexpected error on eBay search: {type(e).__name__}: {e}")
-            print(f"[EBAY] ✗ Error: {e}")
             return EbaySearchResult(
                 sellers=[],
                 page=page,
                 has_more=False,
                 error=f"{type(e).__name__}: {e}",
                 url=url,
-            )
+            ), None
@@ -0,0 +1,129 @@
+"""Shared HTTP plumbing for the Oxylabs realtime scrapers.
+
+Both OxylabsAmazonScraper and OxylabsEbayScraper post a JSON payload to the
+realtime queries endpoint. This mixin owns credentials and the request
+itself, so per-request accounting (latency, bytes, outcome) is recorded in
+one place regardless of which scraper issued it.
+
+Requests go through the shared pooled client from http_pool.py, so
+connections are reused across the whole run. The httpx transport is
+pluggable: setting OXYLABS_RECORD_DIR wraps a pooled transport in a
+RecordingTransport, and the replay backends swap in a ReplayTransport
+(see replay.py); those get a long-lived client of their own.
+"""
+
+import os
+import time
+
+import httpx
+
+from app.services.run_metrics import outcome_for_status
+
+from .http_pool import (
+    ConnectionTrace,
+    create_client,
+    create_pooled_transport,
+    get_shared_client,
+    pool_stats,
+)
+
+OXYLABS_REALTIME_URL = "https://realtime.oxylabs.io/v1/queries"
+
+
+class OxylabsHttpMixin:
+    """Credentials and request helper for Oxylabs-backed scrapers.
+
+    Subclasses set `metrics_source` to the key their requests are
+    accounted under ("amazon" or "ebay").
+    """
+
+    metrics_source: str = "oxylabs"
+
+    def _init_oxylabs(
+        self,
+        transport: httpx.AsyncBaseTransport | None = None,
+        credentials: tuple[str, str] | None = None,
+    ) -> None:
+        """Load credentials and pick the HTTP transport.
+
+        Args:
+            transport: Custom httpx transport (replay, tests). Defaults to the
+                shared pooled client, or a pooled transport wrapped in a
+                recorder if OXYLABS_RECORD_DIR is set.
+            credentials: (username, password) override; defaults to the
+                OXYLABS_USERNAME / OXYLABS_PASSWORD environment variables.
+        """
+        if credentials:
+            self.username, self.password = credentials
+        else:
+            self.username = os.environ.get("OXYLABS_USERNAME")
+            self.password = os.environ.get("OXYLABS_PASSWORD")
+        self.base_url = OXYLABS_REALTIME_URL
+
+        if not self.username or not self.password:
+            raise ValueError(
+                "OXYLABS_USERNAME and OXYLABS_PASSWORD environment variables required"
+            )
+
+        # Connection reuse is only meaningful when requests hit the network
+        self._traces_connections = transport is None
+
+        record_dir = os.environ.get("OXYLABS_RECORD_DIR")
+        if transport is None and record_dir:
+            from .replay import RecordingTransport
+
+            transport = RecordingTransport(create_pooled_transport(), record_dir)
+        self.transport = transport
+        self._http_client: httpx.AsyncClient | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """Shared pooled client, or this scraper's client for a custom transport."""
+        if self.transport is None:
+            return get_shared_client()
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = create_client(self.transport)
+        return self._http_client
+
+    async def _post(self, payload: dict, timeout: float) -> httpx.Response:
+        """Send a query payload and record it on the run's metrics.
+
+        Raises the same httpx exceptions as AsyncClient.post so callers keep
+        their existing error mapping.
+        """
+        started = time.monotonic()
+        outcome = "error"
+        response_bytes = 0
+        try:
+            response = await self._send(payload, timeout)
+            response_bytes = len(response.content)
+            outcome = outcome_for_status(response.status_code)
+            return response
+        except httpx.TimeoutException:
+            outcome = "timeout"
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_request(
+                    self.metrics_source,
+                    outcome,
+                    (time.monotonic() - started) * 1000,
+                    response_bytes=response_bytes,
+                    rendered=payload.get("render") == "html",
+                )
+
+    async def _send(self, payload: dict, timeout: float) -> httpx.Response:
+        """POST the payload to the realtime endpoint (overridden by batch backends)."""
+        trace = ConnectionTrace()
+        response = await self._client().post(
+            self.base_url,
+            json=payload,
+            auth=(self.username, self.password),
+            timeout=timeout,
+            extensions={"trace": trace},
+        )
+        if self._traces_connections:
+            pool_stats.requests += 1
+            pool_stats.new_connections += int(trace.new_connection)
+            if self.metrics is not None:
+                self.metrics.record_connection(self.metrics_source, trace.new_connection)
+        return response
@@ -0,0 +1,236 @@
+"""Record-and-replay harness for Oxylabs responses.
+
+Recording: set OXYLABS_RECORD_DIR before a real run. Every realtime query
+(request payload + raw response body + status + elapsed time) is written to
+that directory by RecordingTransport, which wraps the normal httpx transport.
+
+Replay: ReplayAmazonScraper / ReplayEbayScraper are the production scrapers
+with a ReplayTransport swapped in, so payload building, parsing and
+per-request accounting run exactly as they do against Oxylabs. Select them
+with SCRAPER_BACKEND=replay and OXYLABS_REPLAY_DIR (see factory.py).
+
+Directory layout:
+    index.jsonl          one line per recorded request (metadata only)
+    bodies/<key>.gz      gzip-compressed response body
+
+Requests are keyed by a hash of the canonical JSON payload. When a replayed
+payload was never recorded (e.g. different products on a later run), the
+non-strict replay falls back to the recorded responses for the same Oxylabs
+source in round-robin order, so a full pipeline can still be driven.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from itertools import cycle
+from pathlib import Path
+
+import httpx
+
+from .oxylabs import OxylabsAmazonScraper
+from .oxylabs_ebay import OxylabsEbayScraper, tiered_fetch_enabled
+
+logger = logging.getLogger(__name__)
+
+REPLAY_CREDENTIALS = ("replay", "replay")
+
+
+def payload_key(payload: dict) -> str:
+    """Stable key for a query payload (independent of dict ordering)."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+class ResponseStore:
+    """On-disk store of recorded Oxylabs responses."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.bodies_dir = self.directory / "bodies"
+        self.index_path = self.directory / "index.jsonl"
+        self._write_lock = threading.Lock()
+
+    def save(
+        self,
+        payload: dict,
+        status_code: int,
+        content_type: str | None,
+        body: bytes,
+        elapsed_ms: int,
+    ) -> str:
+        """Write one recorded response. Blocking - call via a thread."""
+        key = payload_key(payload)
+        entry = {
+            "key": key,
+            "source": payload.get("source"),
+            "status_code": status_code,
+            "content_type": content_type,
+            "elapsed_ms": elapsed_ms,
+            "size": len(body),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "payload": payload,
+        }
+        with self._write_lock:
+            self.bodies_dir.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.bodies_dir / f"{key}.gz", "wb") as f:
+                f.write(body)
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        return key
+
+    def load_index(self) -> dict[str, dict]:
+        """Read index entries keyed by payload key (latest recording wins)."""
+        entries: dict[str, dict] = {}
+        if not self.index_path.exists():
+            return entries
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entry = json.loads(line)
+                    entries[entry["key"]] = entry
+        return entries
+
+    def load_body(self, key: str) -> bytes:
+        with gzip.open(self.bodies_dir / f"{key}.gz", "rb") as f:
+            return f.read()
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that writes every query and response to a ResponseStore."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, directory: str | Path):
+        self.inner = inner
+        self.store = ResponseStore(directory)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(await request.aread() or b"{}")
+        started = time.monotonic()
+        response = await self.inner.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+
+        content_type = response.headers.get("content-type")
+        try:
+            await asyncio.to_thread(
+                self.store.save,
+                payload,
+                response.status_code,
+                content_type,
+                body,
+                elapsed_ms,
+            )
+        except OSError as e:
+            logger.warning(f"Failed to record Oxylabs response: {e}")
+
+        # Body is already decoded, so drop encoding/length headers from the copy
+        headers = [
+            (k, v)
+            for k, v in response.headers.items()
+            if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=body,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Transport that serves responses from a ResponseStore instead of the network.
+
+    Args:
+        directory: Recording directory (see module docstring)
+        latency_scale: Multiplier for recorded latency; 0 replays instantly,
+            1.0 reproduces the recorded timing
+        strict: If True, unrecorded payloads get a 404 instead of the
+            round-robin fallback
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        latency_scale: float = 0.0,
+        strict: bool = False,
+    ):
+        self.store = ResponseStore(directory)
+        self.latency_scale = latency_scale
+        self.strict = strict
+        self.entries = self.store.load_index()
+        if not self.entries:
+            raise ValueError(f"No recorded Oxylabs responses in {directory}")
+
+        by_source: dict[str, list[dict]] = {}
+        for entry in self.entries.values():
+            by_source.setdefault(entry.get("source") or "", []).append(entry)
+        self._fallback = {source: cycle(items) for source, items in by_source.items()}
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, payload: dict) -> dict | None:
+        entry = self.entries.get(payload_key(payload))
+        if entry is not None:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        if self.strict:
+            return None
+        fallback = self._fallback.get(payload.get("source") or "")
+        return next(fallback) if fallback else None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(await request.aread() or b"{}")
+        entry = self._lookup(payload)
+        if entry is None:
+            return httpx.Response(
+                404,
+                json={"message": "No recorded response for payload"},
+                request=request,
+            )
+
+        if self.latency_scale > 0:
+            await asyncio.sleep(entry["elapsed_ms"] / 1000 * self.latency_scale)
+
+        body = await asyncio.to_thread(self.store.load_body, entry["key"])
+        headers = {}
+        if entry.get("content_type"):
+            headers["content-type"] = entry["content_type"]
+        return httpx.Response(
+            entry["status_code"],
+            headers=headers,
+            content=body,
+            request=request,
+        )
+
+
+class ReplayAmazonScraper(OxylabsAmazonScraper):
+    """OxylabsAmazonScraper served from a recording directory."""
+
+    def __init__(self, directory: str | Path, latency_scale: float = 0.0, strict: bool = False):
+        self._init_oxylabs(
+            transport=ReplayTransport(directory, latency_scale, strict),
+            credentials=REPLAY_CREDENTIALS,
+        )
+
+
+class ReplayEbayScraper(OxylabsEbayScraper):
+    """OxylabsEbayScraper served from a recording directory."""
+
+    def __init__(self, directory: str | Path, latency_scale: float = 0.0, strict: bool = False):
+        self._init_oxylabs(
+            transport=ReplayTransport(directory, latency_scale, strict),
+            credentials=REPLAY_CREDENTIALS,
+        )
+        self.tiered_fetch = tiered_fetch_enabled()
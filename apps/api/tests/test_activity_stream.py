@@ -0,0 +1,346 @@
+"""Tests for the broadcast activity stream."""
+import asyncio
+import json
+import time
+
+import pytest
+
+from app.services import activity_stream, run_progress
+from app.services.activity_stream import (
+    ActivityStreamManager,
+    RunActivityStream,
+    StreamClosedError,
+    SubscriberLaggedError,
+    collapse_superseded,
+    get_activity_stream,
+)
+from app.services.parallel_runner import ActivityEvent
+
+
+def event(i: int, worker_id: int = 1, action: str = "fetching") -> ActivityEvent:
+    return ActivityEvent(id=str(i), timestamp="", worker_id=worker_id, phase="ebay", action=action)
+
+
+def test_every_subscriber_sees_every_event():
+    async def main():
+        stream = RunActivityStream("run", capacity=10)
+        first, second = stream.subscribe(), stream.subscribe()
+        for i in range(3):
+            stream.publish(event(i))
+        return await first.get(timeout=0.1), await second.get(timeout=0.1)
+
+    first, second = asyncio.run(main())
+
+    assert [e.id for _, e in first] == ["0", "1", "2"]
+    assert first == second
+    assert [seq for seq, _ in first] == [1, 2, 3]
+
+
+def test_waiting_subscribers_wake_on_publish_and_time_out_when_idle():
+    async def main():
+        stream = RunActivityStream("run")
+        readers = [stream.subscribe() for _ in range(5)]
+        waits = [asyncio.create_task(r.get(timeout=1.0)) for r in readers]
+        await asyncio.sleep(0)
+        stream.publish(event(1))
+        woken = await asyncio.gather(*waits)
+        idle = await readers[0].get(timeout=0.01)
+        return woken, idle
+
+    woken, idle = asyncio.run(main())
+
+    assert all(len(events) == 1 for events in woken)
+    assert idle == []
+
+
+def test_slow_subscriber_drops_oldest_without_affecting_others():
+    async def main():
+        stream = RunActivityStream("run", capacity=5)
+        slow, fast = stream.subscribe(), stream.subscribe()
+        received = []
+        for i in range(12):
+            stream.publish(event(i))
+            received += await fast.get(timeout=0)
+        return await slow.get(timeout=0), slow.dropped, received
+
+    slow_events, dropped, fast_events = asyncio.run(main())
+
+    assert [e.id for _, e in slow_events] == ["7", "8", "9", "10", "11"]
+    assert dropped == 7
+    assert len(fast_events) == 12
+
+
+def test_disconnect_policy_raises_when_lagging():
+    async def main():
+        stream = RunActivityStream("run", capacity=10)
+        subscriber = stream.subscribe(max_lag=3, policy="disconnect")
+        for i in range(5):
+            stream.publish(event(i))
+        await subscriber.get(timeout=0)
+
+    with pytest.raises(SubscriberLaggedError):
+        asyncio.run(main())
+
+
+def test_reconnect_resumes_after_last_event_id():
+    async def main():
+        stream = RunActivityStream("run", capacity=10)
+        first = stream.subscribe()
+        for i in range(3):
+            stream.publish(event(i))
+        seen = await first.get(timeout=0)
+        last_id = stream.event_id(seen[1][0])  # client got events 0 and 1
+        for i in range(3, 5):
+            stream.publish(event(i))
+        resumed = stream.subscribe(last_event_id=last_id)
+        return await resumed.get(timeout=0)
+
+    resumed = asyncio.run(main())
+
+    assert [e.id for _, e in resumed] == ["2", "3", "4"]
+
+
+def test_foreign_or_expired_event_ids():
+    async def main():
+        stream = RunActivityStream("run", capacity=3)
+        for i in range(6):
+            stream.publish(event(i))
+        # An id from another stream instance replays the whole window
+        fresh = stream.subscribe(last_event_id="abc-2")
+        # An id that has left the window follows the drop policy
+        stale = stream.subscribe(last_event_id=stream.event_id(1))
+        return await fresh.get(timeout=0), await stale.get(timeout=0), stale.dropped
+
+    fresh, stale, dropped = asyncio.run(main())
+
+    assert [e.id for _, e in fresh] == ["3", "4", "5"]
+    assert stale == fresh
+    assert dropped == 2
+
+
+def test_get_batch_collects_a_window_into_one_read():
+    async def main():
+        stream = RunActivityStream("run")
+        subscriber = stream.subscribe()
+
+        async def publish():
+            for i in range(30):
+                stream.publish(event(i))
+                await asyncio.sleep(0.001)
+
+        publisher = asyncio.create_task(publish())
+        frame = await subscriber.get_batch(0.5, timeout=1.0)
+        await publisher
+        return frame
+
+    frame = asyncio.run(main())
+
+    assert [e.id for _, e in frame] == [str(i) for i in range(30)]
+
+
+def test_collapse_keeps_only_each_workers_latest_fetching():
+    events = list(enumerate([
+        event(0, worker_id=1),
+        event(1, worker_id=2),
+        event(2, worker_id=1, action="found"),
+        event(3, worker_id=1),
+        event(4, worker_id=0, action="uploading"),
+        event(5, worker_id=0),
+    ]))
+
+    kept = [seq for seq, _ in collapse_superseded(events)]
+
+    assert kept == [1, 2, 3, 4, 5]
+
+
+def test_manager_publish_is_synchronous_and_shares_the_handle():
+    manager = get_activity_stream()
+    handle = manager.get_or_create("sync-run")
+    subscriber = manager.subscribe("sync-run")
+
+    # No running loop needed: publish is a plain call
+    manager.publish("sync-run", event(1))
+    handle.publish(event(2))
+    manager.cleanup("sync-run")
+
+    assert manager.get_or_create("sync-run") is not handle
+    assert [e.id for _, e in asyncio.run(subscriber.get(timeout=0))] == ["1", "2"]
+    manager.cleanup("sync-run")
+
+
+@pytest.fixture
+def manager():
+    manager = ActivityStreamManager()
+    # Streams left by other test modules (e.g. a paused run) would skew stats
+    for run_id in list(manager._streams):
+        manager.cleanup(run_id)
+    yield manager
+    for run_id in list(manager._streams):
+        manager.cleanup(run_id)
+
+
+def test_closed_stream_drains_then_raises():
+    async def main():
+        stream = RunActivityStream("run")
+        subscriber = stream.subscribe()
+        waiting = asyncio.create_task(subscriber.get(timeout=5.0))
+        await asyncio.sleep(0)
+        stream.publish(event(1))
+        stream.close()
+        first = await waiting
+        with pytest.raises(StreamClosedError):
+            await subscriber.get(timeout=5.0)
+        return first
+
+    started = time.monotonic()
+    first = asyncio.run(main())
+
+    assert [e.id for _, e in first] == ["1"]
+    assert time.monotonic() - started < 1.0
+
+
+def test_sweep_evicts_idle_streams(manager):
+    idle = manager.get_or_create("idle-run")
+    live = manager.get_or_create("live-run")
+    idle.publish(event(1))
+    idle.last_active -= activity_stream.ACTIVITY_STREAM_TTL_SECONDS + 1
+
+    evicted = manager.sweep()
+
+    assert evicted == 1
+    assert idle.closed and not live.closed
+    assert manager.get_or_create("live-run") is live
+    assert manager.stats()["streams"] == 1
+
+
+def test_caps_evict_least_recently_active_outside_grace(manager, monkeypatch):
+    monkeypatch.setattr(activity_stream, "ACTIVITY_MAX_STREAMS", 2)
+    oldest, older = manager.get_or_create("a"), manager.get_or_create("b")
+    oldest.last_active -= 300
+    older.last_active -= 200
+
+    manager.get_or_create("c")
+    assert oldest.closed and not older.closed
+
+    # Streams that published recently are never evicted to satisfy a cap
+    older.last_active = time.monotonic()
+    manager.get_or_create("d")
+    assert not older.closed
+    assert manager.stats()["streams"] == 3
+
+
+
+def test_quiet_live_run_is_not_evicted(manager, monkeypatch):
+    monkeypatch.setattr(activity_stream, "ACTIVITY_MAX_STREAMS", 1)
+    # The phase resolves its handle once and its workers are tracked
+    handle = manager.get_or_create("live-run")
+    run_progress.track("live-run", "org", {})
+    try:
+        # Waiting on a slow render / batch job: nothing published for a while
+        handle.last_active -= activity_stream.ACTIVITY_STREAM_TTL_SECONDS + 1
+        manager.get_or_create("other-run")
+        manager.sweep()
+        assert not handle.closed
+
+        async def main():
+            subscriber = manager.subscribe("live-run")
+            handle.publish(event(1))
+            return await subscriber.get(timeout=1.0)
+
+        received = asyncio.run(main())
+    finally:
+        run_progress.release("live-run")
+
+    assert [e.id for _, e in received] == ["1"]
+    # Once the workers stop, the stream is evictable again
+    handle.last_active -= activity_stream.ACTIVITY_STREAM_TTL_SECONDS + 1
+    manager.sweep()
+    assert handle.closed
+
+def test_stats_report_buffered_events_and_bytes(manager):
+    stream = manager.get_or_create("stats-run")
+    for i in range(100):
+        stream.publish(event(i))
+    stream.subscribe()
+
+    stats = manager.stats()
+
+    assert stats["buffered_events"] == 100
+    assert stats["subscribers"] == 1
+    assert stats["buffered_bytes"] == sum(len(event(i).encoded) for i in range(100))
+
+
+
+def test_sse_frames_reuse_the_encoded_events(manager):
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.routers.collection import stream_activity
+
+    service = MagicMock()
+    service.get_run = AsyncMock(return_value={"checkpoint": {"phase": "ebay"}})
+    stream = manager.get_or_create("sse-run")
+    published = [event(i) for i in range(3)]
+    for e in published:
+        stream.publish(e)
+
+    async def frames(batch_ms: int) -> list:
+        response = await stream_activity(
+            "sse-run", None, None, batch_ms=batch_ms, collapse=False,
+            user={"membership": {"org_id": "org"}}, service=service,
+        )
+        chunks = response.body_iterator
+        first = [await chunks.__anext__(), await chunks.__anext__()]
+        await chunks.aclose()
+        return first
+
+    single = asyncio.run(frames(0))[1]
+    batched = asyncio.run(frames(50))[1]
+
+    assert single == b"".join(
+        f"id: {stream.event_id(seq)}\ndata: ".encode() + e.encoded + b"\n\n"
+        for seq, e in enumerate(published, start=1)
+    )
+    assert batched == (
+        f"id: {stream.event_id(3)}\ndata: [".encode()
+        + b",".join(e.encoded for e in published)
+        + b"]\n\n"
+    )
+    assert json.loads(batched.split(b"data: ", 1)[1])[0]["id"] == "0"
+
+
+def test_sse_ends_for_finished_runs_without_creating_a_stream(manager):
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.routers.collection import stream_activity
+
+    service = MagicMock()
+    service.get_run = AsyncMock(return_value={"status": "running", "checkpoint": {}})
+    user = {"membership": {"org_id": "org"}}
+
+    async def main():
+        response = await stream_activity(
+            "ending-run", None, None,
+            batch_ms=0, collapse=False, user=user, service=service,
+        )
+        chunks = response.body_iterator
+        await chunks.__anext__()  # connected
+        reading = asyncio.create_task(chunks.__anext__())
+        await asyncio.sleep(0.01)
+        # Run completes: release_run() cleans up its stream
+        service.get_run.return_value = {"status": "completed", "checkpoint": {}}
+        manager.cleanup("ending-run")
+        released = [await reading, *[chunk async for chunk in chunks]]
+
+        # Reconnect after the run finished
+        response = await stream_activity(
+            "ending-run", "stale-1", None,
+            batch_ms=0, collapse=False, user=user, service=service,
+        )
+        reconnected = [chunk async for chunk in response.body_iterator]
+        return released, reconnected
+
+    released, reconnected = asyncio.run(main())
+
+    assert released == ["event: end\ndata: {}\n\n"]
+    assert reconnected == ["event: end\ndata: {}\n\n"]
+    assert manager.stats()["streams"] == 0
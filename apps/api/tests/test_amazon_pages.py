@@ -0,0 +1,40 @@
+"""Tests for merging multi-page Amazon best-seller results."""
+from app.services.scrapers import AmazonProduct, ScrapeResult, merge_pages
+
+
+def product(asin: str, position: int) -> AmazonProduct:
+    return AmazonProduct(
+        asin=asin,
+        title=f"Product {asin}",
+        price=9.99,
+        currency="USD",
+        rating=4.5,
+        url=f"/dp/{asin}",
+        position=position,
+    )
+
+
+def test_pages_are_merged_in_rank_order_regardless_of_completion_order():
+    page1 = ScrapeResult(products=[product("A", 1), product("B", 2)], page=1, total_pages=None)
+    page2 = ScrapeResult(products=[product("C", 1), product("D", 2)], page=2, total_pages=None)
+
+    merged = merge_pages([page2, page1])
+
+    assert [p.asin for p in merged] == ["A", "B", "C", "D"]
+    assert [p.position for p in merged] == [1, 2, 3, 4]
+
+
+def test_asin_repeated_on_a_later_page_keeps_its_first_slot():
+    page1 = ScrapeResult(products=[product("A", 1), product("B", 2)], page=1, total_pages=None)
+    # The list shifted between requests: B moved down onto page 2
+    page2 = ScrapeResult(products=[product("B", 51), product("C", 52)], page=2, total_pages=None)
+
+    merged = merge_pages([page1, page2])
+
+    assert [(p.asin, p.position) for p in merged] == [("A", 1), ("B", 2), ("C", 3)]
+
+
+def test_single_page_is_unchanged():
+    page = ScrapeResult(products=[product("A", 1), product("B", 2)], page=1, total_pages=None)
+
+    assert [(p.asin, p.position) for p in merge_pages([page])] == [("A", 1), ("B", 2)]
@@ -0,0 +1,198 @@
+"""Tests for the cross-process bus, using the local TCP broker."""
+import asyncio
+import json
+
+import pytest
+
+from app.services import run_signals
+from app.services.activity_stream import ACTIVITY_CHANNEL, get_activity_stream
+from app.services.bus import BusBroker, RemoteBus, TcpBus
+from app.services.parallel_runner import ActivityEvent
+from app.services.run_signals import SIGNAL_CHANNEL
+
+
+async def wait_until(condition, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.005)
+
+
+async def connected(*buses: TcpBus) -> None:
+    for bus in buses:
+        await bus.start()
+    await wait_until(lambda: all(bus.connected for bus in buses))
+
+
+def test_broker_relays_to_other_clients_only():
+    async def main():
+        broker = BusBroker(port=0)
+        await broker.start()
+        seen_a, seen_b = [], []
+        a = TcpBus(broker.url, handlers={"test": lambda k, p: seen_a.append((k, p))})
+        b = TcpBus(broker.url, handlers={"test": lambda k, p: seen_b.append((k, p))})
+        await connected(a, b)
+        await wait_until(lambda: len(broker.clients) == 2)
+        for i in range(500):
+            a.publish("test", "run", i)
+        await wait_until(lambda: len(seen_b) == 500)
+        stats = b.stats()
+        await a.close()
+        await b.close()
+        await broker.close()
+        return seen_a, seen_b, a.frames_sent, stats
+
+    seen_a, seen_b, frames, stats = asyncio.run(main())
+
+    assert seen_a == []
+    assert [p for _, p in seen_b] == list(range(500))
+    # Published back to back, so packed into far fewer frames than messages
+    assert frames < 50
+    assert stats["received"] == 500
+    assert stats["delivery_latency_ms"]["p99"] is not None
+
+
+def test_frames_respect_size_limit_and_drop_oversized_messages():
+    bus = TcpBus("tcp://127.0.0.1:1")
+    bus.max_frame_bytes = 500
+    for i in range(20):
+        bus.publish("test", "run", {"n": i, "pad": "x" * 50})
+    bus.publish("test", "run", "y" * 1000)
+
+    frames = [frame for frame, _ in bus._take_frames()]
+
+    assert all(len(frame) <= 500 for frame in frames)
+    assert [m["p"]["n"] for frame in frames for m in json.loads(frame)] == list(range(20))
+    assert len(frames) > 1
+    assert bus.dropped == 1
+
+
+def test_outbox_is_bounded():
+    bus = TcpBus("tcp://127.0.0.1:1", max_pending=3)
+    for i in range(5):
+        bus.publish("test", "run", i)
+
+    assert bus.stats()["pending"] == 3
+    assert bus.dropped == 2
+
+
+
+class FlakyBus(RemoteBus):
+    """In-memory backend whose connection drops on the second frame sent."""
+
+    backend = "flaky"
+    max_frame_bytes = 200
+
+    def __init__(self):
+        super().__init__(handlers={})
+        self.sent: list[bytes] = []
+        self.failed = False
+        self.pending_when_dropped: int | None = None
+
+    async def _connect(self) -> None:
+        pass
+
+    async def _send(self, frame: bytes) -> None:
+        if len(self.sent) == 1 and not self.failed:
+            self.failed = True
+            raise ConnectionError("connection reset")
+        self.sent.append(frame)
+
+    async def _disconnect(self) -> None:
+        if self.failed and self.pending_when_dropped is None:
+            self.pending_when_dropped = self.stats()["pending"]
+
+
+def test_frames_unsent_when_connection_drops_are_sent_after_reconnect(monkeypatch):
+    monkeypatch.setattr("app.services.bus.RECONNECT_DELAY_SECONDS", 0.01)
+
+    async def main():
+        bus = FlakyBus()
+        for i in range(20):
+            bus.publish("test", "run", {"n": i})
+        await bus.start()
+        await wait_until(lambda: bus.failed and bus.stats()["pending"] == 0)
+        await bus.close()
+        return bus
+
+    bus = asyncio.run(main())
+
+    messages = [m["p"]["n"] for frame in bus.sent for m in json.loads(frame)]
+    assert messages == list(range(20))
+    # The dropped frames were still counted as pending, not lost
+    assert 0 < bus.pending_when_dropped < 20
+    assert bus.dropped == 0
+    assert bus.frames_sent == len(bus.sent) > 2
+
+
+def test_remote_bus_requires_a_backend():
+    with pytest.raises(TypeError):
+        RemoteBus()
+
+
+def test_signals_and_activity_reach_another_process():
+    """Bus `a` stands in for another worker; `b` applies to this process's state."""
+
+    async def main():
+        broker = BusBroker(port=0)
+        await broker.start()
+        a = TcpBus(broker.url, handlers={})
+        b = TcpBus(broker.url)
+        await connected(a, b)
+        await wait_until(lambda: len(broker.clients) == 2)
+
+        a.publish(SIGNAL_CHANNEL, "remote-run", "pause")
+        a.publish(ACTIVITY_CHANNEL, "remote-run", ActivityEvent(
+            id="1", timestamp="", worker_id=1, phase="ebay", action="fetching",
+        ).encoded)
+        await wait_until(lambda: b.received == 2)
+        paused = run_signals.is_paused("remote-run")
+        events = await get_activity_stream().subscribe("remote-run").get(timeout=0)
+
+        a.publish(SIGNAL_CHANNEL, "remote-run", None)
+        a.publish(ACTIVITY_CHANNEL, "remote-run", None)
+        await wait_until(lambda: b.received == 4)
+        await a.close()
+        await b.close()
+        await broker.close()
+        return paused, events
+
+    paused, events = asyncio.run(main())
+
+    assert paused
+    assert [e.id for _, e in events] == ["1"]
+    assert not run_signals.is_paused_or_cancelled("remote-run")
+    assert "remote-run" not in get_activity_stream()._streams
+
+
+def test_reconnects_after_broker_restart():
+    async def main():
+        broker = BusBroker(port=0)
+        await broker.start()
+        port = broker.port
+        seen = []
+        a = TcpBus(broker.url, handlers={})
+        b = TcpBus(broker.url, handlers={"test": lambda k, p: seen.append(p)})
+        await connected(a, b)
+        await broker.close()
+        await wait_until(lambda: not a.connected and not b.connected)
+
+        broker = BusBroker(port=port)
+        await broker.start()
+        await wait_until(lambda: len(broker.clients) == 2, timeout=5.0)
+        a.publish("test", "run", "after restart")
+        await wait_until(lambda: seen == ["after restart"])
+        await a.close()
+        await b.close()
+        await broker.close()
+
+    asyncio.run(main())
+
+
+def test_unknown_backend_is_rejected():
+    from app.services.bus import create_bus
+
+    with pytest.raises(ValueError):
+        create_bus("kafka")
@@ -0,0 +1,48 @@
+"""Tests for eBay seller extraction against the saved page corpus."""
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services.scrapers.ebay_extract import EXTRACTOR_BACKENDS, extract_sellers
+
+CORPUS_DIR = Path(__file__).resolve().parent.parent / "benchmarks" / "corpus" / "ebay"
+CORPUS_PAGES = sorted(p.name[: -len(".html.gz")] for p in CORPUS_DIR.glob("*.html.gz"))
+
+
+@pytest.mark.parametrize("backend", EXTRACTOR_BACKENDS)
+@pytest.mark.parametrize("page", CORPUS_PAGES)
+def test_corpus_page_matches_ground_truth(page, backend):
+    with gzip.open(CORPUS_DIR / f"{page}.html.gz", "rt", encoding="utf-8") as f:
+        content = f.read()
+    expected = json.loads((CORPUS_DIR / f"{page}.json").read_text())
+
+    result = extract_sellers(content, backend=backend)
+
+    assert [(s.username, s.positive_percent) for s in result.sellers] == [
+        (s["username"], s["positive_percent"]) for s in expected["sellers"]
+    ]
+    assert result.has_more == expected["has_more"]
+
+
+@pytest.mark.parametrize("backend", EXTRACTOR_BACKENDS)
+def test_filters_and_dedupes_sellers(backend):
+    row = (
+        '<div class="s-card__attribute-row"><span>{name} </span>'
+        "<span>{pct}% positive (10)</span></div>"
+    )
+    content = (
+        '<ul class="srp-results">'
+        + row.format(name="goodseller", pct="99.1")
+        + row.format(name="goodseller", pct="50.0")
+        + row.format(name="watchlist", pct="98.0")
+        + row.format(name="two words", pct="97.0")
+        + "</ul>"
+    )
+
+    result = extract_sellers(content, backend=backend)
+
+    assert [(s.username, s.positive_percent) for s in result.sellers] == [("goodseller", 99.1)]
+    assert result.has_more is False
+    assert result.used_fallback is False
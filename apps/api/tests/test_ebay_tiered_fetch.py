@@ -0,0 +1,100 @@
+"""Tests for the tiered (unrendered first, render on fallback) eBay fetch."""
+import asyncio
+import gzip
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.services.run_metrics import RunMetrics
+from app.services.scrapers import OxylabsEbayScraper
+
+CORPUS_DIR = Path(__file__).resolve().parents[1] / "benchmarks" / "corpus" / "ebay"
+
+# Unrendered page where the seller rows are filled in by JavaScript
+SHELL_PAGE = (
+    '<html><body><ul class="srp-results srp-list">'
+    + '<li class="s-card s-card--horizontal"><div class="s-card__title">Item</div></li>' * 20
+    + '</ul><nav class="pagination"></nav></body></html>'
+)
+
+
+def load_page(name: str) -> str:
+    with gzip.open(CORPUS_DIR / f"{name}.html.gz", "rt", encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture(autouse=True)
+def oxylabs_env(monkeypatch):
+    monkeypatch.setenv("OXYLABS_USERNAME", "user")
+    monkeypatch.setenv("OXYLABS_PASSWORD", "pass")
+
+
+def run_search(plain_page: str | None, rendered_page: str, plain_status: int = 200):
+    """Search once; returns (result, rendered flags of the requests sent, metrics)."""
+    sent: list[bool] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        rendered = json.loads(request.content).get("render") == "html"
+        sent.append(rendered)
+        if not rendered and plain_status != 200:
+            return httpx.Response(plain_status)
+        content = rendered_page if rendered else plain_page
+        return httpx.Response(200, json={"results": [{"content": content}]})
+
+    scraper = OxylabsEbayScraper(transport=httpx.MockTransport(handle))
+    scraper.metrics = RunMetrics()
+    result = asyncio.run(scraper.search_sellers("usb cable", 10.0))
+    return result, sent, scraper.metrics.to_dict()
+
+
+def test_complete_unrendered_page_skips_render():
+    page = load_page("cards_page1")
+
+    result, sent, metrics = run_search(page, page)
+
+    assert sent == [False]
+    assert result.error is None and result.sellers and result.has_more
+    assert metrics["sources"]["ebay"]["tiers"] == {"plain": {"attempts": 1, "hits": 1}}
+    assert metrics["totals"]["renders_avoided"] == 1
+    assert metrics["totals"]["rendered"] == 0
+
+
+def test_no_results_page_is_accepted_unrendered():
+    page = load_page("no_results")
+
+    result, sent, _ = run_search(page, load_page("cards_page1"))
+
+    assert sent == [False]
+    assert result.error is None and result.sellers == []
+
+
+def test_incomplete_unrendered_page_escalates_to_render():
+    result, sent, metrics = run_search(SHELL_PAGE, load_page("cards_page1"))
+
+    assert sent == [False, True]
+    assert result.sellers
+    assert metrics["sources"]["ebay"]["tiers"] == {
+        "plain": {"attempts": 1, "hits": 0},
+        "render": {"attempts": 1, "hits": 1},
+    }
+    assert metrics["totals"]["renders_avoided"] == 0
+
+
+def test_rate_limited_unrendered_fetch_does_not_escalate():
+    result, sent, _ = run_search(None, load_page("cards_page1"), plain_status=429)
+
+    assert sent == [False]
+    assert result.error == "rate_limited"
+
+
+def test_tiered_fetch_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("EBAY_TIERED_FETCH", "0")
+    page = load_page("cards_page1")
+
+    result, sent, metrics = run_search(page, page)
+
+    assert sent == [True]
+    assert result.sellers
+    assert "plain" not in metrics["sources"]["ebay"]["tiers"]
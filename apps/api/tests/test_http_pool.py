@@ -0,0 +1,108 @@
+"""Tests for the shared pooled Oxylabs HTTP client.
+
+Runs a keep-alive HTTP/1.1 server on localhost so real connections are
+opened and reused.
+"""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services.run_metrics import RunMetrics
+from app.services.scrapers import OxylabsAmazonScraper
+from app.services.scrapers import http_pool
+
+
+class FakeOxylabsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps({
+            "results": [{"content": {"results": [
+                {"asin": f"ASIN-{payload['query']}", "title": "Product", "price": 9.99, "pos": 1}
+            ]}}]
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_oxylabs(monkeypatch):
+    monkeypatch.setenv("OXYLABS_USERNAME", "user")
+    monkeypatch.setenv("OXYLABS_PASSWORD", "pass")
+    monkeypatch.delenv("OXYLABS_RECORD_DIR", raising=False)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOxylabsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1/queries"
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_reuse_pooled_connection(local_oxylabs):
+    scraper = OxylabsAmazonScraper()
+    scraper.base_url = local_oxylabs
+    scraper.metrics = RunMetrics()
+    before = http_pool.pool_stats.to_dict()
+
+    async def run():
+        try:
+            for node_id in ("1", "2", "3"):
+                result = await scraper.fetch_bestsellers(node_id)
+                assert result.error is None
+            assert http_pool.get_shared_client() is http_pool.get_shared_client()
+        finally:
+            await http_pool.close_http_clients()
+
+    asyncio.run(run())
+
+    amazon = scraper.metrics.to_dict()["sources"]["amazon"]
+    assert amazon["new_connections"] == 1
+    assert amazon["reused_connections"] == 2
+    stats = http_pool.pool_stats.to_dict()
+    assert stats["requests"] - before["requests"] == 3
+    assert stats["new_connections"] - before["new_connections"] == 1
+
+
+def test_close_http_clients_closes_shared_client():
+    async def run():
+        client = http_pool.get_shared_client()
+        await http_pool.close_http_clients()
+        assert client.is_closed
+        # A new client is created on next use
+        replacement = http_pool.get_shared_client()
+        assert replacement is not client
+        await http_pool.close_http_clients()
+
+    asyncio.run(run())
+
+
+def test_client_from_previous_loop_is_closed_on_shutdown(local_oxylabs):
+    scraper = OxylabsAmazonScraper()
+    scraper.base_url = local_oxylabs
+
+    async def first_loop():
+        await scraper.fetch_bestsellers("1")
+        return http_pool.get_shared_client()
+
+    async def second_loop():
+        replacement = http_pool.get_shared_client()
+        assert http_pool.http_pool_stats()["open_clients"] == 2
+        await http_pool.close_http_clients()
+        return replacement
+
+    stale = asyncio.run(first_loop())
+    replacement = asyncio.run(second_loop())
+
+    assert replacement is not stale
+    assert stale.is_closed and replacement.is_closed
+    assert http_pool.http_pool_stats()["open_clients"] == 0
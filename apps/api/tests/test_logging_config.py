@@ -0,0 +1,82 @@
+"""Tests for the queue-based structured logging pipeline."""
+import asyncio
+import io
+import json
+import logging
+
+import pytest
+
+from app.logging_config import (
+    SamplingFilter,
+    bind_log_context,
+    configure_logging,
+    parse_logger_levels,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def log_output(monkeypatch):
+    monkeypatch.setenv("LOG_FORMAT", "json")
+    monkeypatch.setenv("LOG_LEVELS", "test.quiet=WARNING")
+    stream = io.StringIO()
+    configure_logging(stream=stream)
+
+    def lines() -> list[dict]:
+        shutdown_logging()  # flush the listener
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    yield lines
+    shutdown_logging()
+    logging.getLogger("test.quiet").setLevel(logging.NOTSET)
+
+
+def test_records_carry_worker_context_without_leaking(log_output):
+    logger = logging.getLogger("test.context")
+
+    async def worker(worker_id: int):
+        bind_log_context(run_id="run-1", worker_id=worker_id, phase="ebay")
+        logger.info(f"searching {worker_id}")
+
+    async def main():
+        await asyncio.gather(asyncio.create_task(worker(1)), asyncio.create_task(worker(2)))
+        logger.info("outside")
+
+    asyncio.run(main())
+    records = {r["message"]: r for r in log_output()}
+
+    assert records["searching 1"]["run_id"] == "run-1"
+    assert records["searching 1"]["worker_id"] == 1
+    assert records["searching 2"]["worker_id"] == 2
+    assert records["searching 2"]["phase"] == "ebay"
+    assert "worker_id" not in records["outside"]
+
+
+def test_per_logger_levels(log_output):
+    logging.getLogger("test.quiet").info("dropped")
+    logging.getLogger("test.quiet").warning("kept")
+
+    assert [r["message"] for r in log_output()] == ["kept"]
+
+
+def test_sampling_limits_info_per_call_site_but_not_warnings():
+    sampler = SamplingFilter(per_second=3)
+
+    def record(level: int, lineno: int) -> logging.LogRecord:
+        return logging.LogRecord("test", level, __file__, lineno, "msg", None, None)
+
+    info_kept = sum(sampler.filter(record(logging.INFO, 10)) for _ in range(10))
+    other_site_kept = sum(sampler.filter(record(logging.INFO, 11)) for _ in range(2))
+    warnings_kept = sum(sampler.filter(record(logging.WARNING, 12)) for _ in range(10))
+
+    assert info_kept == 3
+    assert other_site_kept == 2
+    assert warnings_kept == 10
+    assert sampler.suppressed_total == 7
+
+
+def test_parse_logger_levels():
+    assert parse_logger_levels("httpx=debug, app.services.scrapers=WARNING,bad") == {
+        "httpx": "DEBUG",
+        "app.services.scrapers": "WARNING",
+    }
@@ -0,0 +1,77 @@
+"""Tests for the mock scraper backends (SCRAPER_BACKEND=mock)."""
+import asyncio
+import random
+from collections import Counter
+
+import pytest
+
+from app.services.run_metrics import RunMetrics
+from app.services.scrapers import create_amazon_scraper, create_ebay_scraper
+from app.services.scrapers.mock import MockAmazonScraper, MockEbayScraper, MockProfile
+
+
+def test_generated_data_is_deterministic_per_seed():
+    async def fetch(seed: int):
+        scraper = MockAmazonScraper(MockProfile(seed=seed), products_per_page=5)
+        # Request order must not change the data
+        page2 = await scraper.fetch_bestsellers("123", page=2)
+        page1 = await scraper.fetch_bestsellers("123", page=1)
+        return page1, page2
+
+    first = asyncio.run(fetch(7))
+    again = asyncio.run(fetch(7))
+    other = asyncio.run(fetch(8))
+
+    assert first == again
+    assert [p.price for p in first[0].products] != [p.price for p in other[0].products]
+    # ASINs are unique across pages
+    asins = [p.asin for result in first for p in result.products]
+    assert len(set(asins)) == 10
+
+
+def test_fault_injection_rates_and_retry_after():
+    profile = MockProfile(
+        rate_limit_rate=0.2, retry_after=7, timeout_rate=0.1, server_error_rate=0.1, seed=3
+    )
+    scraper = MockEbayScraper(profile, pages=2)
+    scraper.metrics = RunMetrics()
+
+    async def run():
+        return [await scraper.search_sellers(f"q{i}", 10.0, 1) for i in range(2000)]
+
+    results = asyncio.run(run())
+    errors = Counter(result.error for result in results)
+
+    assert errors["rate_limited"] == pytest.approx(400, rel=0.2)
+    assert errors["timeout"] == pytest.approx(200, rel=0.25)
+    assert errors["http_error:503"] == pytest.approx(200, rel=0.25)
+    assert all(r.retry_after == 7 for r in results if r.error == "rate_limited")
+    assert all(r.has_more and len(r.sellers) == 20 for r in results if r.error is None)
+    assert scraper.metrics.to_dict()["sources"]["ebay"]["requests"] == 2000
+
+
+@pytest.mark.parametrize("dist", ["fixed", "uniform", "normal", "lognormal", "exponential"])
+def test_latency_distributions_keep_their_mean(dist):
+    profile = MockProfile(latency_ms=100, latency_dist=dist)
+    rng = random.Random(1)
+
+    samples = [profile.sample_latency_ms(rng) for _ in range(5000)]
+
+    assert min(samples) >= 0
+    assert sum(samples) / len(samples) == pytest.approx(100, rel=0.1)
+
+
+def test_factory_builds_mock_backend_from_env(monkeypatch):
+    monkeypatch.setenv("SCRAPER_BACKEND", "mock")
+    monkeypatch.setenv("MOCK_AMAZON_PRODUCTS_PER_PAGE", "3")
+    monkeypatch.setenv("MOCK_EBAY_CONCURRENCY", "12")
+    monkeypatch.setenv("MOCK_EBAY_LATENCY_DIST", "fixed")
+
+    amazon = create_amazon_scraper()
+    ebay = create_ebay_scraper()
+
+    assert isinstance(amazon, MockAmazonScraper)
+    assert len(asyncio.run(amazon.fetch_bestsellers("1")).products) == 3
+    assert isinstance(ebay, MockEbayScraper)
+    assert ebay.max_concurrency == 12
+    assert ebay.profile.latency_dist == "fixed"
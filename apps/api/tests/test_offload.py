@@ -0,0 +1,90 @@
+"""Tests for the CPU offload pools."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.models import ImportFormat
+from app.services.import_service import validate_import_file
+from app.services.offload import get_pool, offload, offload_stats, shutdown_pools
+
+
+@pytest.fixture(autouse=True)
+def fresh_pools():
+    shutdown_pools()
+    yield
+    shutdown_pools()
+
+
+def test_concurrency_limit_and_queue_depth(monkeypatch):
+    monkeypatch.setenv("OFFLOAD_PARSE_WORKERS", "2")
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return threading.current_thread().name
+
+    async def run():
+        return await asyncio.gather(*(offload("parse", work) for _ in range(6)))
+
+    names = asyncio.run(run())
+
+    assert peak == 2
+    assert all(name.startswith("offload-parse") for name in names)
+    stats = offload_stats()["parse"]
+    assert stats["workers"] == 2
+    assert stats["completed"] == 6
+    assert stats["max_queued"] >= 4
+    assert stats["queued"] == 0 and stats["running"] == 0
+
+
+def test_errors_propagate_and_are_counted():
+    def fail():
+        raise ValueError("bad file")
+
+    with pytest.raises(ValueError, match="bad file"):
+        asyncio.run(offload("hash", fail))
+
+    assert offload_stats()["hash"]["failed"] == 1
+
+
+def test_event_loop_stays_responsive():
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await offload("spreadsheet", time.sleep, 0.2)
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(run()) >= 5
+
+
+def test_import_pool_runs_in_a_process():
+    content = b"order_id,sale_date\nA1,2024-01-01\nA2,2024-01-02\n"
+
+    df, total_rows = asyncio.run(offload("import", validate_import_file, content, ImportFormat.CSV))
+
+    assert get_pool("import").kind == "process"
+    assert total_rows == 2
+    assert list(df["order_id"]) == ["A1", "A2"]
+
+
+def test_unknown_pool_rejected():
+    with pytest.raises(ValueError, match="Unknown offload pool"):
+        get_pool("nope")
@@ -0,0 +1,111 @@
+"""Tests for the Oxylabs push-pull batch backend.
+
+BatchStandIn is a local stand-in for the push-pull API served through
+httpx.MockTransport: jobs stay pending for a number of polls, then expose
+results in the same shape as the realtime endpoint.
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.services.run_metrics import RunMetrics
+from app.services.scrapers import OxylabsBatchAmazonScraper
+from app.services.scrapers.factory import create_amazon_scraper
+
+
+class BatchStandIn:
+    def __init__(self, polls_until_done: int = 2, faulted: set[str] | None = None):
+        self.polls_until_done = polls_until_done
+        self.faulted = faulted or set()
+        self.jobs: dict[str, dict] = {}
+        self.batch_sizes: list[int] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.rstrip("/").split("/")
+        if request.method == "POST" and path[-1] == "batch":
+            body = json.loads(request.content)
+            queries = []
+            for query in body["query"]:
+                job_id = f"job-{len(self.jobs) + 1}"
+                self.jobs[job_id] = {"query": query, "polls": 0}
+                queries.append({"id": job_id, "status": "pending"})
+            self.batch_sizes.append(len(queries))
+            return httpx.Response(202, json={"queries": queries})
+
+        if path[-1] == "results":
+            job = self.jobs[path[-2]]
+            return httpx.Response(200, json={"results": [{"content": {"results": [
+                {"asin": f"ASIN-{job['query']}", "title": "Product", "price": 9.99, "pos": 1}
+            ]}}]})
+
+        job = self.jobs[path[-1]]
+        job["polls"] += 1
+        if job["query"] in self.faulted:
+            status = "faulted"
+        else:
+            status = "done" if job["polls"] >= self.polls_until_done else "pending"
+        return httpx.Response(200, json={"id": path[-1], "status": status})
+
+
+@pytest.fixture(autouse=True)
+def oxylabs_env(monkeypatch):
+    monkeypatch.setenv("OXYLABS_USERNAME", "user")
+    monkeypatch.setenv("OXYLABS_PASSWORD", "pass")
+
+
+def make_scraper(stand_in: BatchStandIn) -> OxylabsBatchAmazonScraper:
+    scraper = OxylabsBatchAmazonScraper(transport=httpx.MockTransport(stand_in.handle))
+    scraper.poll_interval = 0.01
+    scraper.metrics = RunMetrics()
+    return scraper
+
+
+def test_concurrent_queries_are_coalesced_into_one_batch():
+    stand_in = BatchStandIn()
+    scraper = make_scraper(stand_in)
+
+    async def run():
+        return await asyncio.gather(
+            *(scraper.fetch_bestsellers(node_id) for node_id in ("1", "2", "3"))
+        )
+
+    results = asyncio.run(run())
+
+    assert [r.products[0].asin for r in results] == ["ASIN-1", "ASIN-2", "ASIN-3"]
+    assert stand_in.batch_sizes == [3]
+    assert scraper.metrics.to_dict()["sources"]["amazon"]["outcomes"] == {"ok": 3}
+
+
+def test_faulted_job_maps_to_http_error():
+    stand_in = BatchStandIn(faulted={"2"})
+    scraper = make_scraper(stand_in)
+
+    async def run():
+        return await asyncio.gather(scraper.fetch_bestsellers("1"), scraper.fetch_bestsellers("2"))
+
+    ok, faulted = asyncio.run(run())
+
+    assert ok.error is None
+    assert faulted.error == "http_error:502"
+
+
+def test_rejected_batch_is_reported_per_query():
+    def reject(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, json={"message": "Too many requests"})
+
+    scraper = OxylabsBatchAmazonScraper(transport=httpx.MockTransport(reject))
+
+    result = asyncio.run(scraper.fetch_bestsellers("1"))
+
+    assert result.error == "rate_limited"
+
+
+def test_factory_selects_batch_backend(monkeypatch):
+    monkeypatch.setenv("SCRAPER_BACKEND", "batch")
+
+    scraper = create_amazon_scraper()
+
+    assert isinstance(scraper, OxylabsBatchAmazonScraper)
+    assert scraper.max_concurrency > 6
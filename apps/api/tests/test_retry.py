@@ -0,0 +1,78 @@
+"""Tests for retry policies and per-source circuit breakers."""
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from app.services.retry import CircuitBreaker, RetryPolicy, parse_retry_after
+
+
+def test_backoff_grows_with_jitter_and_stops_at_max_attempts():
+    policy = RetryPolicy(rng=random.Random(1))
+
+    delays = [policy.next_delay("timeout", attempt) for attempt in (1, 2, 3)]
+
+    # timeout: 3 attempts, base 2s doubling, half fixed / half jittered
+    assert 1.0 <= delays[0] <= 2.0
+    assert 2.0 <= delays[1] <= 4.0
+    assert delays[2] is None
+
+
+def test_retry_after_wins_and_non_retryable_classes_stop():
+    policy = RetryPolicy()
+
+    assert policy.next_delay("rate_limited", 1, retry_after=12) == 12
+    assert policy.next_delay("rate_limited", 1, retry_after=600) == 60  # capped
+    assert policy.next_delay("http_4xx", 1) is None
+    assert policy.next_delay("error", 1) is None
+
+
+def test_parse_retry_after():
+    in_ten = datetime.now(timezone.utc) + timedelta(seconds=10)
+
+    assert parse_retry_after("7") == 7
+    assert 8 <= parse_retry_after(format_datetime(in_ten, usegmt=True)) <= 10
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_breaker_opens_after_consecutive_failures_and_closes_on_probe():
+    breaker = CircuitBreaker("ebay", failure_threshold=3, open_seconds=0.2)
+
+    assert not breaker.record("timeout")
+    assert not breaker.record("http_4xx")  # per-request errors reset the streak
+    assert not breaker.record("timeout")
+    assert not breaker.record("http_5xx")
+    assert breaker.record("timeout")
+    assert breaker.state == "open"
+
+    time.sleep(0.25)
+    assert breaker.state == "half_open"
+    breaker.record("ok")
+    assert breaker.state == "closed"
+
+
+def test_open_breaker_parks_workers_and_admits_one_probe():
+    breaker = CircuitBreaker("amazon", open_seconds=0.3)
+    breaker.record("rate_limited", retry_after=0.3)
+    admitted: list[float] = []
+
+    async def worker():
+        await breaker.wait_ready()
+        admitted.append(time.monotonic())
+
+    async def main():
+        started = time.monotonic()
+        workers = [asyncio.create_task(worker()) for _ in range(3)]
+        await asyncio.sleep(0.6)
+        # Only the probe got through; its success releases the rest
+        assert len(admitted) == 1
+        breaker.record("ok")
+        await asyncio.gather(*workers)
+        return started
+
+    started = asyncio.run(main())
+
+    assert len(admitted) == 3
+    assert min(admitted) - started >= 0.3
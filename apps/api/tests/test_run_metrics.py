@@ -0,0 +1,84 @@
+"""Tests for per-run scraping accounting."""
+
+from app.services.run_metrics import (
+    LATENCY_BUCKETS_MS,
+    RunMetrics,
+    classify_outcome,
+    outcome_for_status,
+)
+
+
+class TestOutcomeClassification:
+    """Test mapping of scraper errors and status codes to outcome buckets."""
+
+    def test_scraper_errors(self):
+        assert classify_outcome(None) == "ok"
+        assert classify_outcome("rate_limited") == "rate_limited"
+        assert classify_outcome("timeout") == "timeout"
+        assert classify_outcome("empty_response") == "empty"
+        assert classify_outcome("http_error:503") == "http_5xx"
+        assert classify_outcome("http_error:404") == "http_4xx"
+        assert classify_outcome("ConnectError: boom") == "error"
+
+    def test_status_codes(self):
+        assert outcome_for_status(200) == "ok"
+        assert outcome_for_status(429) == "rate_limited"
+        assert outcome_for_status(502) == "http_5xx"
+        assert outcome_for_status(401) == "http_4xx"
+
+
+class TestRunMetrics:
+    """Test recording, snapshot and resume merge."""
+
+    def test_request_counts_and_histogram(self):
+        metrics = RunMetrics()
+        metrics.record_request("ebay", "ok", 100, response_bytes=2048, rendered=True)
+        metrics.record_request("ebay", "rate_limited", 700)
+        metrics.record_request("ebay", "ok", 999999)
+
+        ebay = metrics.to_dict()["sources"]["ebay"]
+        assert ebay["requests"] == 3
+        assert ebay["outcomes"] == {"ok": 2, "rate_limited": 1}
+        assert ebay["response_bytes"] == 2048
+        assert ebay["rendered"] == 1
+        assert ebay["billable"] == 2
+        assert ebay["latency_histogram"][0] == 1  # <= 250ms
+        assert ebay["latency_histogram"][2] == 1  # <= 1000ms
+        assert ebay["latency_histogram"][len(LATENCY_BUCKETS_MS)] == 1  # overflow
+
+    def test_attempts_count_retries(self):
+        metrics = RunMetrics()
+        metrics.record_attempt("amazon", 1, "rate_limited")
+        metrics.record_attempt("amazon", 2, "ok")
+
+        amazon = metrics.to_dict()["sources"]["amazon"]
+        assert amazon["attempts"] == {"1": 1, "2": 1}
+        assert amazon["retries"] == 1
+
+    def test_cost_per_new_seller(self):
+        metrics = RunMetrics()
+        for _ in range(10):
+            metrics.record_request("ebay", "ok", 100, rendered=True)
+
+        totals = metrics.to_dict(sellers_new=5)["totals"]
+        assert totals["cost_cents"] > 0
+        assert totals["cost_per_new_seller_cents"] == round(totals["cost_cents"] / 5, 4)
+        assert metrics.to_dict(sellers_new=0)["totals"]["cost_per_new_seller_cents"] is None
+
+    def test_resume_merges_snapshot(self):
+        metrics = RunMetrics()
+        metrics.record_request("amazon", "ok", 100)
+        metrics.record_task("amazon", ok=True)
+        snapshot = metrics.to_dict()
+
+        resumed = RunMetrics.from_dict(snapshot)
+        resumed.record_request("amazon", "timeout", 30000)
+
+        amazon = resumed.to_dict()["sources"]["amazon"]
+        assert amazon["requests"] == 2
+        assert amazon["outcomes"] == {"ok": 1, "timeout": 1}
+        assert resumed.to_dict()["tasks"]["amazon"]["completed"] == 1
+
+    def test_from_dict_ignores_missing_or_unknown(self):
+        assert RunMetrics.from_dict(None).to_dict()["totals"]["requests"] == 0
+        assert RunMetrics.from_dict({"version": 99}).to_dict()["sources"] == {}
@@ -0,0 +1,88 @@
+"""Tests for in-memory run progress and the progress SSE stream."""
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+from app.routers.collection import stream_run_progress
+from app.services import run_progress
+from app.services.collection import CollectionService
+
+ORG_ID = "org-1"
+USER = {"membership": {"org_id": ORG_ID}}
+
+
+def progress_row(**overrides) -> dict:
+    row = {
+        "departments_total": 2,
+        "departments_completed": 0,
+        "categories_total": 4,
+        "categories_completed": 0,
+        "products_total": 40,
+        "products_searched": 0,
+        "sellers_found": 0,
+        "sellers_new": 0,
+        "worker_status": [],
+        "checkpoint": {"phase": "ebay_search"},
+        "started_at": None,
+        "status": "running",
+    }
+    return {**row, **overrides}
+
+
+def make_service(row: dict) -> tuple[CollectionService, MagicMock]:
+    supabase = MagicMock()
+    query = supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+    query.execute.return_value.data = [row]
+    return CollectionService(supabase), supabase
+
+
+def test_progress_is_served_from_memory_while_workers_run():
+    service, supabase = make_service(progress_row(products_searched=3))
+    progress = run_progress.track("run-mem", ORG_ID, progress_row())
+    progress.update(products_searched=7, sellers_found=12)
+
+    local = asyncio.run(service.get_enhanced_progress(ORG_ID, "run-mem"))
+    other_org = asyncio.run(service.get_enhanced_progress("org-2", "run-mem"))
+    assert supabase.table.call_count == 1  # only the other org's read
+    run_progress.release("run-mem")
+    released = asyncio.run(service.get_enhanced_progress(ORG_ID, "run-mem"))
+
+    assert local["products_searched"] == 7
+    assert local["sellers_found"] == 12
+    assert local["phase"] == "ebay"
+    assert other_org["products_searched"] == 3
+    assert released["products_searched"] == 3
+
+
+def test_stream_pushes_throttled_snapshots_and_ends_with_the_run():
+    service, _ = make_service(progress_row(products_searched=40, status="completed"))
+    progress = run_progress.track("run-sse", ORG_ID, progress_row())
+
+    async def main():
+        response = await stream_run_progress("run-sse", interval_ms=100, user=USER, service=service)
+        frames = []
+
+        async def read():
+            async for chunk in response.body_iterator:
+                frames.append(chunk)
+
+        reader = asyncio.create_task(read())
+        await asyncio.sleep(0.02)
+        # A burst of updates within one interval arrives as one snapshot
+        for searched in range(1, 21):
+            progress.update(products_searched=searched)
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.25)
+        run_progress.release("run-sse")
+        await asyncio.wait_for(reader, 2.0)
+        return frames
+
+    frames = asyncio.run(main())
+
+    data = [json.loads(f.split("data: ", 1)[1]) for f in frames if f.startswith("data: ")]
+    searched = [d.get("products_searched") for d in data if d]
+    assert searched[0] == 0
+    assert searched[-1] == 40  # final counters read back from collection_runs
+    assert 20 in searched
+    assert len(searched) <= 5
+    assert frames[-1].startswith("event: end")
@@ -0,0 +1,144 @@
+"""Tests for run signals: they interrupt in-flight worker awaits, and expire."""
+import asyncio
+import time
+
+import pytest
+
+from app.services import run_signals
+from app.services.collection import CollectionService
+from app.services.parallel_runner import CollectionPausedException, ParallelCollectionRunner
+from app.services.run_signals import RunSignal
+from app.services.scrapers.mock import MockEbayScraper
+from benchmarks.fakes import InMemorySupabase
+
+ORG_ID = "org-1"
+# Pause latency budget, from signal_run() to the workers having stopped
+MAX_PAUSE_LATENCY = 0.5
+
+
+async def wait_until(condition, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.005)
+
+
+class HangingEbay(MockEbayScraper):
+    """Page 1 answers at once; later pages hang like a slow upstream call."""
+
+    def __init__(self):
+        super().__init__(sellers_per_page=5, seller_pool_size=1_000_000, pages=3)
+        self.hanging = 0
+        self.aborted = 0
+
+    async def search_sellers(self, query, amazon_price, page=1):
+        if page == 1:
+            return await super().search_sellers(query, amazon_price, page)
+        self.hanging += 1
+        try:
+            await asyncio.sleep(90)
+        except asyncio.CancelledError:
+            self.aborted += 1
+            raise
+        return await super().search_sellers(query, amazon_price, page)
+
+
+def test_signal_interrupts_in_flight_awaits():
+    run_id = "run-interrupt"
+    started = []
+    abandoned = []
+
+    async def main():
+        runner = ParallelCollectionRunner(max_workers=3, run_id=run_id)
+
+        async def upstream_call():
+            try:
+                await asyncio.sleep(90)
+            except asyncio.CancelledError:
+                abandoned.append(True)
+                raise
+
+        async def process_task(task, worker_id):
+            started.append(task)
+            return await runner.interruptible(upstream_call(), "API call")
+
+        run = asyncio.create_task(runner.run([1, 2, 3], process_task))
+        await wait_until(lambda: len(started) == 3)
+        signaled_at = time.perf_counter()
+        await run_signals.signal_run(run_id, RunSignal.PAUSE)
+        with pytest.raises(CollectionPausedException):
+            await run
+        return time.perf_counter() - signaled_at
+
+    try:
+        latency = asyncio.run(main())
+    finally:
+        asyncio.run(run_signals.clear_signal(run_id))
+
+    assert latency < MAX_PAUSE_LATENCY
+    assert len(abandoned) == 3
+    assert run_signals.signal_stats()["listeners"] == 0
+
+
+def test_pause_mid_search_aborts_requests_and_keeps_found_sellers():
+    run_id = "run-pause"
+    db = InMemorySupabase()
+    db.seed("collection_runs", [{
+        "id": run_id,
+        "org_id": ORG_ID,
+        "status": "running",
+        "checkpoint": None,
+        "metrics": None,
+    }])
+    db.seed("collection_items", [
+        {
+            "run_id": run_id,
+            "item_type": "amazon_product",
+            "external_id": f"ASIN{i}",
+            "data": {"title": f"Product {i}", "price": 10.0, "category_id": "kitchen"},
+        }
+        for i in range(3)
+    ])
+    scraper = HangingEbay()
+    service = CollectionService(db, ebay_scraper=scraper)
+
+    async def main():
+        search = asyncio.create_task(service.run_ebay_seller_search(run_id, ORG_ID))
+        # Every product has its page 1 sellers and is waiting on page 2
+        await wait_until(lambda: scraper.hanging == 3)
+        signaled_at = time.perf_counter()
+        await run_signals.signal_run(run_id, RunSignal.PAUSE)
+        result = await search
+        return result, time.perf_counter() - signaled_at
+
+    try:
+        result, latency = asyncio.run(main())
+    finally:
+        asyncio.run(run_signals.clear_signal(run_id))
+
+    assert latency < MAX_PAUSE_LATENCY
+    assert result["status"] == "paused"
+    assert scraper.aborted == 3
+    # Page 1 sellers of every product were saved before the workers exited
+    sellers = db.rows["sellers"]
+    assert len(sellers) == result["sellers_new"] > 0
+    run = db.rows["collection_runs"][0]
+    assert run["sellers_found"] == result["sellers_found"] == 15
+    # Interrupted products are searched again on resume
+    assert run["products_searched"] == 0
+
+
+def test_sweep_signals_drops_expired_signals():
+    asyncio.run(run_signals.signal_run("stale-run", RunSignal.PAUSE))
+    asyncio.run(run_signals.signal_run("fresh-run", RunSignal.CANCEL))
+    run_signals._signal_times["stale-run"] -= run_signals.SIGNAL_TTL_SECONDS + 1
+
+    dropped = run_signals.sweep_signals()
+
+    assert dropped == 1
+    assert not run_signals.is_paused_or_cancelled("stale-run")
+    assert run_signals.is_cancelled("fresh-run")
+    asyncio.run(run_signals.clear_signal("fresh-run"))
+    assert run_signals.signal_stats()["signals"] == 0
@@ -0,0 +1,96 @@
+"""Tests for batch scraper methods (fetch_many / search_many) and BatchDispatcher."""
+import asyncio
+
+from app.services.scrapers import (
+    AmazonScraperService,
+    BatchDispatcher,
+    BestsellerRequest,
+    EbayScraperService,
+    EbaySearchResult,
+    ScrapeResult,
+    SellerSearchRequest,
+)
+
+
+class SlowAmazon(AmazonScraperService):
+    """Page N takes N * N * 10ms; tracks upstream calls and peak concurrency."""
+
+    max_concurrency = 2
+
+    def __init__(self):
+        self.calls: list[tuple[str, int]] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def fetch_bestsellers(self, category_node_id, page=1, category_name=None):
+        self.calls.append((category_node_id, page))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(page * page * 0.01)
+        finally:
+            self.in_flight -= 1
+        if category_node_id == "broken":
+            raise RuntimeError("parser exploded")
+        return ScrapeResult(products=[], page=page, total_pages=None)
+
+
+class EchoEbay(EbayScraperService):
+    async def search_sellers(self, query, amazon_price, page=1):
+        await asyncio.sleep(0.001)
+        return EbaySearchResult(sellers=[], page=page, has_more=False, url=query)
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+def test_fetch_many_yields_as_completed_within_concurrency():
+    scraper = SlowAmazon()
+    requests = [BestsellerRequest("1", page) for page in (3, 1, 2, 1)]
+
+    results = asyncio.run(collect(scraper.fetch_many(requests)))
+
+    # Fastest pages first; the duplicate page-1 request shares one call
+    assert [request.page for request, _ in results] == [1, 1, 2, 3]
+    assert all(result.page == request.page for request, result in results)
+    assert sorted(scraper.calls) == [("1", 1), ("1", 2), ("1", 3)]
+    assert scraper.peak == 2
+
+
+def test_fetch_many_turns_exceptions_into_error_results():
+    scraper = SlowAmazon()
+    requests = [BestsellerRequest("broken"), BestsellerRequest("1")]
+
+    results = dict(asyncio.run(collect(scraper.fetch_many(requests))))
+
+    assert results[BestsellerRequest("broken")].error == "parser exploded"
+    assert results[BestsellerRequest("1")].error is None
+
+
+def test_search_many_accepts_async_iterables():
+    async def requests():
+        for query in ("a", "b", "c"):
+            yield SellerSearchRequest(query, 10.0)
+
+    results = asyncio.run(collect(EchoEbay().search_many(requests())))
+
+    assert sorted(result.url for _, result in results) == ["a", "b", "c"]
+
+
+def test_dispatcher_routes_results_and_bounds_backend_concurrency():
+    scraper = SlowAmazon()
+
+    async def main():
+        async with BatchDispatcher(scraper.fetch_many) as batch:
+            # More submitters than the backend runs at once
+            return await asyncio.gather(*(
+                batch.submit(BestsellerRequest(str(node), page=1 + node % 3))
+                for node in range(8)
+            ))
+
+    results = asyncio.run(main())
+
+    assert [result.page for result in results] == [1 + node % 3 for node in range(8)]
+    assert len(scraper.calls) == 8
+    assert scraper.peak == 2
@@ -0,0 +1,126 @@
+"""Tests for the Oxylabs record-and-replay harness.
+
+Uses httpx.MockTransport as the "live" Oxylabs API so no network is needed.
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.services.run_metrics import RunMetrics
+from app.services.scrapers import (
+    OxylabsAmazonScraper,
+    ReplayAmazonScraper,
+    ReplayEbayScraper,
+)
+from app.services.scrapers.replay import RecordingTransport, ResponseStore
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def amazon_payload(node_id: str) -> dict:
+    return {
+        "results": [
+            {
+                "content": {
+                    "results": [
+                        {
+                            "asin": f"ASIN-{node_id}",
+                            "title": f"Product for {node_id}",
+                            "price": 19.99,
+                            "currency": "USD",
+                            "rating": 4.5,
+                            "url": f"/dp/ASIN-{node_id}",
+                            "pos": 1,
+                        }
+                    ]
+                }
+            }
+        ]
+    }
+
+
+def fake_oxylabs(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    return httpx.Response(200, json=amazon_payload(body["query"]))
+
+
+@pytest.fixture
+def oxylabs_env(monkeypatch):
+    monkeypatch.setenv("OXYLABS_USERNAME", "user")
+    monkeypatch.setenv("OXYLABS_PASSWORD", "pass")
+
+
+def record_categories(directory, node_ids: list[str]) -> None:
+    transport = RecordingTransport(httpx.MockTransport(fake_oxylabs), directory)
+    scraper = OxylabsAmazonScraper(transport=transport)
+
+    async def run():
+        for node_id in node_ids:
+            result = await scraper.fetch_bestsellers(node_id)
+            assert result.error is None
+
+    asyncio.run(run())
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+
+def test_recording_writes_index_and_bodies(tmp_path, oxylabs_env):
+    record_categories(tmp_path, ["111", "222"])
+
+    entries = ResponseStore(tmp_path).load_index()
+    assert len(entries) == 2
+    for key, entry in entries.items():
+        assert entry["source"] == "amazon_bestsellers"
+        assert entry["status_code"] == 200
+        assert (tmp_path / "bodies" / f"{key}.gz").exists()
+
+
+# =============================================================================
+# Replay
+# =============================================================================
+
+
+def test_replay_serves_recorded_payload(tmp_path, oxylabs_env):
+    record_categories(tmp_path, ["111", "222"])
+    scraper = ReplayAmazonScraper(tmp_path)
+    scraper.metrics = RunMetrics()
+
+    result = asyncio.run(scraper.fetch_bestsellers("222"))
+
+    assert result.error is None
+    assert [p.asin for p in result.products] == ["ASIN-222"]
+    assert scraper.transport.hits == 1
+    assert scraper.metrics.to_dict()["sources"]["amazon"]["outcomes"] == {"ok": 1}
+
+
+def test_replay_falls_back_round_robin_for_unrecorded(tmp_path, oxylabs_env):
+    record_categories(tmp_path, ["111"])
+    scraper = ReplayAmazonScraper(tmp_path)
+
+    result = asyncio.run(scraper.fetch_bestsellers("999"))
+
+    assert result.error is None
+    assert [p.asin for p in result.products] == ["ASIN-111"]
+    assert scraper.transport.misses == 1
+
+
+def test_strict_replay_returns_404_for_unrecorded(tmp_path, oxylabs_env):
+    record_categories(tmp_path, ["111"])
+    scraper = ReplayAmazonScraper(tmp_path, strict=True)
+
+    result = asyncio.run(scraper.fetch_bestsellers("999"))
+
+    assert result.error == "http_error:404"
+
+
+def test_replay_requires_recordings(tmp_path):
+    with pytest.raises(ValueError, match="No recorded"):
+        ReplayEbayScraper(tmp_path)
@@ -0,0 +1,377 @@
+"""Tests for the sync endpoints: batched, conditional (ETag) and bulk NDJSON requests."""
+import json
+import re
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth import get_current_user_with_membership
+from app.main import app
+from app.pagination import encode_cursor
+from app.routers import sync
+
+
+def make_record(account_id: str, n: int) -> dict:
+    return {
+        "id": f"{account_id}-rec-{n}",
+        "account_id": account_id,
+        "ebay_order_id": f"order-{n}",
+        "sale_date": "2024-01-01",
+        "item_name": f"Item {n}",
+        "qty": 1,
+        "sale_price_cents": 1000,
+        "status": "SUCCESSFUL",
+        "updated_at": f"2024-01-{n + 1:02d}T00:00:00+00:00",
+        "deleted_at": None,
+    }
+
+
+class FakeQuery:
+    """Just enough of the supabase query builder for the sync endpoints."""
+
+    def __init__(self, db: "FakeSupabase", table: str):
+        self.db = db
+        self.table = table
+        self.filters: dict = {}
+        self.in_filter: tuple[str, list] | None = None
+        self.row_limit: int | None = None
+        self.orderings: list[tuple[str, bool]] = []
+        self.count: str | None = None
+        self.before: tuple[str, str] | None = None  # keyset cursor (updated_at, id)
+
+    def select(self, columns="*", count=None):
+        self.count = count
+        return self
+
+    def order(self, column, desc=False):
+        self.orderings.append((column, desc))
+        return self
+
+    def is_(self, *args):
+        return self
+
+    def or_(self, condition):
+        match = re.fullmatch(r"updated_at\.lt\.(.+),and\(updated_at\.eq\.\1,id\.lt\.(.+)\)", condition)
+        self.before = (match.group(1), match.group(2))
+        return self
+
+    def gte(self, *args):
+        return self
+
+    def eq(self, column, value):
+        self.filters[column] = value
+        return self
+
+    def in_(self, column, values):
+        self.in_filter = (column, values)
+        return self
+
+    def limit(self, count):
+        self.row_limit = count
+        return self
+
+    def execute(self):
+        self.db.executes[self.table] += 1
+        if self.table in self.db.failing:
+            raise RuntimeError("database unavailable")
+        rows = [
+            r for r in self.db.rows.get(self.table, [])
+            if all(r.get(k) == v for k, v in self.filters.items())
+            and (self.in_filter is None or r.get(self.in_filter[0]) in self.in_filter[1])
+            and (self.before is None or (r["updated_at"], r["id"]) < self.before)
+        ]
+        for column, desc in reversed(self.orderings):
+            rows.sort(key=lambda r: r[column], reverse=desc)
+        total = len(rows)
+        if self.row_limit is not None:
+            rows = rows[: self.row_limit]
+        # Like Supabase, never more than max_rows rows per request
+        rows = rows[: self.db.max_rows]
+
+        class Result:
+            data = rows
+            count = total if self.count else None
+
+        return Result()
+
+
+# (table, scope prefix, scope column) of the change counter triggers
+SCOPE_TRIGGERS = re.findall(
+    r"\('(\w+)', '(\w+)', '(\w*)'\)",
+    (Path(__file__).parents[1] / "migrations" / "057_sync_change_counters.sql").read_text(),
+)
+
+
+class FakeWatermark:
+    """get_sync_watermark RPC; `db.versions` stands in for the counter triggers."""
+
+    def __init__(self, db: "FakeSupabase", scope: str):
+        self.db = db
+        self.scope = scope
+
+    def execute(self):
+        self.db.executes["get_sync_watermark"] += 1
+        versions = self.db.versions
+
+        class Result:
+            data = [{
+                "scope_version": versions[self.scope],
+                "access_version": versions["access:test-user-id"],
+            }]
+
+        return Result()
+
+
+class FakeSupabase:
+    def __init__(self, rows: dict[str, list[dict]]):
+        self.rows = rows
+        self.versions: Counter = Counter()
+        self.executes: Counter = Counter()
+        self.failing: set[str] = set()
+        self.max_rows = sync.SUPABASE_MAX_ROWS
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def update(self, table: str, row_id: str, **changes) -> None:
+        """Update a row and bump versions as migration 057's triggers do."""
+        row = next(r for r in self.rows[table] if r["id"] == row_id)
+        old = dict(row)
+        row.update(changes)
+        for trigger_table, prefix, column in SCOPE_TRIGGERS:
+            if trigger_table != table:
+                continue
+            if not column:
+                self.versions[prefix] += 1
+                continue
+            for value in {old.get(column), row.get(column)} - {None}:
+                self.versions[f"{prefix}:{value}"] += 1
+
+    def rpc(self, name: str, params: dict) -> FakeWatermark:
+        assert name == "get_sync_watermark"
+        return FakeWatermark(self, params["p_scope"])
+
+
+@pytest.fixture
+def db():
+    records = [make_record(account, n) for account in ("acc-1", "acc-2", "acc-3") for n in range(3)]
+    return FakeSupabase({
+        "accounts": [
+            {"id": f"acc-{n}", "account_code": f"A{n}", "updated_at": "2024-01-01T00:00:00+00:00"}
+            for n in (1, 2, 3)
+        ],
+        "bookkeeping_records": records,
+        "order_remarks": [{"record_id": "acc-2-rec-2", "content": "call buyer"}],
+        "service_remarks": [],
+    })
+
+
+@pytest.fixture
+def client(db):
+    app.dependency_overrides[get_current_user_with_membership] = lambda: {
+        "user_id": "test-user-id",
+        "token": "test-token",
+        "membership": {"role": "admin", "id": "test-membership-id", "org_id": "org-1"},
+        "permission_keys": ["order_tracking.read"],
+    }
+    with patch("app.routers.sync.get_supabase_for_user", return_value=db):
+        yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def read_lines(response) -> list[dict]:
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_streams_one_page_per_account_with_shared_remarks_lookup(client, db):
+    response = client.post("/sync/records/batch", json={
+        "accounts": [{"account_id": "acc-1"}, {"account_id": "acc-2"}],
+        "limit": 2,
+    })
+
+    assert response.status_code == 200
+    *pages, done = read_lines(response)
+    assert [p["account_id"] for p in pages] == ["acc-1", "acc-2"]
+    assert all(len(p["items"]) == 2 and p["has_more"] and p["next_cursor"] for p in pages)
+    assert pages[1]["items"][0]["order_remark"] == "call buyer"
+    assert done == {"done": True, "accounts": 2, "has_more": True}
+    # One page query per account, one lookup per remarks table for both
+    assert db.executes == Counter(bookkeeping_records=2, order_remarks=1, service_remarks=1)
+
+
+def test_all_accessible_accounts_when_none_listed(client, db):
+    response = client.post("/sync/records/batch", json={"limit": 5})
+
+    *pages, done = read_lines(response)
+    assert [p["account_id"] for p in pages] == ["acc-1", "acc-2", "acc-3"]
+    assert not any(p["has_more"] for p in pages)
+    assert done["has_more"] is False
+    assert db.executes["accounts"] == 1
+
+
+def test_invalid_cursor_is_rejected_before_streaming(client):
+    response = client.post("/sync/records/batch", json={
+        "accounts": [{"account_id": "acc-1", "cursor": "not-a-cursor"}],
+    })
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "INVALID_CURSOR"
+
+
+def test_failed_group_is_reported_per_account(client, db):
+    db.failing.add("bookkeeping_records")
+    cursor = encode_cursor(datetime(2024, 1, 2), "acc-1-rec-1")
+
+    response = client.post("/sync/records/batch", json={
+        "accounts": [{"account_id": "acc-1", "cursor": cursor}],
+    })
+
+    lines = read_lines(response)
+    assert lines[0] == {"account_id": "acc-1", "error": "Failed to fetch records"}
+    assert lines[-1]["done"] is True
+
+
+# =============================================================================
+# Conditional requests (change counter ETags)
+# =============================================================================
+
+
+def test_unchanged_records_answer_304_without_running_the_page_query(client, db):
+    first = client.get("/sync/records", params={"account_id": "acc-1"})
+    etag = first.headers["etag"]
+    db.executes.clear()
+
+    second = client.get(
+        "/sync/records", params={"account_id": "acc-1"}, headers={"If-None-Match": etag}
+    )
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert etag.startswith('W/"')
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    # Only the watermark lookup: no page query, no remarks lookups
+    assert db.executes == Counter(get_sync_watermark=1)
+
+
+def test_etag_changes_with_scope_and_access_versions_and_request_parameters(client, db):
+    def etag(**params):
+        response = client.get("/sync/records", params={"account_id": "acc-1", **params})
+        return response.headers["etag"]
+
+    original = etag()
+    assert etag() == original
+    assert etag(limit=2) != original
+    assert etag(account_id="acc-2") != original
+
+    # Any write in the account bumps its scope version
+    db.versions["bookkeeping_records:acc-1"] += 1
+    updated = etag()
+    assert updated != original
+    db.versions["bookkeeping_records:acc-2"] += 1
+    assert etag() == updated
+
+    # An assignment change alters what the user sees without touching the
+    # records themselves
+    db.versions["access:test-user-id"] += 1
+    assert etag() != updated
+
+
+def test_client_reassignment_changes_the_records_etag(client, db):
+    db.rows["accounts"][0]["client_user_id"] = "other-client"
+
+    def etag():
+        response = client.get("/sync/records", params={"account_id": "acc-1"})
+        return response.headers["etag"]
+
+    unassigned = etag()
+    # The account is given to this user as its client...
+    db.update("accounts", "acc-1", client_user_id="test-user-id")
+    assigned = etag()
+    # ...and taken away again
+    db.update("accounts", "acc-1", client_user_id="other-client")
+
+    assert assigned != unassigned
+    assert etag() not in (assigned, unassigned)
+
+
+@pytest.mark.parametrize("path", ["/sync/accounts", "/sync/sellers"])
+def test_accounts_and_sellers_answer_304(client, db, path):
+    db.rows["sellers"] = [{
+        "id": "seller-1",
+        "display_name": "Seller",
+        "normalized_name": "seller",
+        "platform": "ebay",
+        "times_seen": 1,
+        "updated_at": "2024-01-01T00:00:00+00:00",
+    }]
+    etag = client.get(path).headers["etag"]
+
+    response = client.get(path, headers={"If-None-Match": f'"other", {etag}'})
+    # One account assignment swapped for another: same rows elsewhere, but
+    # the user's access version moved
+    db.versions["access:test-user-id"] += 1
+    swapped = client.get(path, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert swapped.status_code == 200
+    assert swapped.headers["etag"] != etag
+
+
+# =============================================================================
+# Bulk sync (NDJSON)
+# =============================================================================
+
+
+def test_bulk_streams_every_item_with_resumable_checkpoints(client, db, monkeypatch):
+    monkeypatch.setattr(sync, "SYNC_BULK_PAGE_SIZE", 2)
+    db.rows["order_remarks"] = [{"record_id": "acc-1-rec-0", "content": "call buyer"}]
+
+    response = client.get("/sync/records/bulk", params={"account_id": "acc-1"})
+
+    lines = read_lines(response)
+    assert [line.get("id") for line in lines[:2]] == ["acc-1-rec-2", "acc-1-rec-1"]
+    checkpoint = lines[2]
+    assert checkpoint["synced"] == 2
+    assert lines[3]["id"] == "acc-1-rec-0"
+    assert lines[3]["order_remark"] == "call buyer"
+    assert lines[4] == {"done": True, "synced": 3}
+
+    # An interrupted sync resumes after the last checkpoint it received
+    resumed = read_lines(client.get(
+        "/sync/records/bulk",
+        params={"account_id": "acc-1", "cursor": checkpoint["checkpoint"]},
+    ))
+    assert [line.get("id") for line in resumed] == ["acc-1-rec-0", None]
+    assert resumed[-1]["done"] is True
+
+
+def test_bulk_pages_fit_under_the_row_cap(client, db):
+    db.rows["bookkeeping_records"] = [
+        {**make_record("acc-big", 0), "id": f"acc-big-rec-{n:05d}"}
+        for n in range(2500)
+    ]
+
+    response = client.get("/sync/records/bulk", params={"account_id": "acc-big"})
+    lines = read_lines(response)
+
+    ids = [line["id"] for line in lines if "id" in line]
+    checkpoints = [line for line in lines if "checkpoint" in line]
+    assert len(ids) == len(set(ids)) == 2500
+    page_size = sync.SYNC_BULK_PAGE_SIZE
+    assert [c["synced"] for c in checkpoints] == [page_size, 2 * page_size]
+    assert lines[-1] == {"done": True, "synced": 2500}
+
+
+def test_bulk_rejects_invalid_cursor_and_reports_failed_pages(client, db):
+    invalid = client.get("/sync/sellers/bulk", params={"cursor": "not-a-cursor"})
+    db.failing.add("accounts")
+    failed = read_lines(client.get("/sync/accounts/bulk"))
+
+    assert invalid.status_code == 400
+    assert failed == [{"error": "Failed to fetch page", "checkpoint": None}]
@@ -227,28 +227,40 @@ export function ProgressDetailModal({
         const { data: { session } } = await supabase.auth.getSession();
         if (!session || !mounted) return;
 
-        const url = `${API_BASE}/collection/runs/${runId}/activity?token=${session.access_token}`;
+        // batch_ms: events arrive as one JSON-array frame per 250ms window
+        const url = `${API_BASE}/collection/runs/${runId}/activity?token=${session.access_token}&batch_ms=250`;
         eventSource = new EventSource(url);
 
         eventSource.onmessage = (event) => {
           if (!mounted) return;
           try {
-            const activity = JSON.parse(event.data) as ActivityEntry;
-            if (activity.action === "connected") {
+            const data = JSON.parse(event.data) as ActivityEntry | ActivityEntry[];
+            const batch = Array.isArray(data) ? data : [data];
+            if (batch.length === 1 && batch[0].action === "connected") {
               console.log("SSE activity stream connected");
               return;
             }
 
             // Add to activities (newest first)
-            setActivities((prev) => [activity, ...prev].slice(0, 100));
+            setActivities((prev) => [...batch].reverse().concat(prev).slice(0, 100));
 
             // Update metrics
-            updateMetrics(activity);
+            batch.forEach(updateMetrics);
+
+            // eBay phase complete is the end of the run
+            if (batch.some((a) => a.action === "complete" && a.phase === "ebay")) {
+              eventSource?.close();
+            }
           } catch (e) {
             console.error("Failed to parse activity:", e);
           }
         };
 
+        // Run finished: the server sends no more events, stop reconnecting
+        eventSource.addEventListener("end", () => {
+          eventSource?.close();
+        });
+
         eventSource.onerror = () => {
           console.log("SSE connection error, auto-reconnecting...");
         };
@@ -1,7 +1,7 @@
 "use client";
 
-import { useQuery } from "@tanstack/react-query";
-import { useState, useCallback } from "react";
+import { useQuery, useQueryClient } from "@tanstack/react-query";
+import { useState, useCallback, useEffect, useRef } from "react";
 import { queryKeys } from "@/lib/query-keys";
 import { getAccessToken } from "@/lib/api";
 
@@ -45,7 +45,10 @@ interface CollectionRun {
 }
 
 export function useCollectionPolling(pollingInterval = 500) {
+  const queryClient = useQueryClient();
   const [newSellerIds, setNewSellerIds] = useState<Set<string>>(new Set());
+  // True while the progress SSE stream is open (replaces progress polling)
+  const [progressStreaming, setProgressStreaming] = useState(false);
 
   // Query for active run - polls continuously to detect new runs
   const {
@@ -78,7 +81,13 @@ export function useCollectionPolling(pollingInterval = 500) {
     staleTime: 0,
   });
 
-  // Query for progress (only runs when activeRun exists and is active)
+  const activeRunId = activeRun?.id;
+  const isActive = !!activeRun && (activeRun.status === "running" || activeRun.status === "paused");
+  const activeStatusRef = useRef(activeRun?.status);
+  activeStatusRef.current = activeRun?.status;
+
+  // Query for progress (only runs when activeRun exists and is active).
+  // Polls only as a fallback while the pushed progress stream is not connected.
   const {
     data: progress,
   } = useQuery({
@@ -109,13 +118,65 @@ export function useCollectionPolling(pollingInterval = 500) {
         products_found: data.products_found ?? 0,
       };
     },
-    enabled: !!activeRun && (activeRun.status === "running" || activeRun.status === "paused"),
-    refetchInterval: pollingInterval,
+    enabled: isActive,
+    refetchInterval: progressStreaming ? false : pollingInterval,
     refetchIntervalInBackground: false,
     retry: false,
     staleTime: 0,
   });
 
+  // Pushed progress: the server sends a snapshot whenever counters change
+  // (throttled), straight from the running workers' in-memory counters
+  useEffect(() => {
+    if (!activeRunId || !isActive) return;
+
+    let eventSource: EventSource | null = null;
+    let mounted = true;
+
+    const connect = async () => {
+      const token = await getAccessToken();
+      if (!token || !mounted) return;
+
+      eventSource = new EventSource(
+        `${API_BASE}/collection/runs/${activeRunId}/progress/stream?token=${token}`
+      );
+
+      eventSource.onopen = () => setProgressStreaming(true);
+
+      eventSource.onmessage = (event) => {
+        try {
+          const data = JSON.parse(event.data);
+          queryClient.setQueryData(queryKeys.collection.runs.progress(activeRunId), {
+            ...data,
+            run_id: activeRunId,
+            status: activeStatusRef.current ?? "running",
+            phase: data.phase || "amazon",
+            products_found: data.products_found ?? 0,
+          });
+        } catch (e) {
+          console.error("Failed to parse progress:", e);
+        }
+      };
+
+      // Run finished: stop streaming and let the active-run query notice
+      eventSource.addEventListener("end", () => {
+        eventSource?.close();
+        setProgressStreaming(false);
+      });
+
+      // EventSource reconnects by itself; poll until it does
+      eventSource.onerror = () => setProgressStreaming(false);
+    };
+
+    connect();
+
+    return () => {
+      mounted = false;
+      eventSource?.close();
+      setProgressStreaming(false);
+    };
+  }, [activeRunId, isActive, queryClient]);
+
   // Track new sellers added during this session
   const addNewSellerId = useCallback((id: string) => {
     setNewSellerIds((prev) => new Set([...prev, id]));